@@ -0,0 +1,255 @@
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Small thread-safe LRU map with hit / miss / eviction counters."""
+
+    def __init__(self, max_items: int = 1024):
+        self.max_items = max(1, int(max_items))
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "items": len(self._data),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class DiskCache:
+    """
+    Persistent key -> JSON value store in one SQLite file, shared safely between processes.
+
+    Entries may carry a TTL; expired entries read as misses. When the stored values grow
+    past max_bytes the least recently read entries are evicted (expired ones first).
+
+    Each instance keeps a running total of the stored bytes so a put costs one primary-key
+    lookup, not a full SUM(size) scan. Other processes writing the same file make that
+    total drift, so it is re-read from the table whenever it crosses max_bytes.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL, expires REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return default
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any, ttl: float = None):
+        payload = json.dumps(value)
+        now = time.time()
+        expires = now + ttl if ttl else None
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed, expires) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now, expires),
+            )
+            self._total += len(payload) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        # resync the running total: other processes share the file
+        total = self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # drop least recently read entries until back under 90% of the budget
+        target = total - int(self.max_bytes * 0.9)
+        freed, doomed = 0, []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            doomed.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self._total = total - freed
+        self.evictions += len(doomed)
+
+    def pop(self, key: str):
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total -= old[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._total = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT expires FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            items, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            "items": items,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class TieredCache:
+    """
+    Bounded in-memory LRU in front of an optional size-capped DiskCache.
+
+    Both tiers hold the same {"value", "created", "expires_at"} envelope, so an entry
+    expires at the same moment whichever tier serves it, and a disk hit is promoted to
+    memory. Values are deep-copied on the way in and out: callers are free to edit what
+    they get back. Subclasses add key derivation and their own counters on top.
+    """
+
+    label = "Cache"  # used in log messages
+
+    def __init__(self, path: str = None, max_memory_items: int = 1024, max_disk_bytes: int = 100 * 1024 * 1024,
+                 ttl: float = None):
+        """
+        Args:
+            path: SQLite file for the disk tier; None keeps the cache in memory only
+            ttl: Default seconds an entry lives (None = until evicted)
+        """
+        self.ttl = ttl
+        self._memory = LRUCache(max_memory_items)
+        self._disk: Optional[DiskCache] = None
+        if path is not None:
+            try:
+                self._disk = DiskCache(path, max_bytes=max_disk_bytes)
+            except Exception:
+                logger.warning("%s at %s unavailable; using memory only", self.label, path, exc_info=True)
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Live envelope {"value", "created", "expires_at"} for key, or None"""
+        entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            try:
+                entry = self._disk.get(key)
+            except Exception:
+                logger.warning("%s read failed", self.label, exc_info=True)
+            if entry is not None:
+                self._memory.put(key, entry)
+        # anything not in the envelope layout was written by an older version
+        if not isinstance(entry, dict) or "value" not in entry:
+            return None
+        if entry["expires_at"] is not None and entry["expires_at"] <= time.time():
+            self._memory.pop(key)
+            return None
+        return dict(entry, value=copy.deepcopy(entry["value"]))
+
+    def get(self, key: str) -> Any:
+        entry = self.get_entry(key)
+        return entry["value"] if entry is not None else None
+
+    def put(self, key: str, value: Any, ttl: float = None):
+        """Store value in both tiers; ttl overrides the cache's default lifetime"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        entry = {"value": copy.deepcopy(value), "created": now, "expires_at": now + ttl if ttl is not None else None}
+        self._memory.put(key, entry)
+        if self._disk is not None:
+            try:
+                self._disk.put(key, entry, ttl=ttl)
+            except Exception:
+                logger.warning("%s write failed", self.label, exc_info=True)
+
+    def pop(self, key: str):
+        self._memory.pop(key)
+        if self._disk is not None:
+            try:
+                self._disk.pop(key)
+            except Exception:
+                logger.warning("%s delete failed", self.label, exc_info=True)
+
+    def clear(self):
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def tier_stats(self) -> Dict[str, Any]:
+        return {
+            "memory": self._memory.stats(),
+            "disk": self._disk.stats() if self._disk is not None else None,
+        }
@@ -0,0 +1,288 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from config.settings import NLP_CONFIG, CANDIDATE_INDEX_CONFIG
+from backend.model_registry import get_embeddings_model
+from backend.embedding_cache import encode_normalized
+from backend.skill_normalizer import SkillNormalizer
+from backend.template_index import get_template_index
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateIndex:
+    """
+    Persistent skill index over a corpus of parsed resumes, for job -> candidate search.
+
+    Every resume is stored as its normalized skill list (SkillNormalizer.normalize_skills_list
+    output) and one dense vector (mean of its skill embeddings). Queries first pull candidates
+    from per-skill posting lists, then re-rank them with one vectorized similarity pass.
+
+    On disk the index is append-only, so adding resumes never rewrites existing data:
+        resumes.jsonl   one {"id", "skills", "metadata"} record per added resume
+        embeddings.f32  raw float32 rows, one per record, memory-mapped on load
+        meta.json       embedding dimension and model name
+    Re-adding an existing id appends a new record and retires the old row.
+    Vectors are appended and fsynced before their records; on load both files are trimmed
+    back to the rows they hold in full, so an interrupted write cannot misalign them.
+    """
+
+    def __init__(self, index_dir: str = None, embeddings_model_name: str = None):
+        self.index_dir = Path(index_dir or CANDIDATE_INDEX_CONFIG["index_dir"])
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._embeddings_model_name = embeddings_model_name or NLP_CONFIG["embeddings_model"]
+        self._records_path = self.index_dir / "resumes.jsonl"
+        self._vectors_path = self.index_dir / "embeddings.f32"
+        self._meta_path = self.index_dir / "meta.json"
+        self._normalizer = SkillNormalizer()
+        self._lock = threading.Lock()
+
+        self._ids: List[str] = []
+        self._skills: List[List[str]] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._alive: List[bool] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._posting_arrays: Dict[str, np.ndarray] = {}
+        self._vectors = None
+        self.dim = 0
+        self._load()
+
+    def _load(self):
+        if self._meta_path.exists():
+            self.dim = json.loads(self._meta_path.read_text()).get("dim", 0)
+        records, ends = [], []
+        if self._records_path.exists():
+            offset = 0
+            with open(self._records_path, "rb") as fh:
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        break  # torn final write
+                    offset += len(line)
+                    if line.strip():
+                        records.append(json.loads(line))
+                        ends.append(offset)
+        n = self._align(len(records), ends[-1] if ends else 0)
+        if n < len(records):
+            ends = ends[:n]
+            records = records[:n]
+            self._truncate(self._records_path, ends[-1] if ends else 0)
+        for rec in records:
+            self._add_record(rec["id"], rec["skills"], rec.get("metadata") or {})
+        self._remap()
+        logger.info("Candidate index at %s: %d resumes", self.index_dir, len(self))
+
+    def _align(self, n_records: int, records_bytes: int) -> int:
+        """
+        Number of rows both files hold in full, truncating the torn tail of either file.
+        A crash between the two appends of add_resumes leaves one of them ahead.
+        """
+        if self._records_path.exists() and self._records_path.stat().st_size > records_bytes:
+            self._truncate(self._records_path, records_bytes)
+        if not (self.dim and self._vectors_path.exists()):
+            return n_records
+        n = min(n_records, self._vectors_path.stat().st_size // (self.dim * 4))
+        if self._vectors_path.stat().st_size > n * self.dim * 4:
+            self._truncate(self._vectors_path, n * self.dim * 4)
+        return n
+
+    def _truncate(self, path: Path, size: int):
+        logger.warning("Candidate index %s: truncating %s to %d bytes after an interrupted write",
+                       self.index_dir, path.name, size)
+        with open(path, "r+b") as fh:
+            fh.truncate(size)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def _remap(self):
+        n = len(self._ids)
+        self._vectors = None
+        if not (self.dim and n and self._vectors_path.exists()):
+            return
+        if self._vectors_path.stat().st_size < n * self.dim * 4:
+            logger.warning("Candidate index %s: embeddings file is short; ranking by skill overlap only", self.index_dir)
+            return
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(n, self.dim))
+
+    def _add_record(self, resume_id: str, skills: List[str], metadata: Dict[str, Any]) -> int:
+        row = len(self._ids)
+        old = self._row_by_id.get(resume_id)
+        if old is not None:
+            self._alive[old] = False
+        self._ids.append(resume_id)
+        self._skills.append(skills)
+        self._metadata.append(metadata)
+        self._alive.append(True)
+        self._row_by_id[resume_id] = row
+        for key in {s.lower() for s in skills}:
+            self._postings.setdefault(key, []).append(row)
+        return row
+
+    def _skill_vectors(self, skill_lists: List[List[str]]) -> np.ndarray:
+        """Mean of L2-normalized skill embeddings per list (zeros without an embeddings model)"""
+        model = get_embeddings_model(self._embeddings_model_name)
+        if model is None:
+            return np.zeros((len(skill_lists), self.dim), dtype=np.float32)
+        vocab = list(dict.fromkeys(s.lower() for skills in skill_lists for s in skills))
+        if not vocab:
+            return np.zeros((len(skill_lists), self.dim), dtype=np.float32)
+        emb = encode_normalized(model, vocab, self._embeddings_model_name)
+        pos = {s: i for i, s in enumerate(vocab)}
+        out = np.zeros((len(skill_lists), emb.shape[1]), dtype=np.float32)
+        for r, skills in enumerate(skill_lists):
+            if skills:
+                out[r] = emb[[pos[s.lower()] for s in skills]].mean(axis=0)
+        return out / (np.linalg.norm(out, axis=1, keepdims=True) + 1e-10)
+
+    def add_resumes(self, items: Iterable[Tuple[str, List[str], Dict[str, Any]]], normalize: bool = False) -> int:
+        """
+        Add (or replace) resumes incrementally
+
+        Args:
+            items: (resume_id, skills, metadata) tuples; metadata may be None
+            normalize: Run skills through SkillNormalizer first (skip if already normalized)
+
+        Returns:
+            Number of resumes written
+        """
+        batch = []
+        for resume_id, skills, metadata in items:
+            skills = list(skills or [])
+            if normalize:
+                skills = self._normalizer.normalize_skills_list(skills)
+            batch.append((str(resume_id), skills, metadata or {}))
+        if not batch:
+            return 0
+
+        vectors = self._skill_vectors([skills for _, skills, _ in batch])
+        with self._lock:
+            if not self.dim and vectors.shape[1]:
+                if self._ids:
+                    # rows indexed before a model was available get zero vectors
+                    with open(self._vectors_path, "wb") as fh:
+                        fh.write(np.zeros((len(self._ids), vectors.shape[1]), dtype=np.float32).tobytes())
+                        fh.flush()
+                        os.fsync(fh.fileno())
+                self.dim = vectors.shape[1]
+                self._meta_path.write_text(json.dumps({"dim": self.dim, "model": self._embeddings_model_name}))
+            if vectors.shape[1] != self.dim:
+                # model unavailable now but the index was built with one: keep rows aligned
+                vectors = np.zeros((len(batch), self.dim), dtype=np.float32)
+
+            # vectors go down first: a crash before the records land leaves surplus
+            # vector rows, which _load trims back to the records
+            if self.dim:
+                with open(self._vectors_path, "ab") as fh:
+                    fh.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            with open(self._records_path, "a", encoding="utf-8") as fh:
+                for resume_id, skills, metadata in batch:
+                    fh.write(json.dumps({"id": resume_id, "skills": skills, "metadata": metadata}) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+
+            for resume_id, skills, metadata in batch:
+                self._add_record(resume_id, skills, metadata)
+            self._remap()
+        return len(batch)
+
+    def add_resume(self, resume_id: str, skills: List[str], metadata: Dict[str, Any] = None, normalize: bool = False) -> int:
+        return self.add_resumes([(resume_id, skills, metadata)], normalize=normalize)
+
+    def _posting_array(self, key: str) -> np.ndarray:
+        postings = self._postings.get(key)
+        if not postings:
+            return np.empty(0, dtype=np.intp)
+        cached = self._posting_arrays.get(key)
+        if cached is None or len(cached) != len(postings):
+            cached = self._posting_arrays[key] = np.asarray(postings, dtype=np.intp)
+        return cached
+
+    def search(self, job_skills: List[str], top_k: int = 20, min_overlap: int = 1, semantic_weight: float = None) -> List[Dict]:
+        """
+        Best candidates for a list of job skills
+
+        Args:
+            job_skills: Required skills (normalized here with SkillNormalizer)
+            top_k: Number of candidates to return
+            min_overlap: Minimum number of shared skills to be considered at all
+            semantic_weight: Share of the score from dense similarity (rest is skill overlap)
+
+        Returns:
+            Ranked candidates with resume_id, score, overlap, similarity, matched_skills, metadata
+        """
+        if semantic_weight is None:
+            semantic_weight = CANDIDATE_INDEX_CONFIG["semantic_weight"]
+        job_norm = self._normalizer.normalize_skills_list(job_skills)
+        job_keys = list(dict.fromkeys(s.lower() for s in job_norm))
+        # snapshot under the lock; rows below n never change afterwards (lists only grow)
+        with self._lock:
+            n = len(self._ids)
+            if not job_keys or not n:
+                return []
+            postings = [self._posting_array(k) for k in job_keys]
+            alive = np.fromiter(self._alive, dtype=bool, count=n)
+            vectors, dim = self._vectors, self.dim
+            ids, skills, metadata = self._ids, self._skills, self._metadata
+
+        overlap = np.bincount(np.concatenate(postings), minlength=n) if postings else np.zeros(n, dtype=np.intp)
+        candidates = np.flatnonzero((overlap >= min_overlap) & alive)
+        if candidates.size == 0:
+            return []
+
+        # keep the dense pass bounded on very common skill sets
+        max_candidates = CANDIDATE_INDEX_CONFIG["max_candidates"]
+        if candidates.size > max_candidates:
+            keep = np.argpartition(-overlap[candidates], max_candidates - 1)[:max_candidates]
+            candidates = candidates[keep]
+
+        overlap_score = overlap[candidates] / len(job_keys)
+        similarity = np.zeros(candidates.size, dtype=np.float32)
+        if vectors is not None and semantic_weight > 0:
+            query = self._skill_vectors([job_norm])[0]
+            if query.shape[0] == dim:
+                # gather rows in file order so memmap reads stay sequential
+                order = np.argsort(candidates)
+                similarity[order] = np.asarray(vectors[candidates[order]] @ query)
+        scores = (1 - semantic_weight) * overlap_score + semantic_weight * similarity
+
+        k = min(top_k, candidates.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        job_set = set(job_keys)
+        results = []
+        for i in top:
+            row = int(candidates[i])
+            results.append({
+                "resume_id": ids[row],
+                "score": round(float(scores[i]), 4),
+                "overlap": int(overlap[row]),
+                "similarity": round(float(similarity[i]), 4),
+                "matched_skills": [s for s in skills[row] if s.lower() in job_set],
+                "metadata": metadata[row],
+            })
+        return results
+
+    def search_template(self, template_key: str, **kwargs) -> List[Dict]:
+        """search() with the required skills of a job template"""
+        return self.search(get_template_index().required_skills(template_key), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "resumes": len(self),
+            "rows": len(self._ids),
+            "skills": len(self._postings),
+            "dim": self.dim,
+            "index_dir": str(self.index_dir),
+        }
@@ -0,0 +1,246 @@
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from config.settings import NLP_CONFIG, EMBEDDING_CACHE_CONFIG
+from backend.cache_store import LRUCache
+from backend.embedding_dispatcher import model_encode
+
+logger = logging.getLogger(__name__)
+
+# optional: cross-process write lock (not available on Windows)
+try:
+    import fcntl as _fcntl
+except Exception:
+    _fcntl = None
+
+
+def normalize_key(text: str, fold_case: bool = True) -> str:
+    """Cache key for a skill string: trimmed, whitespace-collapsed and (for uncased models) lowercased"""
+    key = " ".join(str(text).split())
+    return key.lower() if fold_case else key
+
+
+class _DiskStore:
+    """
+    Append-only embedding store for one model.
+
+    vectors.npy is a memory-mapped float32 matrix that grows by doubling; index.json
+    maps each key to its row. Rows are flushed before the index is atomically replaced,
+    so readers in other processes never see a key whose vector is not written yet.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = directory / "vectors.npy"
+        self._index_path = directory / "index.json"
+        self._lock_path = directory / ".lock"
+        # (key -> row, memory-mapped matrix): replaced as one tuple so readers never pair
+        # a new index with an older, shorter matrix
+        self._snapshot = ({}, None)
+        self._refresh_lock = threading.RLock()
+        self._index_mtime = None
+        self.dim = None
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._snapshot[0])
+
+    def refresh(self):
+        """Reload the index (and re-map the matrix) if another process appended"""
+        try:
+            mtime = self._index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._index_mtime:
+            return
+        with self._refresh_lock:
+            if mtime == self._index_mtime:
+                return
+            try:
+                index = json.loads(self._index_path.read_text())
+                rows = {k: i for i, k in enumerate(index["keys"])}
+                vectors = np.load(self._vectors_path, mmap_mode="r")
+                self._snapshot, self.dim = (rows, vectors), index["dim"]
+                self._index_mtime = mtime
+            except Exception:
+                logger.exception("Unreadable embedding cache at %s; starting empty", self.directory)
+                self._snapshot, self.dim = ({}, None), None
+
+    def get(self, key: str):
+        rows, vectors = self._snapshot
+        row = rows.get(key)
+        if row is None or vectors is None:
+            return None
+        return np.array(vectors[row], dtype=np.float32)
+
+    def append(self, keys: List[str], vectors: np.ndarray):
+        lock_fh = open(self._lock_path, "a")
+        try:
+            if _fcntl:
+                _fcntl.flock(lock_fh, _fcntl.LOCK_EX)
+            self.refresh()
+
+            rows, current = self._snapshot
+            new = [(k, v) for k, v in zip(keys, vectors) if k not in rows]
+            if not new:
+                return
+            count = len(rows)
+            dim = vectors.shape[1]
+            if self.dim is not None and self.dim != dim:
+                logger.warning("Embedding dim changed (%s -> %s); not persisting", self.dim, dim)
+                return
+
+            capacity = current.shape[0] if current is not None else 0
+            if count + len(new) > capacity:
+                new_capacity = max(1024, capacity * 2, count + len(new))
+                tmp_path = self._vectors_path.with_suffix(".tmp.npy")
+                grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(new_capacity, dim))
+                if count:
+                    grown[:count] = current[:count]
+                grown.flush()
+                del grown
+                os.replace(tmp_path, self._vectors_path)
+
+            matrix = np.load(self._vectors_path, mmap_mode="r+")
+            matrix[count:count + len(new)] = np.stack([v for _, v in new]).astype(np.float32)
+            matrix.flush()
+            del matrix
+
+            all_keys = [None] * count
+            for k, i in rows.items():
+                all_keys[i] = k
+            all_keys.extend(k for k, _ in new)
+            tmp_index = self._index_path.with_suffix(".tmp")
+            tmp_index.write_text(json.dumps({"dim": dim, "keys": all_keys}))
+            os.replace(tmp_index, self._index_path)
+            self._index_mtime = None
+            self.refresh()
+        finally:
+            if _fcntl:
+                _fcntl.flock(lock_fh, _fcntl.LOCK_UN)
+            lock_fh.close()
+
+
+class EmbeddingCache:
+    """
+    Embedding cache for one model: bounded in-memory LRU in front of a persistent,
+    memory-mapped on-disk store. Only cache misses reach the encoder, in one batch.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = None, max_memory_items: int = None, persist: bool = None):
+        self.model_name = model_name
+        # uncased models lowercase their input, so case variants can share one entry
+        self.fold_case = model_name in EMBEDDING_CACHE_CONFIG["uncased_models"]
+        self._memory = LRUCache(max_memory_items or EMBEDDING_CACHE_CONFIG["max_memory_items"])
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.misses = 0
+        self._disk = None
+
+        if persist if persist is not None else EMBEDDING_CACHE_CONFIG["persist"]:
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+            try:
+                self._disk = _DiskStore(Path(cache_dir or EMBEDDING_CACHE_CONFIG["cache_dir"]) / safe_name)
+            except Exception:
+                logger.exception("Embedding disk cache unavailable; using memory only")
+
+    def encode(self, model, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embeddings for texts, shape (len(texts), dim)
+
+        Args:
+            model: Object with a SentenceTransformer-style encode(list, convert_to_numpy=True)
+            texts: Strings to embed; keys are normalized with normalize_key, but the model
+                always sees the original text (the first one seen for each key)
+
+        Returns:
+            float32 matrix in the same order as texts
+        """
+        keys = [normalize_key(t, self.fold_case) for t in texts]
+        found: Dict[str, np.ndarray] = {}
+        pending: Dict[str, str] = {}  # key -> text to encode, in first-seen order
+
+        if self._disk is not None and keys:
+            self._disk.refresh()
+        for key, text in zip(keys, texts):
+            if key in found or key in pending:
+                continue
+            vec = self._memory.get(key)
+            if vec is None and self._disk is not None:
+                vec = self._disk.get(key)
+                if vec is not None:
+                    with self._lock:
+                        self.disk_hits += 1
+                    self._memory.put(key, vec)
+            if vec is None:
+                pending[key] = str(text)
+            else:
+                found[key] = vec
+
+        if pending:
+            pending_keys = list(pending)
+            vectors = model_encode(model, list(pending.values()), self.model_name)
+            with self._lock:
+                self.misses += len(pending_keys)
+            for key, vec in zip(pending_keys, vectors):
+                found[key] = vec
+                self._memory.put(key, vec)
+            if self._disk is not None:
+                try:
+                    with self._lock:
+                        self._disk.append(pending_keys, vectors)
+                except Exception:
+                    logger.exception("Failed to persist %d embeddings", len(pending))
+
+        if not keys:
+            dim = self._disk.dim if self._disk is not None and self._disk.dim else 0
+            return np.zeros((0, dim), dtype=np.float32)
+        return np.stack([found[k] for k in keys])
+
+    def stats(self) -> Dict[str, int]:
+        mem = self._memory.stats()
+        with self._lock:
+            disk_hits, misses = self.disk_hits, self.misses
+        return {
+            "model": self.model_name,
+            "memory_items": mem["items"],
+            "memory_hits": mem["hits"],
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "evictions": mem["evictions"],
+            "disk_items": len(self._disk) if self._disk is not None else 0,
+        }
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model_name: str = None) -> EmbeddingCache:
+    """Process-wide cache for a model name (defaults to NLP_CONFIG["embeddings_model"])"""
+    model_name = model_name or NLP_CONFIG["embeddings_model"]
+    with _caches_lock:
+        if model_name not in _caches:
+            _caches[model_name] = EmbeddingCache(model_name)
+        return _caches[model_name]
+
+
+def encode_cached(model, texts: Sequence[str], model_name: str = None) -> np.ndarray:
+    """Encode through the shared cache, or straight through the model when caching is disabled"""
+    if not EMBEDDING_CACHE_CONFIG["enabled"]:
+        return model_encode(model, texts, model_name or NLP_CONFIG["embeddings_model"])
+    return get_embedding_cache(model_name).encode(model, texts)
+
+
+def encode_normalized(model, texts: Sequence[str], model_name: str = None) -> np.ndarray:
+    """encode_cached with L2-normalized rows, so dot products are cosine similarities"""
+    embs = encode_cached(model, texts, model_name)
+    return embs / (np.linalg.norm(embs, axis=1, keepdims=True) + 1e-10)
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import EMBEDDING_DISPATCH_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# batch-size histogram buckets (upper bounds, in texts per model.encode call)
+_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class _Request:
+    __slots__ = ("texts", "done", "result", "error")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingDispatcher:
+    """
+    Micro-batcher in front of one embeddings model.
+
+    Concurrent encode() calls (Streamlit sessions, service workers) are queued and a
+    single background thread flushes them as one model.encode call once max_batch_size
+    texts are waiting or the oldest request has waited max_wait_ms. Texts shared between
+    requests are encoded once; every caller gets back its own rows, in its own order.
+    """
+
+    def __init__(self, model, max_batch_size: int = None, max_wait_ms: float = None, name: str = ""):
+        self.model = model
+        self.name = name
+        self.max_batch_size = max(1, int(max_batch_size or EMBEDDING_DISPATCH_CONFIG["max_batch_size"]))
+        wait_ms = EMBEDDING_DISPATCH_CONFIG["max_wait_ms"] if max_wait_ms is None else max_wait_ms
+        self.max_wait = wait_ms / 1000.0
+        self._queue: "deque[_Request]" = deque()
+        self._queued_texts = 0
+        self._cond = threading.Condition()
+
+        self.requests = 0
+        self.texts = 0
+        self.encoded = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.histogram = {b: 0 for b in _BUCKETS}
+        self.histogram_overflow = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"embed-dispatch-{name}", daemon=True)
+        self._thread.start()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embeddings for texts (float32, one row per text), batched with other callers"""
+        request = _Request(list(texts))
+        if not request.texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        with self._cond:
+            self._queue.append(request)
+            self._queued_texts += len(request.texts)
+            self.requests += 1
+            self.texts += len(request.texts)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            self._cond.notify()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _take_batch(self) -> List[_Request]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+            deadline = time.monotonic() + self.max_wait
+            while self._queued_texts < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch, count = [], 0
+            # a request larger than max_batch_size still goes through, on its own
+            while self._queue and (not batch or count + len(self._queue[0].texts) <= self.max_batch_size):
+                request = self._queue.popleft()
+                batch.append(request)
+                count += len(request.texts)
+            self._queued_texts -= count
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            unique = list(dict.fromkeys(t for r in batch for t in r.texts))
+            try:
+                vectors = np.asarray(self.model.encode(unique, convert_to_numpy=True), dtype=np.float32)
+            except BaseException as e:
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            self._record(len(unique))
+            pos = {t: i for i, t in enumerate(unique)}
+            for request in batch:
+                request.result = vectors[[pos[t] for t in request.texts]]
+                request.done.set()
+
+    def _record(self, size: int):
+        with self._cond:
+            self.batches += 1
+            self.encoded += size
+            for bound in _BUCKETS:
+                if size <= bound:
+                    self.histogram[bound] += 1
+                    break
+            else:
+                self.histogram_overflow += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            histogram = {f"<={b}": n for b, n in self.histogram.items()}
+            histogram[f">{_BUCKETS[-1]}"] = self.histogram_overflow
+            return {
+                "model": self.name,
+                "queue_depth": len(self._queue),
+                "queued_texts": self._queued_texts,
+                "max_queue_depth": self.max_queue_depth,
+                "requests": self.requests,
+                "texts": self.texts,
+                "encoded": self.encoded,  # after cross-request dedupe
+                "batches": self.batches,
+                "mean_batch_size": round(self.encoded / self.batches, 2) if self.batches else 0,
+                "batch_size_histogram": histogram,
+            }
+
+
+_dispatchers: Dict[Tuple[str, int], EmbeddingDispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(model, model_name: str = "") -> EmbeddingDispatcher:
+    """Process-wide dispatcher for a loaded model instance"""
+    key = (model_name, id(model))
+    with _dispatchers_lock:
+        dispatcher = _dispatchers.get(key)
+        if dispatcher is None:
+            dispatcher = _dispatchers[key] = EmbeddingDispatcher(model, name=model_name)
+        return dispatcher
+
+
+def model_encode(model, texts: Sequence[str], model_name: str = "") -> np.ndarray:
+    """model.encode(texts) as float32, through the micro-batcher when it is enabled"""
+    if EMBEDDING_DISPATCH_CONFIG["enabled"]:
+        return get_dispatcher(model, model_name).encode(texts)
+    return np.asarray(model.encode(list(texts), convert_to_numpy=True), dtype=np.float32)
+
+
+def dispatcher_stats() -> List[Dict[str, Any]]:
+    with _dispatchers_lock:
+        dispatchers = list(_dispatchers.values())
+    return [d.stats() for d in dispatchers]
@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from config.settings import NLP_CONFIG
+
+try:
+    from rapidfuzz import fuzz, process
+    _HAS_RAPIDFUZZ = True
+except Exception:
+    _HAS_RAPIDFUZZ = False
+    from difflib import SequenceMatcher
+
+# below this many cells thread start-up costs more than it saves
+_PARALLEL_MIN_CELLS = 20_000
+
+
+def _unique_lower(strings: Sequence[str]):
+    """Lowercase each string once and collapse duplicates; returns (unique, inverse index)"""
+    positions: Dict[str, int] = {}
+    unique: List[str] = []
+    inverse = np.empty(len(strings), dtype=np.intp)
+    for i, s in enumerate(strings):
+        key = s.lower()
+        pos = positions.get(key)
+        if pos is None:
+            pos = positions[key] = len(unique)
+            unique.append(key)
+        inverse[i] = pos
+    return unique, inverse
+
+
+def score_matrix(queries: Sequence[str], choices: Sequence[str], scorer: str = "token_set_ratio", workers: int = None) -> np.ndarray:
+    """
+    Fuzzy score every query against every choice in one call.
+
+    Args:
+        queries: Strings scored row-wise
+        choices: Strings scored column-wise
+        scorer: Name of a rapidfuzz.fuzz scorer ("ratio", "token_set_ratio", ...)
+        workers: Threads for rapidfuzz (-1 = all cores); defaults to NLP_CONFIG["fuzzy_workers"]
+
+    Returns:
+        float64 matrix of 0-100 scores, shape (len(queries), len(choices))
+    """
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)), dtype=np.float64)
+
+    q_unique, q_inv = _unique_lower(queries)
+    c_unique, c_inv = _unique_lower(choices)
+    return _cdist(q_unique, c_unique, scorer, workers)[np.ix_(q_inv, c_inv)]
+
+
+def _cdist(queries: List[str], choices: Sequence[str], scorer: str, workers: int = None) -> np.ndarray:
+    """Raw score matrix for already-lowercased strings"""
+    if _HAS_RAPIDFUZZ:
+        if workers is None:
+            workers = NLP_CONFIG.get("fuzzy_workers", -1)
+        if len(queries) * len(choices) < _PARALLEL_MIN_CELLS:
+            workers = 1
+        return process.cdist(queries, choices, scorer=getattr(fuzz, scorer), dtype=np.float64, workers=workers)
+    return np.array(
+        [[SequenceMatcher(None, q, c).ratio() * 100 for c in choices] for q in queries],
+        dtype=np.float64,
+    ).reshape(len(queries), len(choices))
+
+
+def extract_best(queries: Sequence[str], choices: Sequence[str], scorer: str = "ratio", score_cutoff: float = 0, workers: int = None, first: bool = False) -> List[Optional[Tuple[int, float]]]:
+    """
+    Best-scoring choice for each query (first one on ties)
+
+    Args:
+        queries: Strings to look up (lowercased here)
+        choices: Precompiled, already-lowercased choice array (e.g. flattened aliases)
+        scorer: Name of a rapidfuzz.fuzz scorer
+        score_cutoff: Scores below this count as no match
+        first: Take the first choice (in array order) that reaches score_cutoff instead of
+            the best-scoring one, like a loop that returns on its first match
+
+    Returns:
+        (choice index, score) per query, or None where nothing reaches score_cutoff
+    """
+    if not queries or not choices:
+        return [None] * len(queries)
+    q_unique, q_inv = _unique_lower(queries)
+
+    if _HAS_RAPIDFUZZ and len(q_unique) == 1 and not first:
+        # single lookup: extractOne can stop early and skips building a matrix
+        hit = process.extractOne(q_unique[0], choices, scorer=getattr(fuzz, scorer), score_cutoff=score_cutoff)
+        best = [(hit[2], float(hit[1])) if hit else None]
+    else:
+        scores = _cdist(q_unique, choices, scorer, workers)
+        idx = (scores >= score_cutoff).argmax(axis=1) if first else scores.argmax(axis=1)
+        top = scores[np.arange(len(q_unique)), idx]
+        best = [(int(i), float(t)) if t >= score_cutoff else None for i, t in zip(idx, top)]
+
+    return [best[i] for i in q_inv]
@@ -1,17 +1,30 @@
 from typing import List, Dict
 from sklearn.cluster import KMeans
 import numpy as np
-from sentence_transformers import SentenceTransformer
+from config.settings import NLP_CONFIG
+from backend.model_registry import get_embeddings_model
+from backend.embedding_cache import encode_cached
+from backend.skill_taxonomy import get_taxonomy
 
 class GapAnalyzer:
     """Analyzes skill gaps and clusters missing skills"""
     
-    def __init__(self):
-        self.embeddings_model = SentenceTransformer("all-MiniLM-L6-v2")
+    def __init__(self, taxonomy=None):
+        # importance weights and prerequisites come from the skill taxonomy when one exists
+        self.taxonomy = taxonomy if taxonomy is not None else get_taxonomy()
         self.skill_importance = self._load_skill_importance()
     
+    @property
+    def embeddings_model(self):
+        """Shared embeddings model, only loaded once clustering actually needs it"""
+        return get_embeddings_model(NLP_CONFIG["embeddings_model"])
+    
     def _load_skill_importance(self) -> Dict[str, float]:
         """Load skill importance weights"""
+        if self.taxonomy is not None and len(self.taxonomy):
+            weights = self.taxonomy.importance_map()
+            weights["default"] = self.taxonomy.default_importance
+            return weights
         return {
             # Core technical skills (high importance)
             "python": 10, "javascript": 9, "java": 9, "sql": 9, "react": 9,
@@ -69,7 +82,7 @@ class GapAnalyzer:
         ranked = []
         
         for skill in missing_skills:
-            importance = self.skill_importance.get(skill.lower(), self.skill_importance["default"])
+            importance = self._importance_of(skill)
             dependencies = self._get_skill_dependencies(skill)
             
             ranked.append({
@@ -84,8 +97,19 @@ class GapAnalyzer:
         
         return ranked
     
+    def _importance_of(self, skill: str) -> float:
+        """Importance weight for a skill name, resolving taxonomy aliases"""
+        importance = self.skill_importance.get(skill.lower())
+        if importance is None and self.taxonomy is not None:
+            idx = self.taxonomy.find(skill)
+            if idx is not None:
+                importance = self.taxonomy.importance(idx)
+        return importance if importance is not None else self.skill_importance["default"]
+    
     def _get_skill_dependencies(self, skill: str) -> List[str]:
         """Get prerequisite skills for a given skill"""
+        if self.taxonomy is not None and len(self.taxonomy):
+            return self.taxonomy.dependencies(skill)
         dependencies_map = {
             "kubernetes": ["docker"],
             "django": ["python"],
@@ -115,7 +139,7 @@ class GapAnalyzer:
             return {"clusters": []}
         
         try:
-            embeddings = self.embeddings_model.encode(missing_skills)
+            embeddings = encode_cached(self.embeddings_model, missing_skills, NLP_CONFIG["embeddings_model"])
             kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
             labels = kmeans.fit_predict(embeddings)
             
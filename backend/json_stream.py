@@ -0,0 +1,115 @@
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# longest stretch of a key pattern that can straddle two chunks and still be found
+_KEY_OVERLAP = 256
+
+
+class ArrayItemStream:
+    """
+    Incremental parser that emits the objects of one top-level array ("weeks" by default)
+    of a JSON document while it is still being generated.
+
+    feed() takes text chunks as they arrive and returns the array items that closed in
+    that chunk. Anything before the '"weeks": [' key is skipped, so prose, a ```json fence
+    or stray braces in the preamble do not throw off the parse. From there on each
+    character is looked at once, tracking string/escape state and nesting depth, so the
+    cost stays linear in the completion length.
+    """
+
+    def __init__(self, key: str = "weeks"):
+        self.key = key
+        self.items: List[Dict[str, Any]] = []
+        self._parts: List[str] = []
+        self._pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._pending = ""  # tail of the text searched for the key so far
+        self._key_start: Optional[int] = None  # offset of the key once found
+        self._offset = 0  # characters consumed so far
+        self._depth = 0  # nesting inside the array (1 = directly in it)
+        self._in_string = False
+        self._escape = False
+        self._done = False
+        self._item: Optional[List[str]] = None  # characters of the array item being read
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        if not chunk:
+            return []
+        self._parts.append(chunk)
+        if self._done:
+            return []
+
+        if self._key_start is None:
+            searched = self._pending + chunk
+            base = self._offset - len(self._pending)
+            self._offset += len(chunk)
+            m = self._pattern.search(searched)
+            if m is None:
+                self._pending = searched[-_KEY_OVERLAP:]
+                return []
+            self._key_start = base + m.start()
+            self._pending = ""
+            self._depth = 1
+            chunk = searched[m.end():]
+        else:
+            self._offset += len(chunk)
+
+        emitted = []
+        for c in chunk:
+            if self._item is not None:
+                self._item.append(c)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                continue
+            if c == '"':
+                self._in_string = True
+            elif c in "[{":
+                self._depth += 1
+                if c == "{" and self._depth == 2:
+                    self._item = ["{"]
+            elif c in "]}":
+                self._depth -= 1
+                if c == "}" and self._depth == 1 and self._item is not None:
+                    try:
+                        item = json.loads("".join(self._item))
+                        self.items.append(item)
+                        emitted.append(item)
+                    except ValueError:
+                        logger.warning("Skipping malformed %s item in streamed JSON", self.key)
+                    self._item = None
+                if self._depth == 0:
+                    self._done = True
+                    break
+        return emitted
+
+    def document(self) -> Optional[Dict[str, Any]]:
+        """
+        The JSON object holding the array once it has closed and parses, else None.
+        Tried from each "{" before the key, nearest first, until one decodes.
+        """
+        if not self._done:
+            return None
+        text = self.text
+        decoder = json.JSONDecoder()
+        start = text.rfind("{", 0, self._key_start)
+        while start >= 0:
+            try:
+                doc, _ = decoder.raw_decode(text, start)
+            except ValueError:
+                doc = None
+            if isinstance(doc, dict) and isinstance(doc.get(self.key), list):
+                return doc
+            start = text.rfind("{", 0, start)
+        return None
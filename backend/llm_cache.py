@@ -0,0 +1,109 @@
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.settings import LLM_CACHE_CONFIG, LLM_CONFIG
+from backend.cache_store import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+def provider_model(provider: str) -> str:
+    """Model name a provider is configured to call"""
+    return {
+        "openai": LLM_CONFIG.get("model_name", "gpt-3.5-turbo"),
+        "gemini": LLM_CONFIG.get("gemini_model", "gemini-1.5-flash"),
+        "huggingface": LLM_CONFIG.get("huggingface_model", "gpt2"),
+    }.get(provider, provider)
+
+
+def canonical_request(missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int) -> Dict[str, Any]:
+    """
+    Plan request with cosmetic differences removed: skills deduplicated, lowercased and
+    sorted, title and level whitespace-collapsed and lowercased, hours as an int
+    """
+    skills = sorted({" ".join(str(s).split()).lower() for s in missing_skills or [] if str(s).strip()})
+    return {
+        "missing_skills": skills,
+        "job_title": " ".join(str(job_title or "").split()).lower(),
+        "current_level": " ".join(str(current_level or "").split()).lower(),
+        "weekly_hours": int(weekly_hours),
+    }
+
+
+def plan_key(provider: str, model: str, prompt: str) -> str:
+    """SHA-256 of provider, model and the (canonical) prompt"""
+    return hashlib.sha256(json.dumps([provider, model, prompt]).encode("utf-8")).hexdigest()
+
+
+class LLMPlanCache(TieredCache):
+    """
+    Cache of parsed LLM learning plans.
+
+    Keys are plan_key(...) of the prompt built from canonical_request(...), so the same
+    skills in a different order or casing reuse one generation. A bounded LRU sits in
+    front of a size-capped SQLite tier; entries expire after LLM_CACHE_CONFIG["ttl"].
+    Each entry remembers how long its generation took, which is what a hit saves.
+    """
+
+    label = "LLM cache"
+
+    def __init__(self, cache_dir: str = None, ttl: float = None, max_memory_items: int = None,
+                 max_disk_bytes: int = None, persist: bool = None):
+        persist = LLM_CACHE_CONFIG["persist"] if persist is None else persist
+        super().__init__(
+            path=Path(cache_dir or LLM_CACHE_CONFIG["cache_dir"]) / "llm_plans.sqlite3" if persist else None,
+            max_memory_items=max_memory_items or LLM_CACHE_CONFIG["max_memory_items"],
+            max_disk_bytes=max_disk_bytes or LLM_CACHE_CONFIG["max_disk_mb"] * 1024 * 1024,
+            ttl=LLM_CACHE_CONFIG["ttl"] if ttl is None else ttl,
+        )
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "stores": 0, "saved_seconds": 0.0, "generation_seconds": 0.0}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        # plans are enriched in place by the caller; the tiered cache hands out copies
+        entry = super().get(key)
+        with self._lock:
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            self.counters["hits"] += 1
+            self.counters["saved_seconds"] += entry["latency"]
+        return entry["plan"]
+
+    def put(self, key: str, plan: Dict[str, Any], latency: float):
+        """Store a parsed plan together with the seconds its generation took"""
+        super().put(key, {"plan": plan, "latency": latency})
+        with self._lock:
+            self.counters["stores"] += 1
+            self.counters["generation_seconds"] += latency
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters.update({
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            "saved_seconds": round(counters["saved_seconds"], 2),
+            "generation_seconds": round(counters["generation_seconds"], 2),
+            **self.tier_stats(),
+        })
+        return counters
+
+
+_cache: Optional[LLMPlanCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMPlanCache]:
+    """Process-wide plan cache, or None when disabled in LLM_CACHE_CONFIG"""
+    global _cache
+    if not LLM_CACHE_CONFIG["enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMPlanCache()
+        return _cache
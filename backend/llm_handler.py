@@ -1,8 +1,10 @@
 import json
 import logging
 import math
-from typing import Dict, List, Any
-from config.settings import LLM_CONFIG
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from config.settings import LLM_CONFIG, RESOURCE_CATALOG_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,7 @@ class LLMHandler:
         self.client = None
         self.available = False
         self._init_error = None
+        self._analyzer = None
         self.setup_llm()
 
     def setup_llm(self):
@@ -42,7 +45,8 @@ class LLMHandler:
         elif self.provider == "webui":
             try:
                 import requests
-                resp = requests.get("http://localhost:5000/api/v1/model", timeout=3)
+                # the OpenAI-compatible API is used for the check, blocking and streamed calls
+                resp = requests.get(f"{LLM_CONFIG['webui_url']}/v1/models", timeout=3)
                 if resp.status_code == 200:
                     self.client = "webui"
                     self.available = True
@@ -73,7 +77,7 @@ class LLMHandler:
                 model=LLM_CONFIG.get("model_name", "gpt-3.5-turbo"),
                 messages=[{"role": "user", "content": prompt}],
             )
-            return str(response)
+            return response.choices[0].message.content or ""
         except Exception as e:
             logger.exception("OpenAI call failed")
             return f"Error calling OpenAI: {e}"
@@ -91,12 +95,12 @@ class LLMHandler:
     def _call_webui(self, prompt: str) -> str:
         try:
             import requests
-            url = "http://localhost:5000/api/v1/generate"
-            payload = {"prompt": prompt, "max_new_tokens": 512}
+            url = f"{LLM_CONFIG['webui_url']}/v1/completions"
+            payload = {"prompt": prompt, "max_tokens": 512}
             r = requests.post(url, json=payload, timeout=120)
             r.raise_for_status()
             j = r.json()
-            return j.get("results", [{}])[0].get("text", str(j))
+            return (j.get("choices") or [{}])[0].get("text", str(j))
         except Exception as e:
             logger.exception("WebUI call failed")
             return f"Error calling WebUI: {e}"
@@ -120,6 +124,51 @@ class LLMHandler:
             logger.exception("HuggingFace call failed")
             return f"Error calling HuggingFace: {e}"
 
+    def _stream_openai(self, prompt: str) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            model=LLM_CONFIG.get("model_name", "gpt-3.5-turbo"),
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _stream_gemini(self, prompt: str) -> Iterator[str]:
+        model = self.client.GenerativeModel(LLM_CONFIG.get("gemini_model", "gemini-1.5-flash"))
+        for chunk in model.generate_content(prompt, stream=True):
+            text = getattr(chunk, "text", "")
+            if text:
+                yield text
+
+    def _stream_webui(self, prompt: str) -> Iterator[str]:
+        # OpenAI-compatible completions endpoint, streamed as server-sent events
+        import requests
+        url = f"{LLM_CONFIG['webui_url']}/v1/completions"
+        payload = {"prompt": prompt, "max_tokens": 512, "stream": True}
+        with requests.post(url, json=payload, stream=True, timeout=(3, 120)) as r:
+            r.raise_for_status()
+            for line in r.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                text = (json.loads(data).get("choices") or [{}])[0].get("text")
+                if text:
+                    yield text
+
+    def _stream_provider(self, prompt: str) -> Iterator[str]:
+        """Completion text in chunks as the provider produces it; raises on failure"""
+        stream = {"openai": self._stream_openai, "gemini": self._stream_gemini, "webui": self._stream_webui}.get(self.provider)
+        if stream is None:
+            # no streaming API (huggingface inference): one chunk with the whole completion
+            raw = self._call_provider(prompt)
+            if raw:
+                yield raw
+            return
+        yield from stream(prompt)
+
     def _parse_learning_plan(self, raw: str) -> Dict:
         try:
             parsed = json.loads(raw)
@@ -127,52 +176,378 @@ class LLMHandler:
                 return parsed
             return {"raw": parsed}
         except Exception:
-            # return wrapper so caller can decide
-            return {"raw_plan": raw}
+            pass
+        # prose or a code fence around the JSON: pick the object holding "weeks" out of it
+        from backend.json_stream import ArrayItemStream
+
+        parser = ArrayItemStream("weeks")
+        parser.feed(raw or "")
+        doc = parser.document()
+        # return wrapper so caller can decide
+        return doc if doc is not None else {"raw_plan": raw}
+
+    def _call_provider(self, prompt: str) -> str:
+        if self.provider == "openai":
+            return self._call_openai(prompt)
+        if self.provider == "gemini":
+            return self._call_gemini(prompt)
+        if self.provider == "webui":
+            return self._call_webui(prompt)
+        if self.provider == "huggingface":
+            return self._call_huggingface(prompt)
+        return None
+
+    def _plan_cache(self, missing_skills, job_title, current_level, weekly_hours):
+        """(plan cache, key for this request), or (None, None) when caching is disabled"""
+        from backend.llm_cache import canonical_request, get_llm_cache, plan_key, provider_model
+
+        cache = get_llm_cache()
+        if cache is None:
+            return None, None
+        canonical = canonical_request(missing_skills, job_title, current_level, weekly_hours)
+        return cache, plan_key(self.provider, provider_model(self.provider), self._create_prompt(**canonical))
+
+    def _generate_plan(self, missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int) -> Dict:
+        """
+        LLM plan for the request, served from the plan cache when an equivalent request
+        (same skills in any order/casing, title, level, hours) was answered before
+
+        Returns:
+            Parsed plan with "weeks", or None when the LLM is unavailable or its output
+            did not parse (those outcomes are never cached)
+        """
+        if not self.available:
+            return None
+        cache, key = self._plan_cache(missing_skills, job_title, current_level, weekly_hours)
+        if cache is not None:
+            plan = cache.get(key)
+            if plan is not None:
+                return plan
+
+        start = time.perf_counter()
+        raw = None
+        try:
+            raw = self._call_provider(self._create_prompt(missing_skills, job_title, current_level, weekly_hours))
+        except Exception:
+            logger.exception("LLM generation failed")
+        parsed = self._parse_learning_plan(raw) if raw else {"raw_plan": None}
+        if "weeks" not in parsed:
+            return None
+        if cache is not None:
+            cache.put(key, parsed, time.perf_counter() - start)
+        return parsed
+
+    def _generate_fragment(self, skill: str, current_level: str, n_weeks: int = None) -> Dict:
+        """LLM block of n_weeks (default fragment_weeks) for one skill, or None when the call or its JSON failed"""
+        n_weeks = n_weeks or LLM_CONFIG["fragment_weeks"]
+        start = time.perf_counter()
+        try:
+            raw = self._call_provider(self._create_fragment_prompt(skill, current_level, n_weeks))
+        except Exception:
+            logger.exception("Fragment generation failed for %s", skill)
+            return None
+        parsed = self._parse_learning_plan(raw) if raw else {}
+        weeks = [w for w in parsed.get("weeks") or [] if isinstance(w, dict)]
+        if not weeks:
+            return None
+        return {
+            "skill": skill,
+            "level": current_level,
+            "weeks": weeks[:n_weeks],
+            "prerequisites": [p for p in parsed.get("prerequisites") or [] if isinstance(p, str)],
+            "latency": time.perf_counter() - start,
+        }
+
+    def _iter_fragment_plan(self, missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int) -> Iterator[Tuple[str, Any]]:
+        """
+        Plan assembled from per-(skill, level) fragments: stored fragments are reused,
+        only uncovered skills go to the LLM (concurrently), and the blocks are ordered
+        by GapAnalyzer prerequisites and importance. Skills whose fragment failed get a
+        fallback block; when no fragment is usable at all, one whole-plan call is made.
+
+        Blocks are LLM_CONFIG["fragment_weeks"] long, or longer when too few skills are
+        missing to fill LLM_CONFIG["plan_weeks"] with them (a shorter stored block is then
+        regenerated, and reused padded if that fails). Every block is padded to that length,
+        so the week allocation is known before any fragment arrives and weeks can be handed
+        out as soon as the fragments for them and for every earlier week have completed.
+
+        Yields:
+            ("week", numbered week) in plan order while fragments complete, then
+            ("source", "whole") when the plan comes from the whole-plan call, then
+            ("plan", plan) once; the plan is None when the LLM is unavailable or every
+            attempt failed, and fragment plan weeks are the objects yielded before
+        """
+        if not self.available or not missing_skills:
+            yield "plan", None
+            return
+        from backend.llm_cache import provider_model
+        from backend.plan_fragments import (
+            allocate_weeks, assemble_plan, fallback_fragment, fragment_key, get_fragment_store, order_skills,
+        )
+
+        if self._analyzer is None:
+            from backend.gap_analyzer import GapAnalyzer
+            self._analyzer = GapAnalyzer()
+        analyzer = self._analyzer
+
+        skills, seen = [], set()
+        for skill in missing_skills:
+            canonical = " ".join(str(skill).split()).lower()
+            if canonical and canonical not in seen:
+                seen.add(canonical)
+                skills.append(skill)
+        # more skills than weeks: the least important ones would get no week anyway
+        keep = set(sorted(skills, key=lambda s: -analyzer._importance_of(s))[:LLM_CONFIG["plan_weeks"]])
+        skills = [s for s in skills if s in keep]
+
+        store = get_fragment_store()
+        model = provider_model(self.provider)
+        # few skills: longer blocks, so the plan still runs for plan_weeks
+        n_weeks = max(LLM_CONFIG["fragment_weeks"], math.ceil(LLM_CONFIG["plan_weeks"] / len(skills)))
+        fragments, uncovered, failed, short = {}, [], set(), {}
+
+        def accept(skill: str, fragment: Optional[Dict]):
+            if fragment is None:
+                failed.add(skill)
+                fragment = fallback_fragment(skill, current_level, n_weeks)
+            elif len(fragment["weeks"]) < n_weeks:
+                padding = fallback_fragment(skill, current_level, n_weeks)["weeks"][len(fragment["weeks"]):]
+                fragment = dict(fragment, weeks=fragment["weeks"] + padding)
+            fragments[skill] = fragment
+
+        for skill in skills:
+            fragment = store.get(fragment_key(self.provider, model, skill, current_level)) if store else None
+            if fragment is not None and not fragment.get("failed") and len(fragment["weeks"]) < n_weeks:
+                # stored for a plan with more skills: ask for the longer block
+                short[skill] = fragment
+                fragment = None
+            if fragment is None:
+                uncovered.append(skill)
+            else:
+                # a recent failure is not retried until its marker expires
+                accept(skill, None if fragment.get("failed") else fragment)
+        stored = len(fragments) - len(failed)
+
+        order = order_skills(skills, analyzer)
+        allocation = allocate_weeks(skills, analyzer, {s: n_weeks for s in skills}, LLM_CONFIG["plan_weeks"])
+        weeks, next_skill = [], 0
+
+        def ready_weeks() -> Iterator[Dict]:
+            # nothing goes out until one real fragment exists: an all-failed plan switches to a whole-plan call
+            nonlocal next_skill
+            if len(fragments) == len(failed):
+                return
+            while next_skill < len(order) and order[next_skill] in fragments:
+                skill = order[next_skill]
+                for week in fragments[skill]["weeks"][:allocation[skill]]:
+                    week = dict(week, week=len(weeks) + 1, focus_skill=skill, hours=weekly_hours)
+                    weeks.append(week)
+                    yield week
+                next_skill += 1
+
+        for week in ready_weeks():
+            yield "week", week
+        if uncovered:
+            workers = max(1, min(len(uncovered), LLM_CONFIG["fragment_workers"]))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plan-fragment") as pool:
+                futures = {pool.submit(self._generate_fragment, s, current_level, n_weeks): s for s in uncovered}
+                for future in as_completed(futures):
+                    skill = futures[future]
+                    fragment = future.result()
+                    key = fragment_key(self.provider, model, skill, current_level)
+                    if fragment is None and skill in short:
+                        fragment = short[skill]  # keep the stored shorter block, padded below
+                    elif store is not None:
+                        if fragment is None:
+                            store.mark_failed(key)
+                        else:
+                            store.put(key, fragment)
+                    accept(skill, fragment)
+                    for week in ready_weeks():
+                        yield "week", week
+        logger.info("Plan from %d stored and %d generated fragments (%d failed)",
+                    stored, len(fragments) - len(failed) - stored, len(failed))
+
+        if len(fragments) == len(failed):
+            # no usable fragment at all: one whole-plan call instead of a plan of fallback blocks
+            yield "source", "whole"
+            yield "plan", self._generate_plan(missing_skills, job_title, current_level, weekly_hours)
+            return
+        plan = assemble_plan(fragments, order, allocation, weekly_hours, missing_skills)
+        # keep the week objects already handed out
+        plan["weeks"] = weeks
+        yield "plan", plan
+
+    def _compose_plan(self, missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int) -> Dict:
+        """_iter_fragment_plan without the week events: the plan, or None"""
+        plan = None
+        for kind, value in self._iter_fragment_plan(missing_skills, job_title, current_level, weekly_hours):
+            if kind == "plan":
+                plan = value
+        return plan
 
     def generate_learning_plan_with_videos(self, missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int = 5) -> Dict:
         """
         Try to generate with LLM; if not available or parse fails, generate simple heuristic plan
         and enrich each week with YouTube videos using your YOUTUBE_API_KEY.
         """
-        # attempt LLM if available
-        raw = None
-        if self.available:
-            try:
-                if self.provider == "openai":
-                    raw = self._call_openai(self._create_prompt(missing_skills, job_title, current_level, weekly_hours))
-                elif self.provider == "gemini":
-                    raw = self._call_gemini(self._create_prompt(missing_skills, job_title, current_level, weekly_hours))
-                elif self.provider == "webui":
-                    raw = self._call_webui(self._create_prompt(missing_skills, job_title, current_level, weekly_hours))
-                elif self.provider == "huggingface":
-                    raw = self._call_huggingface(self._create_prompt(missing_skills, job_title, current_level, weekly_hours))
-            except Exception as e:
-                logger.exception("LLM generation failed")
-
-        parsed = self._parse_learning_plan(raw) if raw else {"raw_plan": None}
+        if LLM_CONFIG["plan_mode"] == "fragments":
+            plan = self._compose_plan(missing_skills, job_title, current_level, weekly_hours)
+        else:
+            plan = self._generate_plan(missing_skills, job_title, current_level, weekly_hours)
 
         # If LLM parse failed or LLM not available -> build deterministic fallback plan
-        if "weeks" not in parsed:
+        if plan is None:
             plan = self._build_fallback_plan(missing_skills, weekly_hours)
-        else:
-            plan = parsed
 
-        # enrich with YouTube videos
+        self._enrich_plan(plan, current_level, weekly_hours)
+        return plan
+
+    def stream_learning_plan(self, missing_skills: List[str], job_title: str, current_level: str, weekly_hours: int = 5) -> Iterator[Dict]:
+        """
+        generate_learning_plan_with_videos as a stream of events, so weeks can be shown
+        while the LLM is still writing the rest of the plan
+
+        Yields:
+            {"event": "week", "week": {...}, "elapsed": seconds} once per week, in order, then
+            {"event": "plan", "plan": {...}, "source": ..., "timings": {"first_week": s, "total": s}}
+            where source is "stream", "retry" (blocking call after an unusable stream),
+            "cache", "fragments", "whole" (blocking whole-plan call after every fragment
+            failed) or "fallback". In fragments mode weeks are sent as the fragments
+            covering them complete.
+        """
+        start = time.perf_counter()
+        first_week = None
+
+        def week_event(week: Dict) -> Dict:
+            nonlocal first_week
+            self._fill_resources([week], current_level)
+            elapsed = time.perf_counter() - start
+            if first_week is None:
+                first_week = elapsed
+            return {"event": "week", "week": week, "elapsed": elapsed}
+
+        plan, source, streamed = None, "fallback", False
+        if self.available and LLM_CONFIG["plan_mode"] == "fragments":
+            source = "fragments"
+            for kind, value in self._iter_fragment_plan(missing_skills, job_title, current_level, weekly_hours):
+                if kind == "week":
+                    streamed = True
+                    yield week_event(value)
+                elif kind == "source":
+                    source = value
+                else:
+                    plan = value
+        elif self.available:
+            cache, key = self._plan_cache(missing_skills, job_title, current_level, weekly_hours)
+            plan = cache.get(key) if cache is not None else None
+            if plan is not None:
+                source = "cache"
+            else:
+                from backend.json_stream import ArrayItemStream
+
+                prompt = self._create_prompt(missing_skills, job_title, current_level, weekly_hours)
+                parser, retried = ArrayItemStream("weeks"), False
+                try:
+                    for chunk in self._stream_provider(prompt):
+                        for week in parser.feed(chunk):
+                            yield week_event(week)
+                except Exception:
+                    logger.exception("LLM streaming failed")
+                if not parser.items and parser.document() is None:
+                    # nothing usable arrived: one blocking attempt before the deterministic plan
+                    logger.info("Streamed plan unusable; retrying with a blocking call")
+                    raw = None
+                    try:
+                        raw = self._call_provider(prompt)
+                    except Exception:
+                        logger.exception("LLM generation failed")
+                    parser, retried = ArrayItemStream("weeks"), True
+                    parser.feed(raw or "")
+                plan = parser.document()
+                if plan is not None and isinstance(plan.get("weeks"), list):
+                    if cache is not None:
+                        cache.put(key, plan, time.perf_counter() - start)
+                    if len(plan["weeks"]) == len(parser.items):
+                        # keep the week objects already handed out (and enriched)
+                        plan["weeks"] = parser.items
+                elif parser.items:
+                    # cut-off or unparseable tail: keep the weeks that did arrive, uncached
+                    plan = {"weeks": parser.items}
+                else:
+                    plan = None
+                if plan is not None:
+                    # weeks parsed from the blocking retry have not been handed out yet
+                    source, streamed = ("retry", False) if retried else ("stream", True)
+
+        if plan is None:
+            plan, source, streamed = self._build_fallback_plan(missing_skills, weekly_hours), "fallback", False
+        if not streamed:
+            for week in plan.get("weeks", []):
+                yield week_event(week)
+
+        self._enrich_plan(plan, current_level, weekly_hours)
+        yield {
+            "event": "plan",
+            "plan": plan,
+            "source": source,
+            "timings": {"first_week": first_week, "total": time.perf_counter() - start},
+        }
+
+    def _fill_resources(self, weeks: List[Dict], current_level: str):
+        """Fill weeks whose resources have no url from the local catalog (no network)"""
         try:
-            from backend.youtube_search import search_youtube
+            from backend.resource_catalog import get_resource_catalog
+            catalog = get_resource_catalog()
+            if catalog is None:
+                return None
+            for week in weeks:
+                focus = week.get("focus_skill") or week.get("focus") or ""
+                if focus and not any(r.get("url") for r in week.get("resources") or [] if isinstance(r, dict)):
+                    found = catalog.resources_for(focus, current_level)
+                    if found:
+                        week["resources"] = found
+            return catalog
+        except Exception:
+            logger.exception("Failed to fill plan resources from the catalog")
+            return None
+
+    def _enrich_plan(self, plan: Dict, current_level: str, weekly_hours: int):
+        """Catalog resources, week videos and total hours, in place"""
+        catalog = self._fill_resources(plan.get("weeks", []), current_level)
+
+        if RESOURCE_CATALOG_CONFIG["youtube_refresh"]:
+            # enrich with YouTube videos: one concurrent search per distinct focus skill
+            try:
+                from backend.youtube_search import plan_video_query, search_youtube_many
+                queries, focus_of = {}, {}
+                for week in plan.get("weeks", []):
+                    focus = week.get("focus_skill") or week.get("focus") or ""
+                    if focus:
+                        queries[id(week)] = plan_video_query(focus, current_level)
+                        focus_of[queries[id(week)]] = focus
+                videos = search_youtube_many(queries.values(), max_results=2)
+                for week in plan.get("weeks", []):
+                    if id(week) in queries:
+                        week["videos"] = videos.get(queries[id(week)], [])
+                if catalog is not None:
+                    # keep what we found so the catalog can serve it offline next time
+                    for query, found in videos.items():
+                        catalog.add_videos(focus_of[query], current_level, found)
+            except Exception:
+                logger.exception("Failed to enrich plan with YouTube videos")
+        elif catalog is not None:
             for week in plan.get("weeks", []):
                 focus = week.get("focus_skill") or week.get("focus") or ""
                 if focus:
-                    q = f"{focus} tutorial for {current_level}"
-                    week["videos"] = search_youtube(q, max_results=2)
-        except Exception:
-            logger.exception("Failed to enrich plan with YouTube videos")
+                    week["videos"] = [
+                        {"title": r["name"], "channel": None, "url": r["url"]}
+                        for r in catalog.resources_for(focus, current_level, k=2, types={"video"})
+                    ]
 
         # compute total time
         total_hours = sum(w.get("hours", weekly_hours) for w in plan.get("weeks", []))
         plan.setdefault("total_time_hours", total_hours)
-        return plan
 
     def _create_prompt(self, missing_skills, job_title, current_level, weekly_hours):
         skills_str = ", ".join(missing_skills) if missing_skills else "general"
@@ -184,6 +559,14 @@ class LLMHandler:
             "Return valid JSON with keys: weeks (list of 12 objects with week, focus_skill, topics, resources, practice_project, milestone), total_time_hours, success_metrics, prerequisites."
         )
 
+    def _create_fragment_prompt(self, skill, current_level, n_weeks):
+        return (
+            f"You are an expert career coach. Create a {n_weeks}-week learning block for the skill: {skill}.\n"
+            f"Current level: {current_level}\n"
+            f"Return valid JSON with keys: weeks (list of {n_weeks} objects with topics, resources, practice_project, milestone), "
+            "prerequisites (skills to know before starting)."
+        )
+
     def _build_fallback_plan(self, missing_skills: List[str], weekly_hours: int) -> Dict:
         """Deterministic simple 12-week plan splitting skills across weeks."""
         skills = missing_skills[:] or ["Core fundamentals"]
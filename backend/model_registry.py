@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import NLP_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# optional: psutil gives accurate RSS on every platform, /proc is the linux fallback
+try:
+    import psutil as _psutil
+except Exception:
+    _psutil = None
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, or None if it cannot be read."""
+    if _psutil:
+        try:
+            return _psutil.Process(os.getpid()).memory_info().rss
+        except Exception:
+            pass
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class ModelRegistry:
+    """Process-wide, lazily-populated cache of heavy NLP models.
+
+    Models are keyed by (kind, name) where name is the value found in NLP_CONFIG
+    (e.g. "all-MiniLM-L6-v2", "en_core_web_sm"). Each model is loaded at most once
+    per process, even when several threads (Streamlit sessions) ask concurrently.
+    """
+
+    def __init__(self):
+        self._models: Dict[tuple, Any] = {}
+        self._errors: Dict[tuple, str] = {}
+        self._stats: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+
+    def _get(self, kind: str, name: str, loader: Callable[[str], Any]) -> Any:
+        key = (kind, name)
+        if key in self._models:
+            return self._models[key]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # per-key lock so loading spaCy does not block a concurrent embeddings load
+        with key_lock:
+            if key in self._models:
+                return self._models[key]
+            if key in self._errors:
+                return None
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            try:
+                model = loader(name)
+            except Exception as e:
+                self._errors[key] = str(e)
+                logger.warning("Failed to load %s model %s: %s", kind, name, e)
+                return None
+            elapsed = time.perf_counter() - start
+            rss_after = _rss_bytes()
+
+            self._stats[key] = {
+                "kind": kind,
+                "name": name,
+                "load_seconds": round(elapsed, 3),
+                "rss_delta_mb": round((rss_after - rss_before) / (1024 * 1024), 1)
+                if rss_before is not None and rss_after is not None else None,
+            }
+            self._models[key] = model
+            logger.info("Loaded %s model %s in %.2fs", kind, name, elapsed)
+            return model
+
+    def get_embeddings_model(self, name: str = None):
+        """Shared SentenceTransformer, or None when sentence-transformers is unavailable."""
+        def _load(model_name):
+            from sentence_transformers import SentenceTransformer
+            return SentenceTransformer(model_name)
+
+        return self._get("embeddings", name or NLP_CONFIG["embeddings_model"], _load)
+
+    def get_spacy_model(self, name: str = None):
+        """Shared spaCy pipeline, or None when spaCy / the model package is unavailable."""
+        def _load(model_name):
+            import spacy
+            return spacy.load(model_name)
+
+        return self._get("spacy", name or NLP_CONFIG["spacy_model"], _load)
+
+    def stats(self) -> Dict[str, Any]:
+        """Load time and resident memory attributed to each model loaded so far."""
+        rss = _rss_bytes()
+        return {
+            "models": [dict(s) for s in self._stats.values()],
+            "errors": {f"{k[0]}:{k[1]}": v for k, v in self._errors.items()},
+            "process_rss_mb": round(rss / (1024 * 1024), 1) if rss is not None else None,
+        }
+
+    def clear(self):
+        """Drop all cached models (mainly for tests and reloading after config changes)."""
+        with self._lock:
+            self._models.clear()
+            self._errors.clear()
+            self._stats.clear()
+            self._key_locks.clear()
+
+
+_registry = ModelRegistry()
+
+
+def get_registry() -> ModelRegistry:
+    return _registry
+
+
+def get_embeddings_model(name: str = None):
+    return _registry.get_embeddings_model(name)
+
+
+def get_spacy_model(name: str = None):
+    return _registry.get_spacy_model(name)
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from config.settings import NLP_CONFIG, PARSER_CONFIG, PARSE_CACHE_CONFIG
+from backend.cache_store import TieredCache
+from backend.resume_parser import available_readers
+from backend.skill_taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# bump whenever parser output or the cached entry layout changes
+PARSE_CACHE_SCHEMA = 5
+
+
+def content_key(data: Union[bytes, bytearray, memoryview]) -> str:
+    """SHA-256 hex digest of a file's bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_cache_version() -> str:
+    """
+    Stamp of everything process-wide that shapes a cached entry: the schema, PDF engine
+    order and which readers are installed, spaCy model / NLP sections and the compiled
+    taxonomy. Any change starts a fresh key space; old entries are never read again and
+    age out of the disk tier. The extraction mode is per pipeline and goes into each key.
+    """
+    taxonomy = get_taxonomy()
+    parts = {
+        "schema": PARSE_CACHE_SCHEMA,
+        "pdf_engines": PARSER_CONFIG["pdf_engines"],
+        "readers": available_readers(),
+        "spacy_model": NLP_CONFIG["spacy_model"],
+        "nlp_sections": NLP_CONFIG.get("nlp_sections"),
+        "taxonomy": taxonomy.stamp if taxonomy is not None else None,
+    }
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+class ParseCache(TieredCache):
+    """
+    Content-addressed cache of parse + extraction results.
+
+    Entries are keyed by the SHA-256 of the uploaded file, so re-uploads and Streamlit
+    reruns of the same resume skip parsing, extraction and normalization. A bounded LRU
+    sits in front of an optional SQLite tier that is size-capped and shared between
+    processes.
+
+    Entry layout: {"parsed": parse_resume() output, "extracted": [...], "normalized": [...]}
+    Failed parses (parsed["error"] set) are never stored: the failure may be an engine
+    that is missing in this process but installed in the next one.
+    """
+
+    label = "Parse cache"
+
+    def __init__(self, version: str = None, cache_dir: str = None, max_memory_items: int = None,
+                 max_disk_bytes: int = None, persist: bool = None):
+        self.version = version or parse_cache_version()
+        persist = PARSE_CACHE_CONFIG["persist"] if persist is None else persist
+        super().__init__(
+            path=Path(cache_dir or PARSE_CACHE_CONFIG["cache_dir"]) / "parse_cache.sqlite3" if persist else None,
+            max_memory_items=max_memory_items or PARSE_CACHE_CONFIG["max_memory_items"],
+            max_disk_bytes=max_disk_bytes or PARSE_CACHE_CONFIG["max_disk_mb"] * 1024 * 1024,
+        )
+
+    def _key(self, digest: str, mode: str = None) -> str:
+        return f"{self.version}:{mode or NLP_CONFIG.get('extraction_mode', 'spacy')}:{digest}"
+
+    def get(self, digest: str, mode: str = None) -> Optional[Dict[str, Any]]:
+        """Cached entry for a file digest extracted in `mode` (default: the configured mode)"""
+        return super().get(self._key(digest, mode))
+
+    def put(self, digest: str, entry: Dict[str, Any], mode: str = None):
+        if entry["parsed"].get("error"):
+            return
+        super().put(self._key(digest, mode), entry)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"version": self.version, **self.tier_stats()}
+
+
+_cache: Optional[ParseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Process-wide parse cache, or None when disabled in PARSE_CACHE_CONFIG"""
+    global _cache
+    if not PARSE_CACHE_CONFIG["enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParseCache()
+        return _cache
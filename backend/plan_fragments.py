@@ -0,0 +1,190 @@
+import heapq
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.settings import LLM_CACHE_CONFIG, LLM_CONFIG
+from backend.cache_store import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(text: str) -> str:
+    return " ".join(str(text or "").split()).lower()
+
+
+def fragment_key(provider: str, model: str, skill: str, level: str) -> str:
+    return f"{provider}:{model}:{_canonical(skill)}:{_canonical(level)}"
+
+
+class FragmentStore(TieredCache):
+    """
+    Per-(skill, level) plan fragments: the few weeks of a learning plan that cover one
+    skill, generated once per provider/model and reused by every plan that misses it.
+
+    Fragment layout: {"skill", "level", "weeks": [week dicts without numbers/hours],
+    "prerequisites": [...], "latency": seconds the generation took}
+
+    A skill whose generation failed is remembered for a short while (mark_failed), so
+    plans within that window use the fallback block instead of calling the LLM again.
+    """
+
+    label = "Fragment store"
+
+    def __init__(self, cache_dir: str = None, ttl: float = None, max_memory_items: int = None,
+                 max_disk_bytes: int = None, persist: bool = None, failure_ttl: float = None):
+        persist = LLM_CACHE_CONFIG["persist"] if persist is None else persist
+        super().__init__(
+            path=Path(cache_dir or LLM_CACHE_CONFIG["cache_dir"]) / "plan_fragments.sqlite3" if persist else None,
+            max_memory_items=max_memory_items or LLM_CACHE_CONFIG["max_memory_items"] * 4,
+            max_disk_bytes=max_disk_bytes or LLM_CACHE_CONFIG["max_disk_mb"] * 1024 * 1024,
+            ttl=LLM_CACHE_CONFIG["ttl"] if ttl is None else ttl,
+        )
+        self.failure_ttl = LLM_CONFIG["fragment_failure_ttl"] if failure_ttl is None else failure_ttl
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "stores": 0, "failures": 0, "failure_hits": 0, "saved_seconds": 0.0}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored fragment, {"failed": True} for a recent failure, or None"""
+        fragment = super().get(key)
+        with self._lock:
+            if fragment is None:
+                self.counters["misses"] += 1
+            elif fragment.get("failed"):
+                self.counters["failure_hits"] += 1
+            else:
+                self.counters["hits"] += 1
+                self.counters["saved_seconds"] += fragment.get("latency", 0.0)
+        return fragment
+
+    def put(self, key: str, fragment: Dict[str, Any]):
+        super().put(key, fragment)
+        with self._lock:
+            self.counters["stores"] += 1
+
+    def mark_failed(self, key: str):
+        """Remember for failure_ttl seconds that generating this fragment failed"""
+        if self.failure_ttl <= 0:
+            return
+        super().put(key, {"failed": True}, ttl=self.failure_ttl)
+        with self._lock:
+            self.counters["failures"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters.update({
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            "saved_seconds": round(counters["saved_seconds"], 2),
+            **self.tier_stats(),
+        })
+        return counters
+
+
+def fallback_fragment(skill: str, level: str, n_weeks: int = None) -> Dict[str, Any]:
+    """Deterministic fragment used when the LLM cannot produce one (never stored)"""
+    n_weeks = n_weeks or LLM_CONFIG["fragment_weeks"]
+    stages = ["Intro to", "Core concepts of", "Practice:", "Project work with"]
+    weeks = [
+        {
+            "topics": [f"{stages[min(i, len(stages) - 1)]} {skill}", f"{skill} exercises"],
+            "resources": [{"name": f"{skill} tutorial", "type": "video", "url": "", "duration": "30-90m"}],
+            "practice_project": f"Build a small {skill} mini-project",
+            "milestone": f"Understand core {skill} concepts" if i == 0 else f"Apply {skill} in a small project",
+        }
+        for i in range(n_weeks)
+    ]
+    return {"skill": skill, "level": level, "weeks": weeks, "prerequisites": []}
+
+
+def order_skills(skills: List[str], analyzer) -> List[str]:
+    """
+    Skills in learning order: a skill comes after its prerequisites that are also in the
+    list, otherwise higher GapAnalyzer importance first, then the caller's order
+    """
+    position = {_canonical(s): i for i, s in enumerate(skills)}
+    after: Dict[int, List[int]] = {i: [] for i in range(len(skills))}
+    pending = [0] * len(skills)
+    for i, skill in enumerate(skills):
+        for dep in analyzer._get_skill_dependencies(skill):
+            j = position.get(_canonical(dep))
+            if j is not None and j != i:
+                after[j].append(i)
+                pending[i] += 1
+
+    rank = [(-analyzer._importance_of(s), i) for i, s in enumerate(skills)]
+    ready = [rank[i] for i in range(len(skills)) if not pending[i]]
+    heapq.heapify(ready)
+    ordered, done = [], set()
+    while len(ordered) < len(skills):
+        if not ready:
+            # dependency cycle: release the most important remaining skill
+            ready = [min(rank[i] for i in range(len(skills)) if i not in done)]
+        _, i = heapq.heappop(ready)
+        if i in done:
+            continue
+        done.add(i)
+        ordered.append(skills[i])
+        for k in after[i]:
+            pending[k] -= 1
+            if not pending[k] and k not in done:
+                heapq.heappush(ready, rank[k])
+    return ordered
+
+
+def allocate_weeks(skills: List[str], analyzer, available: Dict[str, int], total: int) -> Dict[str, int]:
+    """
+    Weeks per skill: at least one each (most important skills first when there are more
+    skills than weeks), the rest split by importance, never beyond a fragment's length
+    """
+    by_importance = sorted(skills, key=lambda s: -analyzer._importance_of(s))
+    weeks = {s: 0 for s in skills}
+    for skill in by_importance[:total]:
+        weeks[skill] = 1
+    remaining = total - sum(weeks.values())
+    while remaining > 0:
+        open_skills = [s for s in by_importance if 0 < weeks[s] < available[s]]
+        if not open_skills:
+            break
+        # next week goes to the skill with the most importance per week already given
+        skill = max(open_skills, key=lambda s: analyzer._importance_of(s) / weeks[s])
+        weeks[skill] += 1
+        remaining -= 1
+    return weeks
+
+
+def assemble_plan(fragments: Dict[str, Dict[str, Any]], order: List[str], allocation: Dict[str, int],
+                  weekly_hours: int, missing_skills: List[str]) -> Dict[str, Any]:
+    """Numbered plan from the first allocation[skill] weeks of each fragment, in order"""
+    weeks, prerequisites = [], []
+    missing = {_canonical(s) for s in missing_skills}
+    for skill in order:
+        fragment = fragments[skill]
+        for week in fragment["weeks"][:allocation[skill]]:
+            week = dict(week, week=len(weeks) + 1, focus_skill=skill, hours=weekly_hours)
+            weeks.append(week)
+        for prereq in fragment.get("prerequisites") or []:
+            if _canonical(prereq) not in missing and prereq not in prerequisites:
+                prerequisites.append(prereq)
+    return {
+        "weeks": weeks,
+        "prerequisites": prerequisites,
+        "success_metrics": ["Complete weekly milestones", "Build final projects"],
+    }
+
+
+_store: Optional[FragmentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_fragment_store() -> Optional[FragmentStore]:
+    """Process-wide fragment store, or None when LLM caching is disabled"""
+    global _store
+    if not LLM_CACHE_CONFIG["enabled"]:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = FragmentStore()
+        return _store
@@ -0,0 +1,264 @@
+"""
+Offline catalog of learning resources per canonical skill and level.
+
+Resources live in a SQLite store (RESOURCE_CATALOG_CONFIG["db_path"]) seeded from a
+curated JSON file and grown with resources fetched at runtime (e.g. YouTube videos
+found while enriching plans). Lookups go through an in-memory BM25 index partitioned
+by skill, so filling a plan's resources is a dictionary lookup plus a few dozen
+scored documents, with no network on the request path. New resources are appended to
+the index in place (idf is derived from document frequencies at query time); only
+updates to stored resources rebuild it.
+
+    python -m backend.resource_catalog "docker basics" [--skill docker] [--level beginner]
+"""
+import json
+import logging
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import RESOURCE_CATALOG_CONFIG
+from backend.skill_normalizer import SkillNormalizer
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ("beginner", "intermediate", "advanced")
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_FIELDS = ("skill", "level", "title", "url", "type", "duration", "source", "description")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+def _level(level: Optional[str]) -> str:
+    level = (level or "all").strip().lower()
+    return level if level in LEVELS else "all"
+
+
+class ResourceCatalog:
+    """SQLite-backed resource store with a BM25 index kept in memory"""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, db_path: str = None, seed_path: str = None):
+        self.db_path = Path(db_path or RESOURCE_CATALOG_CONFIG["db_path"])
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._normalizer = SkillNormalizer()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS resources ("
+            " id INTEGER PRIMARY KEY, skill TEXT NOT NULL, level TEXT NOT NULL, title TEXT NOT NULL,"
+            " url TEXT NOT NULL UNIQUE, type TEXT, duration TEXT, source TEXT, description TEXT, added REAL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        seed = Path(seed_path or RESOURCE_CATALOG_CONFIG["seed_path"])
+        if seed.exists():
+            self._import_seed(seed)
+        self._build_index()
+
+    def canonical_skill(self, skill: str) -> str:
+        return " ".join(str(self._normalizer.normalize_skill(skill)).split()).lower()
+
+    def _import_seed(self, seed: Path):
+        """(Re)import the curated file when it changed since the last import"""
+        stamp = f"{seed.stat().st_size}:{seed.stat().st_mtime_ns}"
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'seed_stamp'").fetchone()
+        if row and row[0] == stamp:
+            return
+        items = json.loads(seed.read_text(encoding="utf-8")).get("resources", [])
+        n = self.add_resources(items, source="curated", reindex=False)
+        # curated resources that were taken out of the seed go too
+        keep = {item.get("url") for item in items}
+        stored = [r[0] for r in self._conn.execute("SELECT url FROM resources WHERE source = 'curated'")]
+        removed = [(url,) for url in stored if url not in keep]
+        self._conn.executemany("DELETE FROM resources WHERE url = ?", removed)
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('seed_stamp', ?)", (stamp,))
+        logger.info("Imported %d curated resources from %s (%d removed)", n, seed, len(removed))
+
+    def add_resources(self, items: Iterable[Dict], source: str = None, reindex: bool = True) -> int:
+        """
+        Insert or update resources (keyed by url)
+
+        Args:
+            items: Dicts with skill, url, title and optionally level, type, duration, description
+            source: Default provenance for items without one (e.g. "curated", "youtube")
+            reindex: Bring the search index up to date (new urls are appended to it,
+                updated ones trigger a rebuild)
+
+        Returns:
+            Number of resources written
+        """
+        rows = {}
+        for item in items:
+            if not item.get("url") or not item.get("skill"):
+                continue
+            rows[item["url"]] = (
+                self.canonical_skill(item["skill"]), _level(item.get("level")), item.get("title") or item["url"],
+                item["url"], item.get("type") or "article", item.get("duration"),
+                item.get("source") or source, item.get("description"), time.time(),
+            )
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO resources (skill, level, title, url, type, duration, source, description, added)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET skill = excluded.skill, level = excluded.level,"
+                " title = excluded.title, type = excluded.type, duration = excluded.duration,"
+                " source = excluded.source, description = excluded.description",
+                list(rows.values()),
+            )
+            if reindex:
+                if any(url in self._index["urls"] for url in rows):
+                    self._build_index()
+                else:
+                    for row in rows.values():
+                        self._append(dict(zip(_FIELDS, row)))
+        return len(rows)
+
+    def add_videos(self, skill: str, level: str, videos: List[Dict]) -> int:
+        """Keep videos found by a live search so later lookups can serve them offline"""
+        known = self._index["urls"]
+        return self.add_resources(
+            ({"skill": skill, "level": level, "title": v.get("title"), "url": v.get("url"), "type": "video",
+              "description": v.get("channel")} for v in videos or [] if v.get("url") not in known),
+            source="youtube",
+        )
+
+    def _append(self, doc: Dict, index: Dict = None):
+        """
+        Add one document to the index in place. Lists only grow and the counts are
+        updated last, so a concurrent search sees either the old or the new document set.
+        """
+        index = index if index is not None else self._index
+        tf = Counter(_tokens(" ".join(filter(None, (doc["skill"], doc["title"], doc["description"], doc["type"])))))
+        i = len(index["docs"])
+        index["docs"].append(doc)
+        index["term_freqs"].append(tf)
+        index["lengths"].append(sum(tf.values()))
+        index["df"].update(tf.keys())
+        index["by_skill"].setdefault(doc["skill"], []).append(i)
+        index["urls"][doc["url"]] = i
+        index["total_length"] += index["lengths"][i]
+        index["avgdl"] = index["total_length"] / (i + 1)
+        index["n"] = i + 1
+
+    def _build_index(self):
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT {', '.join(_FIELDS)} FROM resources ORDER BY id")
+            index = {
+                "docs": [], "term_freqs": [], "lengths": [], "by_skill": {}, "urls": {},
+                "df": Counter(), "n": 0, "total_length": 0, "avgdl": 0.0,
+            }
+            for row in cursor:
+                self._append(dict(zip(_FIELDS, row)), index)
+            # swapped in as one object so concurrent searches never see a half-built index
+            self._index = index
+
+    def _idf(self, index: Dict, term: str) -> float:
+        n, f = index["n"], index["df"].get(term, 0)
+        return math.log(1 + (n - f + 0.5) / (f + 0.5)) if f else 0.0
+
+    def _bm25(self, index: Dict, idf: Dict[str, float], i: int, avgdl: float) -> float:
+        tf, dl = index["term_freqs"][i], index["lengths"][i]
+        norm = self.K1 * (1 - self.B + self.B * dl / (avgdl or 1))
+        return sum(w * tf[t] * (self.K1 + 1) / (tf[t] + norm) for t, w in idf.items() if t in tf)
+
+    def search(self, query: str, skill: str = None, level: str = None, k: int = 5, types: Iterable[str] = None) -> List[Dict]:
+        """
+        Best resources for a free-text query
+
+        Args:
+            query: Search text
+            skill: Restrict to one skill (normalized like everywhere else)
+            level: Prefer this level; resources for "all" levels rank next, others last
+            k: Number of results
+            types: Only these resource types (e.g. {"video"})
+
+        Returns:
+            Resource dicts with an added "score"
+        """
+        index = self._index
+        docs = index["docs"]
+        n, avgdl = index["n"], index["avgdl"]
+        terms = _tokens(query)
+        # duplicate query terms count once per occurrence, as in the summed BM25 score
+        idf = Counter()
+        for t in terms:
+            idf[t] += self._idf(index, t)
+        level = _level(level) if level else None
+        types = set(types) if types else None
+        if skill is not None:
+            candidates = index["by_skill"].get(self.canonical_skill(skill), [])[:]
+        else:
+            candidates = range(n)
+
+        scored = []
+        for i in candidates:
+            if i >= n:
+                continue  # appended after this search started
+            doc = docs[i]
+            if types and doc["type"] not in types:
+                continue
+            score = self._bm25(index, idf, i, avgdl)
+            if level:
+                score += 2.0 if doc["level"] == level else 1.0 if doc["level"] == "all" else 0.0
+            if skill is not None or score > 0:
+                scored.append((score, i))
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        return [dict(docs[i], score=round(s, 4)) for s, i in scored[:k]]
+
+    def resources_for(self, skill: str, level: str = None, k: int = None, types: Iterable[str] = None) -> List[Dict]:
+        """Top resources for a skill at a level, in the plan's {name, type, url, duration} shape"""
+        k = k or RESOURCE_CATALOG_CONFIG["results_per_week"]
+        hits = self.search(f"{skill} {level or ''}", skill=skill, level=level, k=k, types=types)
+        return [{"name": h["title"], "type": h["type"], "url": h["url"], "duration": h["duration"] or ""} for h in hits]
+
+    def __len__(self) -> int:
+        return self._index["n"]
+
+    def stats(self) -> Dict:
+        index = self._index
+        return {"resources": index["n"], "skills": len(index["by_skill"]), "db_path": str(self.db_path)}
+
+
+_catalog: Optional[ResourceCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_resource_catalog() -> Optional[ResourceCatalog]:
+    """Process-wide catalog, or None when it cannot be opened"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            try:
+                _catalog = ResourceCatalog()
+            except Exception:
+                logger.exception("Resource catalog unavailable")
+                return None
+        return _catalog
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Search the local learning-resource catalog")
+    ap.add_argument("query")
+    ap.add_argument("--skill")
+    ap.add_argument("--level")
+    ap.add_argument("-k", type=int, default=5)
+    args = ap.parse_args()
+    catalog = ResourceCatalog()
+    for hit in catalog.search(args.query, skill=args.skill, level=args.level, k=args.k):
+        print(f"{hit['score']:7.3f}  [{hit['skill']}/{hit['level']}/{hit['type']}] {hit['title']}  {hit['url']}")
+    sys.exit(0)
@@ -1,6 +1,22 @@
+import io
+import logging
+import math
+import multiprocessing
 import re
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from config.settings import PARSER_CONFIG
+from backend.section_segmenter import segment_sections
+
+logger = logging.getLogger(__name__)
 
 # try optional heavy libs
 _pdfplumber = None
@@ -23,66 +39,318 @@ except Exception:
     _fitz = None
 
 
+# a resume given as a path or as the file's bytes
+Source = Union[str, Path, bytes, bytearray, memoryview]
+
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # legacy .doc (and other Office 97-2003 files)
+
+
+def _is_buffer(source) -> bool:
+    return isinstance(source, (bytes, bytearray, memoryview))
+
+
+def detect_format(source: Source) -> Optional[str]:
+    """
+    File format from its leading bytes rather than its name
+
+    Returns:
+        ".pdf", ".docx" or ".doc", or None when the content is none of these
+    """
+    if _is_buffer(source):
+        head = bytes(source[:1024])
+    else:
+        with open(source, "rb") as fh:
+            head = fh.read(1024)
+
+    if b"%PDF-" in head:  # readers accept a little junk before the header
+        return ".pdf"
+    if head.startswith(_OLE_MAGIC):
+        return ".doc"
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(source) if _is_buffer(source) else source) as zf:
+                names = set(zf.namelist())
+        except zipfile.BadZipFile:
+            return None
+        return ".docx" if "word/document.xml" in names else None
+    return None
+
+
+# PDF engines by name: "pymupdf" (fast text path), "pdfplumber" (slower, layout-aware)
+def _engine_available(engine: str) -> bool:
+    return {"pymupdf": _fitz, "pdfplumber": _pdfplumber}.get(engine) is not None
+
+
+@contextmanager
+def _open_pdf(engine: str, source: Source):
+    if engine == "pymupdf":
+        doc = _fitz.open(stream=source, filetype="pdf") if _is_buffer(source) else _fitz.open(source)
+        try:
+            yield doc
+        finally:
+            doc.close()
+    else:
+        with _pdfplumber.open(io.BytesIO(source) if _is_buffer(source) else source) as pdf:
+            yield pdf
+
+
+def _page_count(engine: str, doc) -> int:
+    return len(doc) if engine == "pymupdf" else len(doc.pages)
+
+
+def _page_text(engine: str, doc, index: int) -> Tuple[str, float]:
+    """Text of one page and the seconds it took; a broken page yields empty text"""
+    start = time.perf_counter()
+    try:
+        if engine == "pymupdf":
+            text = doc[index].get_text("text")
+        else:
+            page = doc.pages[index]
+            text = page.extract_text()
+            page.close()  # drop pdfplumber's per-page object cache
+    except Exception:
+        logger.warning("%s could not extract page %d", engine, index + 1, exc_info=True)
+        text = ""
+    return text or "", time.perf_counter() - start
+
+
+def _extract_page_range(engine: str, source: Source, start: int, stop: int) -> List[Tuple[str, float]]:
+    """Process-pool task: (text, seconds) for pages [start, stop)"""
+    with _open_pdf(engine, source) as doc:
+        return [_page_text(engine, doc, i) for i in range(start, stop)]
+
+
+# placeholders returned as the text when no reader could handle the file
+_PDF_UNAVAILABLE = "[PDF parsing not available: install pdfplumber or PyMuPDF in the venv]"
+_DOCX_UNAVAILABLE = "[DOCX parsing not available: install python-docx in the venv]"
+
+
+def available_readers() -> List[str]:
+    """Installed optional readers (PDF engines and the python-docx fallback)"""
+    readers = [e for e in ("pymupdf", "pdfplumber") if _engine_available(e)]
+    return readers + (["python-docx"] if _docx is not None else [])
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide pool for page-parallel extraction, created on first use. Workers are
+    spawned rather than forked: forking a multithreaded host can copy held locks into
+    the child and deadlock it.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context(PARSER_CONFIG["pool_start_method"])
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+# run-level elements that python-docx renders as characters inside paragraph text
+_W_CHARS = {_W + "tab": "\t", _W + "br": "\n", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+
+def _iter_docx_paragraphs(source: Source) -> Iterator[str]:
+    """
+    Stream paragraph texts out of word/document.xml without building a document model.
+
+    Covers body paragraphs, table cells and text boxes (a text box paragraph is yielded
+    before the paragraph that anchors it). mc:Fallback copies of text boxes are skipped,
+    and finished top-level elements are dropped so memory stays bounded on large files.
+    """
+    with zipfile.ZipFile(io.BytesIO(source) if _is_buffer(source) else source) as zf:
+        with zf.open("word/document.xml") as xml:
+            stack: List[List[str]] = []  # open (possibly nested) paragraphs
+            depth, fallback_depth = 0, 0
+            body = None
+            for event, elem in ET.iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    depth += 1
+                    if depth == 2:
+                        body = elem
+                    if tag == _MC_FALLBACK:
+                        fallback_depth += 1
+                    elif tag == _W + "p" and not fallback_depth:
+                        stack.append([])
+                    continue
+
+                depth -= 1
+                if tag == _MC_FALLBACK:
+                    fallback_depth -= 1
+                elif not fallback_depth and stack:
+                    if tag == _W + "t":
+                        stack[-1].append(elem.text or "")
+                    elif tag in _W_CHARS:
+                        stack[-1].append(_W_CHARS[tag])
+                    elif tag == _W + "p":
+                        yield "".join(stack.pop())
+                if depth == 2 and body is not None:
+                    # finished a body-level paragraph / table: free it
+                    elem.clear()
+                    body.remove(elem)
+
+
 class ResumeParser:
     """Extracts text from various resume formats with graceful fallbacks."""
 
-    def __init__(self):
+    def __init__(self, pdf_engines: List[str] = None):
         self.supported_formats = [".pdf", ".docx", ".doc"]
+        # engines tried in order until one opens the file
+        self.pdf_engines = list(pdf_engines or PARSER_CONFIG["pdf_engines"])
+        # {"page", "engine", "seconds"} for every page of the last PDF read by iter_pages
+        self.page_timings: List[Dict] = []
 
     def parse_resume(self, file_path: str) -> Dict[str, str]:
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = detect_format(file_path) or Path(file_path).suffix.lower()
+        return self._parse(file_path, file_ext, Path(file_path).name)
+
+    def parse_bytes(self, data: Union[bytes, bytearray, memoryview], file_name: str = None) -> Dict[str, str]:
+        """
+        Parse a resume held in memory (no temporary file)
+
+        Args:
+            data: File content; a memoryview is handed to the PDF / DOCX readers as is
+            file_name: Original name, reported back and used only if the content is unrecognized
 
+        Returns:
+            Same dict as parse_resume
+        """
+        file_ext = detect_format(data) or (Path(file_name).suffix.lower() if file_name else "")
+        return self._parse(data, file_ext, Path(file_name).name if file_name else "")
+
+    def parse_stream(self, stream: BinaryIO, file_name: str = None) -> Dict[str, str]:
+        """parse_bytes for a file-like object (e.g. a Streamlit UploadedFile or io.BytesIO)"""
+        file_name = file_name or getattr(stream, "name", None)
+        data = stream.getbuffer() if hasattr(stream, "getbuffer") else stream.read()
+        return self.parse_bytes(data, file_name)
+
+    def _parse(self, source: Source, file_ext: str, file_name: str) -> Dict[str, str]:
         if file_ext == ".pdf":
-            text = self._extract_pdf(file_path)
+            text = self._extract_pdf(source)
         elif file_ext in [".docx", ".doc"]:
-            text = self._extract_docx(file_path)
+            text = self._extract_docx(source)
         else:
-            raise ValueError(f"Unsupported file format: {file_ext}")
+            raise ValueError(f"Unsupported file format: {file_ext or 'unknown'}")
 
-        return {"raw_text": text or "", "file_name": Path(file_path).name, "file_format": file_ext}
+        text = text or ""
+        # no reader could open the file: raw_text holds a placeholder, not resume text
+        error = text[1:-1] if text in (_PDF_UNAVAILABLE, _DOCX_UNAVAILABLE) else None
+        return {
+            "raw_text": text,
+            "file_name": file_name,
+            "file_format": file_ext,
+            "sections": segment_sections(text),  # [{name, heading, start, end}] offsets into raw_text
+            "error": error,
+        }
 
-    def _extract_pdf(self, file_path: str) -> str:
-        """Try pdfplumber, then PyMuPDF, otherwise return empty string with warning text."""
-        # pdfplumber preferred
-        if _pdfplumber:
-            try:
-                text = ""
-                with _pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        ptext = page.extract_text()
-                        if ptext:
-                            text += ptext + "\n"
-                return text.strip()
-            except Exception:
-                # fall through to next method
-                pass
+    def iter_pages(self, source: Source, parallel: bool = None) -> Iterator[str]:
+        """
+        Stream the text of a PDF page by page
+
+        Args:
+            source: PDF path or bytes
+            parallel: Spread page ranges over a process pool (default: only for PDFs with
+                at least PARSER_CONFIG["parallel_min_pages"] pages)
+
+        Yields:
+            Page text in page order ("" for pages without text)
+        """
+        self.page_timings = []
+        engines = [e for e in self.pdf_engines if _engine_available(e)]
+        if not engines:
+            raise RuntimeError("No PDF engine available (install PyMuPDF or pdfplumber)")
 
-        # PyMuPDF fallback
-        if _fitz:
+        last_error = None
+        for engine in engines:
+            emitted = 0
             try:
-                doc = _fitz.open(file_path)
-                text = ""
-                for page in doc:
-                    ptext = page.get_text("text")
-                    if ptext:
-                        text += ptext + "\n"
-                return text.strip()
-            except Exception:
-                pass
+                with _open_pdf(engine, source) as doc:
+                    n_pages = _page_count(engine, doc)
+                    workers = PARSER_CONFIG["parallel_workers"]
+                    use_pool = parallel
+                    if use_pool is None:
+                        use_pool = workers > 1 and n_pages >= PARSER_CONFIG["parallel_min_pages"]
+
+                    if use_pool and n_pages > 1:
+                        chunk = max(PARSER_CONFIG["pages_per_task"], math.ceil(n_pages / (workers * 4)))
+                        starts = list(range(0, n_pages, chunk))
+                        stops = [min(s + chunk, n_pages) for s in starts]
+                        # memoryviews cannot be pickled to the workers
+                        task_source = bytes(source) if isinstance(source, memoryview) else source
+                        try:
+                            results = _get_pool(workers).map(
+                                _extract_page_range, repeat(engine), repeat(task_source), starts, stops
+                            )
+                            for page_results in results:
+                                for text, seconds in page_results:
+                                    self.page_timings.append({"page": emitted + 1, "engine": engine, "seconds": seconds})
+                                    emitted += 1
+                                    yield text
+                        except Exception:
+                            # e.g. a broken pool; finish the remaining pages in this process
+                            logger.warning("Parallel PDF extraction failed; continuing serially", exc_info=True)
+                            _reset_pool()
+
+                    for i in range(emitted, n_pages):
+                        text, seconds = _page_text(engine, doc, i)
+                        self.page_timings.append({"page": i + 1, "engine": engine, "seconds": seconds})
+                        emitted += 1
+                        yield text
+                return
+            except Exception as e:
+                if emitted:
+                    raise
+                logger.info("%s could not open the PDF: %s", engine, e)
+                last_error = e
+        raise last_error
+
+    def _extract_pdf(self, source: Source) -> str:
+        """Join the page texts of the first engine (PARSER_CONFIG order) that can open the file."""
+        start = time.perf_counter()
+        try:
+            text = "\n".join(page for page in self.iter_pages(source) if page).strip()
+        except Exception:
+            # Last resort: return an informative placeholder (avoid raising at import)
+            return _PDF_UNAVAILABLE
+
+        if self.page_timings:
+            slowest = max(self.page_timings, key=lambda t: t["seconds"])
+            logger.debug(
+                "Extracted %d pages with %s in %.3fs (slowest: page %d, %.3fs)",
+                len(self.page_timings), self.page_timings[0]["engine"], time.perf_counter() - start,
+                slowest["page"], slowest["seconds"],
+            )
+        return text
 
-        # Last resort: return an informative placeholder (avoid raising at import)
-        return "[PDF parsing not available: install pdfplumber or PyMuPDF in the venv]"
+    def _extract_docx(self, source: Source) -> str:
+        """Extract DOCX text with the streaming XML reader, falling back to python-docx."""
+        try:
+            return "\n".join(_iter_docx_paragraphs(source)).strip()
+        except Exception as e:
+            logger.info("Streaming DOCX reader failed (%s); trying python-docx", e)
 
-    def _extract_docx(self, file_path: str) -> str:
-        """Extract text from DOCX using python-docx if available."""
         if _docx:
             try:
-                doc = _docx.Document(file_path)
+                doc = _docx.Document(io.BytesIO(source) if _is_buffer(source) else source)
                 return "\n".join([para.text for para in doc.paragraphs]).strip()
             except Exception:
                 pass
 
-        return "[DOCX parsing not available: install python-docx in the venv]"
+        return _DOCX_UNAVAILABLE
 
     def extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from resume text"""
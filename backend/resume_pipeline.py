@@ -0,0 +1,122 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.resume_parser import ResumeParser
+from backend.skill_extractor import SkillExtractor
+from backend.skill_normalizer import SkillNormalizer
+from backend.parse_cache import content_key, get_parse_cache
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("parse", "extract", "normalize", "match")
+
+
+class ResumePipeline:
+    """
+    Headless parse -> extract -> normalize -> (optional) template match for one resume.
+
+    Holds one parser / extractor / normalizer (and a matcher, created on first use), so a
+    long-lived process or pool worker loads its models once. Results go through the
+    content-addressed parse cache when it is enabled.
+    """
+
+    def __init__(self, extraction_mode: str = None, use_cache: bool = True):
+        self.parser = ResumeParser()
+        self.extractor = SkillExtractor(mode=extraction_mode)
+        self.normalizer = SkillNormalizer()
+        self._matcher = None
+        self.cache = get_parse_cache() if use_cache else None
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            from backend.skill_matcher import SkillMatcher
+
+            self._matcher = SkillMatcher()
+        return self._matcher
+
+    def process_bytes(self, data: bytes, file_name: str = None, template_key: str = None) -> Dict[str, Any]:
+        """
+        Run the pipeline on a resume held in memory
+
+        Returns:
+            Dict with sha256, parsed (parse_bytes output), extracted, skills (normalized),
+            match (match_template output, only with template_key), cached, error (why no
+            text could be read, else None; nothing is extracted or cached then) and
+            timings (seconds per stage; cache hits skip parse/extract/normalize)
+        """
+        timings = {}
+        digest = content_key(data)
+        entry = self.cache.get(digest, self.extractor.mode) if self.cache else None
+        cached = entry is not None
+        if entry is None:
+            start = time.perf_counter()
+            parsed = self.parser.parse_bytes(data, file_name=file_name)
+            timings["parse"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            extracted = []
+            if parsed.get("error"):
+                logger.warning("Could not read %s: %s", file_name or digest[:12], parsed["error"])
+            else:
+                try:
+                    extracted = self.extractor.extract_skills(parsed["raw_text"], sections=parsed.get("sections"))
+                except Exception:
+                    logger.warning("Skill extraction failed for %s", file_name or digest[:12], exc_info=True)
+            timings["extract"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            normalized = self.normalizer.normalize_skills_list(extracted)
+            timings["normalize"] = time.perf_counter() - start
+
+            entry = {"parsed": parsed, "extracted": extracted, "normalized": normalized}
+            if self.cache:
+                self.cache.put(digest, entry, self.extractor.mode)
+        entry["parsed"]["file_name"] = Path(file_name).name if file_name else ""
+
+        result = {
+            "sha256": digest,
+            "parsed": entry["parsed"],
+            "extracted": entry["extracted"],
+            "skills": entry["normalized"],
+            "cached": cached,
+            "error": entry["parsed"].get("error"),
+        }
+        if template_key:
+            start = time.perf_counter()
+            result["match"] = self.matcher.match_template(entry["normalized"], template_key)
+            timings["match"] = time.perf_counter() - start
+        result["timings"] = timings
+        return result
+
+    def process_file(self, path: str, template_key: str = None) -> Dict[str, Any]:
+        """process_bytes for a file on disk"""
+        path = Path(path)
+        return self.process_bytes(path.read_bytes(), file_name=path.name, template_key=template_key)
+
+
+class StageStats:
+    """Accumulates per-stage seconds and document counts across pipeline results"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.counts: Dict[str, int] = {stage: 0 for stage in STAGES}
+
+    def add(self, timings: Optional[Dict[str, float]]):
+        for stage, seconds in (timings or {}).items():
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """stage -> {docs, seconds, docs_per_sec} (per worker-second of that stage)"""
+        return {
+            stage: {
+                "docs": self.counts[stage],
+                "seconds": round(self.seconds[stage], 3),
+                "docs_per_sec": round(self.counts[stage] / self.seconds[stage], 1) if self.seconds[stage] else 0.0,
+            }
+            for stage in self.seconds
+            if self.counts[stage]
+        }
@@ -0,0 +1,86 @@
+import re
+from typing import Dict, Iterable, List
+
+# canonical section -> heading phrases (lowercase, matched as a whole heading line)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "objective",
+                "career objective", "about me", "about"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "skill set", "skillset",
+               "core competencies", "competencies", "technologies", "technical expertise", "tools",
+               "tools and technologies", "tech stack", "areas of expertise"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience",
+                   "internships", "internship"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "side projects"],
+    "education": ["education", "academic background", "academics", "qualifications",
+                  "educational qualifications", "academic qualifications"],
+    "certifications": ["certifications", "certificates", "licenses", "licenses and certifications",
+                       "courses", "training", "certifications and training"],
+    "awards": ["awards", "honors", "honours", "achievements", "accomplishments", "awards and honors"],
+    "publications": ["publications", "research", "papers"],
+    "languages": ["languages", "spoken languages"],
+    "interests": ["interests", "hobbies", "hobbies and interests", "activities", "extracurricular activities"],
+    "references": ["references", "referees"],
+}
+
+# sections whose text feeds the NLP skill pass by default
+SKILL_SECTIONS = ("summary", "skills", "experience", "projects", "certifications")
+
+_HEADING_TO_SECTION = {h: name for name, heads in SECTION_HEADINGS.items() for h in heads}
+_ALTERNATION = "|".join(sorted((re.escape(h).replace(r"\ ", r"\s+") for h in _HEADING_TO_SECTION), key=len, reverse=True))
+# whole-line heading, optionally bulleted / numbered / underlined with a trailing colon
+_HEADING_LINE = re.compile(rf"^[\s#*•\-–=_\d.]*(?P<h>{_ALTERNATION})[\s:\-–=_]*$", re.IGNORECASE)
+# "Skills: Python, SQL" -- heading and content on one line
+_INLINE_HEADING = re.compile(rf"^[\s#*•\-–\d.]*(?P<h>{_ALTERNATION})\s*[:\-–]\s+\S", re.IGNORECASE)
+_MAX_HEADING_CHARS = 60
+
+
+def _section_for(heading: str) -> str:
+    return _HEADING_TO_SECTION[" ".join(heading.lower().split())]
+
+
+def segment_sections(text: str) -> List[Dict]:
+    """
+    Split resume text into sections by recognizing heading lines
+
+    Returns:
+        Sections in text order as {name, heading, start, end}: text[start:end] spans the
+        heading line and its content. Text before the first heading is a "header" section
+        (usually name and contact details). A repeated heading yields another section.
+    """
+    if not text:
+        return []
+
+    sections: List[Dict] = []
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped and len(stripped) <= _MAX_HEADING_CHARS:
+            match = _HEADING_LINE.match(stripped)
+        else:
+            match = None
+        if match is None and stripped:
+            match = _INLINE_HEADING.match(stripped)
+        if match:
+            if sections:
+                sections[-1]["end"] = pos
+            elif pos and text[:pos].strip():
+                sections.append({"name": "header", "heading": "", "start": 0, "end": pos})
+            sections.append({"name": _section_for(match.group("h")), "heading": stripped, "start": pos, "end": len(text)})
+        pos += len(line)
+
+    if not sections:
+        return [{"name": "header", "heading": "", "start": 0, "end": len(text)}]
+    return sections
+
+
+def sections_text(text: str, sections: List[Dict], names: Iterable[str] = SKILL_SECTIONS) -> str:
+    """
+    Concatenated text of the named sections
+
+    Falls back to the whole text when none of them was found, so unsegmentable
+    resumes are still processed in full.
+    """
+    wanted = set(names)
+    parts = [text[s["start"]:s["end"]] for s in sections or [] if s["name"] in wanted]
+    return "\n".join(parts) if parts else text
@@ -0,0 +1,180 @@
+import re
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from backend.skill_normalizer import SkillNormalizer
+from backend.skill_taxonomy import get_taxonomy
+
+# optional: pyahocorasick builds the automaton in C, which matters for large taxonomies
+try:
+    import ahocorasick as _ahocorasick
+except Exception:
+    _ahocorasick = None
+
+
+_WHITESPACE = str.maketrans({c: " " for c in "\t\n\r\f\v\u00a0"})
+_SPACE_RUN = re.compile(r" {2,}")
+
+
+def _fold(text: str) -> str:
+    """Lowercase with a 1:1 character mapping (so offsets stay valid) and whitespace -> space"""
+    folded = text.lower()
+    if len(folded) != len(text):
+        # a few characters (e.g. "İ") expand when lowercased; fold them one by one
+        folded = "".join(c.lower()[0] for c in text)
+    return folded.translate(_WHITESPACE)
+
+
+def _fold_text(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    _fold plus whitespace runs collapsed to one space, the way patterns are folded.
+    Returns (folded, offsets) where offsets[i] is the index in text of folded[i], or
+    None when nothing was collapsed and the offsets are unchanged.
+    """
+    folded = _fold(text)
+    if "  " not in folded:
+        return folded, None
+    parts: List[str] = []
+    offsets: List[int] = []
+    pos = 0
+    for m in _SPACE_RUN.finditer(folded):
+        keep = m.start() + 1
+        parts.append(folded[pos:keep])
+        offsets.extend(range(pos, keep))
+        pos = m.end()
+    parts.append(folded[pos:])
+    offsets.extend(range(pos, len(folded)))
+    return "".join(parts), offsets
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over skill names and aliases.
+
+    One pass over the text, linear in its length, finds every alias occurrence; matches
+    must sit on word boundaries and overlapping matches resolve leftmost-longest, so
+    "asp.net core" yields "asp.net" rather than ".net". A match never starts right after
+    a word character, even when the alias itself starts with punctuation, so ".net" is
+    not found inside "vb.net". Whitespace runs in the text match a single space in an
+    alias ("Machine   Learning" -> "machine learning").
+    """
+
+    def __init__(self, alias_map: Dict[str, str]):
+        """alias_map: alias (any case) -> canonical skill name"""
+        patterns: Dict[str, str] = {}
+        for alias, canonical in alias_map.items():
+            key = _fold(" ".join(alias.split()))
+            if key:
+                patterns.setdefault(key, canonical)
+        self.size = len(patterns)
+
+        if _ahocorasick is not None:
+            self._automaton = _ahocorasick.Automaton()
+            for key, canonical in patterns.items():
+                self._automaton.add_word(key, (len(key), canonical))
+            if patterns:
+                self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build(patterns)
+
+    def _build(self, patterns: Dict[str, str]):
+        """Pure-Python goto / fail / output tables"""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Optional[Tuple[int, str]]] = [None]
+        for key, canonical in patterns.items():
+            node = 0
+            for ch in key:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    output.append(None)
+                node = nxt
+            output[node] = (len(key), canonical)
+
+        fail = [0] * len(goto)
+        # nearest node on the fail chain that ends a pattern, so reporting skips non-terminals
+        out_link = [0] * len(goto)
+        queue = deque(goto[0].values())  # depth-1 nodes fail to the root
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                out_link[child] = fail[child] if output[fail[child]] else out_link[fail[child]]
+                queue.append(child)
+        self._goto, self._fail, self._output, self._out_link = goto, fail, output, out_link
+
+    def _iter_raw(self, folded: str):
+        """Yield (end_index_inclusive, (length, canonical)) for every pattern occurrence"""
+        if self._automaton is not None:
+            if self.size:
+                yield from self._automaton.iter(folded)
+            return
+        goto, fail, output, out_link = self._goto, self._fail, self._output, self._out_link
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            node = state if output[state] else out_link[state]
+            while node:
+                yield i, output[node]
+                node = out_link[node]
+
+    def find_all(self, text: str) -> List[Dict]:
+        """
+        Skill mentions in text
+
+        Returns:
+            Non-overlapping matches in text order: {skill, alias, start, end} where
+            text[start:end] is the matched surface form and skill its canonical name
+        """
+        if not text or not self.size:
+            return []
+        folded, offsets = _fold_text(text)
+        n = len(folded)
+        candidates = []
+        for end_idx, (length, canonical) in self._iter_raw(folded):
+            start, end = end_idx - length + 1, end_idx + 1
+            if start > 0 and _is_word(folded[start - 1]):
+                continue
+            if _is_word(folded[end - 1]) and end < n and _is_word(folded[end]):
+                continue
+            candidates.append((start, end, canonical))
+
+        # leftmost-longest, non-overlapping
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1]))
+        matches, last_end = [], 0
+        for start, end, canonical in candidates:
+            if start >= last_end:
+                last_end = end
+                if offsets is not None:
+                    start, end = offsets[start], offsets[end - 1] + 1
+                matches.append({"skill": canonical, "alias": text[start:end], "start": start, "end": end})
+        return matches
+
+
+_automaton: Optional[SkillAutomaton] = None
+_automaton_source = None
+_automaton_lock = threading.Lock()
+
+
+def get_skill_automaton() -> SkillAutomaton:
+    """Process-wide automaton over the normalizer's alias map (taxonomy or built-in dictionary)"""
+    global _automaton, _automaton_source
+    taxonomy = get_taxonomy()
+    with _automaton_lock:
+        if _automaton is None or _automaton_source is not taxonomy:
+            _automaton = SkillAutomaton(SkillNormalizer(taxonomy=taxonomy).alias_map)
+            _automaton_source = taxonomy
+        return _automaton
@@ -1,56 +1,131 @@
 # ...existing code...
 import re
-from typing import List, Dict
-
-# lazy flags
-_EMBEDDINGS_AVAILABLE = False
-_SPACY_AVAILABLE = False
-
-try:
-    import spacy
-    from sentence_transformers import SentenceTransformer
-    _SPACY_AVAILABLE = True
-    _EMBEDDINGS_AVAILABLE = True
-except Exception:
-    # allow module to load without heavy libs
-    _SPACY_AVAILABLE = False
-    _EMBEDDINGS_AVAILABLE = False
+from typing import List, Dict, Iterable, Iterator
+
+from config.settings import NLP_CONFIG
+from backend.model_registry import get_embeddings_model, get_spacy_model
+from backend.fuzzy_scoring import score_matrix
+from backend.embedding_cache import encode_cached
+from backend.skill_automaton import get_skill_automaton
+from backend.section_segmenter import segment_sections, sections_text
 
 class SkillExtractor:
     """Extracts skills from resume text using lightweight fallback when heavy libs missing"""
-    def __init__(self, embeddings_model_name: str = "all-MiniLM-L6-v2"):
-        self._embeddings_model_name = embeddings_model_name
-        self.nlp = None
-        self.embeddings_model = None
+    # extraction modes: "spacy" (NER + noun chunks, regex without spaCy),
+    # "dictionary" (taxonomy automaton only), "hybrid" (automaton + spaCy for recall)
+    MODES = ("spacy", "dictionary", "hybrid")
 
-        if _SPACY_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except Exception:
-                self.nlp = None
+    def __init__(self, embeddings_model_name: str = None, mode: str = None):
+        self._embeddings_model_name = embeddings_model_name or NLP_CONFIG["embeddings_model"]
+        self.mode = mode or NLP_CONFIG.get("extraction_mode", "spacy")
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown extraction mode: {self.mode}")
+        # shared, process-wide instances; None when spaCy / sentence-transformers are missing
+        self.nlp = get_spacy_model(NLP_CONFIG["spacy_model"]) if self.mode != "dictionary" else None
+        self.embeddings_model = get_embeddings_model(self._embeddings_model_name)
 
-        if _EMBEDDINGS_AVAILABLE:
-            try:
-                self.embeddings_model = SentenceTransformer(self._embeddings_model_name)
-            except Exception:
-                self.embeddings_model = None
+    def extract_skills(self, text: str, job_skills: List[str] = None, sections: List[Dict] = None) -> List[str]:
+        """
+        Extract skills according to self.mode
 
-    def extract_skills(self, text: str, job_skills: List[str] = None) -> List[str]:
-        """Extract skills: use spaCy NER when available, otherwise regex tokenization"""
+        Args:
+            text: Resume text
+            job_skills: Unused, kept for API compatibility
+            sections: Section map from parse_resume (segmented here when omitted); the
+                NLP pass only reads NLP_CONFIG["nlp_sections"]
+        """
         if not text:
             return []
 
+        if self.mode == "dictionary":
+            return self._dictionary_skills(text)
+        if self.mode == "hybrid":
+            found = self._dictionary_skills(text)
+            if not self.nlp:
+                # without spaCy the regex fallback would only add noise
+                return found
+            seen = {s.lower() for s in found}
+            return found + [c for c in self._nlp_candidates(self._nlp_text(text, sections)) if c.lower() not in seen]
+        return self._nlp_candidates(self._nlp_text(text, sections))
+
+    def _nlp_text(self, text: str, sections: List[Dict] = None) -> str:
+        """The part of the resume worth the NLP pass (addresses, education, references are skipped)"""
+        names = NLP_CONFIG.get("nlp_sections")
+        if not names:
+            return text
+        if sections is None:
+            sections = segment_sections(text)
+        return sections_text(text, sections, names)
+
+    def extract_skills_batch(self, texts: Iterable[str], batch_size: int = None, n_process: int = None) -> Iterator[List[str]]:
+        """
+        extract_skills for many documents, streamed through nlp.pipe
+
+        Args:
+            texts: Resume texts (any iterable; consumed lazily)
+            batch_size: Documents per spaCy batch (default NLP_CONFIG["spacy_batch_size"])
+            n_process: spaCy worker processes (default NLP_CONFIG["spacy_n_process"])
+
+        Yields:
+            One skill list per input text, in input order
+        """
+        if not self.nlp or self.mode == "dictionary":
+            for text in texts:
+                yield self.extract_skills(text)
+            return
+
+        batch_size = batch_size or NLP_CONFIG.get("spacy_batch_size", 64)
+        n_process = n_process or NLP_CONFIG.get("spacy_n_process", 1)
+        # tee the raw text alongside each doc for the hybrid merge (as_tuples keeps order)
+        docs = self.nlp.pipe(
+            ((self._nlp_text(text) if text else "", text) for text in texts),
+            as_tuples=True,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self._disabled_pipes(),
+        )
+        for doc, text in docs:
+            if not text:
+                yield []
+                continue
+            candidates = self._candidates_from_doc(doc)
+            if self.mode == "hybrid":
+                found = self._dictionary_skills(text)
+                seen = {s.lower() for s in found}
+                yield found + [c for c in candidates if c.lower() not in seen]
+            else:
+                yield candidates
+
+    def extract_skill_mentions(self, text: str) -> List[Dict]:
+        """Canonical skills found by the taxonomy automaton, with character offsets"""
+        return get_skill_automaton().find_all(text or "")
+
+    def _dictionary_skills(self, text: str) -> List[str]:
+        """Unique canonical skills in order of first mention"""
+        return list(dict.fromkeys(m["skill"] for m in self.extract_skill_mentions(text)))
+
+    def _disabled_pipes(self) -> List[str]:
+        """Pipeline components that entity / noun-chunk extraction does not use"""
+        unused = NLP_CONFIG.get("spacy_disable", [])
+        return [name for name in self.nlp.pipe_names if name in unused]
+
+    def _nlp_candidates(self, text: str) -> List[str]:
+        """Use spaCy NER when available, otherwise regex tokenization"""
         if self.nlp:
-            doc = self.nlp(text)
-            ents = [ent.text for ent in doc.ents if ent.label_ in ("ORG", "PRODUCT", "NORP", "TECHNOLOGY")]
-            # also fallback to noun chunks
-            noun_chunks = [chunk.text for chunk in doc.noun_chunks]
-            candidates = set(ents + noun_chunks)
-        else:
-            # simple fallback: collect capitalized words and common skill tokens
-            tokens = re.findall(r"[A-Za-z+#\.\+]{2,}", text)
-            candidates = set([t for t in tokens if len(t) <= 30])
+            return self._candidates_from_doc(self.nlp(text, disable=self._disabled_pipes()))
+
+        # simple fallback: collect capitalized words and common skill tokens
+        tokens = re.findall(r"[A-Za-z+#\.\+]{2,}", text)
+        return self._clean_candidates(set([t for t in tokens if len(t) <= 30]))
 
+    def _candidates_from_doc(self, doc) -> List[str]:
+        ents = [ent.text for ent in doc.ents if ent.label_ in ("ORG", "PRODUCT", "NORP", "TECHNOLOGY")]
+        # also fallback to noun chunks
+        noun_chunks = [chunk.text for chunk in doc.noun_chunks]
+        return self._clean_candidates(set(ents + noun_chunks))
+
+    @staticmethod
+    def _clean_candidates(candidates) -> List[str]:
         # simple dedupe and clean
         skills = [c.strip() for c in candidates if len(c.strip()) > 1]
         return sorted(list(set(skills)), key=lambda s: -len(s))  # prefer longer phrases first
@@ -60,8 +135,6 @@ class SkillExtractor:
         If embeddings available use semantic matching, otherwise do a conservative exact / fuzzy match.
         Returns dict with matched/weak/missing.
         """
-        from rapidfuzz import fuzz
-
         if not job_skills:
             return {"matched": [], "weak_match": [], "missing": []}
 
@@ -73,8 +146,8 @@ class SkillExtractor:
         if self.embeddings_model:
             try:
                 import numpy as np
-                ext_emb = self.embeddings_model.encode(extracted_skills, convert_to_numpy=True) if extracted_skills else np.array([])
-                job_emb = self.embeddings_model.encode(job_skills, convert_to_numpy=True)
+                ext_emb = encode_cached(self.embeddings_model, extracted_skills, self._embeddings_model_name) if extracted_skills else np.array([])
+                job_emb = encode_cached(self.embeddings_model, job_skills, self._embeddings_model_name)
                 for i, job_skill in enumerate(job_skills):
                     if ext_emb.size == 0:
                         break
@@ -90,15 +163,13 @@ class SkillExtractor:
             except Exception:
                 pass
 
-        # fallback fuzzy matching for any unmatched job skills
-        for job_skill in missing.copy():
-            best = None
-            best_score = 0
-            for s in extracted_skills:
-                score = fuzz.token_set_ratio(s.lower(), job_skill.lower())
-                if score > best_score:
-                    best_score = score
-                    best = s
+        # fallback fuzzy matching for any unmatched job skills, scored as one matrix
+        pending = missing.copy() if extracted_skills else []
+        scores = score_matrix(pending, extracted_skills, scorer="token_set_ratio")
+        for row, job_skill in enumerate(pending):
+            best_idx = int(scores[row].argmax())
+            best_score = float(scores[row, best_idx])
+            best = extracted_skills[best_idx]
             if best_score >= 85:
                 matched.append({"job_skill": job_skill, "resume_skill": best, "score": best_score})
                 missing.remove(job_skill)
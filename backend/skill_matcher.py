@@ -117,68 +117,182 @@
 #         }
 
 # ...existing code...
-from rapidfuzz import fuzz
 from typing import List, Dict, Tuple
+import numpy as np
 
-# lazy import for embeddings
-try:
-    from sentence_transformers import SentenceTransformer
-    import numpy as np
-    _EMBEDDINGS_OK = True
-except Exception:
-    _EMBEDDINGS_OK = False
+from config.settings import NLP_CONFIG
+from backend.model_registry import get_embeddings_model
+from backend.fuzzy_scoring import score_matrix
+from backend.embedding_cache import encode_normalized
+from backend.template_index import get_template_index
 
 class SkillMatcher:
     """Matches extracted skills with job requirements using fuzzy or semantic matching if available."""
-    def __init__(self, embeddings_model_name: str = "all-MiniLM-L6-v2"):
-        self.embeddings_model = None
-        if _EMBEDDINGS_OK:
-            try:
-                self.embeddings_model = SentenceTransformer(embeddings_model_name)
-            except Exception:
-                self.embeddings_model = None
+    def __init__(self, embeddings_model_name: str = None):
+        self._embeddings_model_name = embeddings_model_name or NLP_CONFIG["embeddings_model"]
+        # shared, process-wide instance; None when sentence-transformers is missing
+        self.embeddings_model = get_embeddings_model(self._embeddings_model_name)
+
+    def _encode_normalized(self, texts: List[str]) -> np.ndarray:
+        """Encode texts (cache misses only, in one batch) and L2-normalize rows so dot products are cosine similarities"""
+        return encode_normalized(self.embeddings_model, texts, self._embeddings_model_name)
+
+    def fuzzy_matrix(self, skills: List[str], job_skills: List[str]) -> np.ndarray:
+        """token_set_ratio scores, shape (len(skills), len(job_skills))"""
+        return score_matrix(skills, job_skills, scorer="token_set_ratio")
+
+    def semantic_matrix(self, skills: List[str], job_skills: List[str], job_embeddings: np.ndarray = None):
+        """
+        Cosine similarities, shape (len(skills), len(job_skills)); None when embeddings are unavailable
+
+        job_embeddings: optional precomputed, L2-normalized rows for job_skills (e.g. from TemplateIndex)
+        """
+        if not self.embeddings_model or not skills or not job_skills:
+            return None
+        try:
+            # each side is encoded exactly once, then a single matrix product
+            if job_embeddings is None:
+                job_embeddings = self._encode_normalized(job_skills)
+            return self._encode_normalized(skills) @ job_embeddings.T
+        except Exception:
+            return None
 
     def fuzzy_match(self, skill: str, job_skills: List[str], threshold: int = 80) -> Tuple[str, int]:
         if not job_skills:
             return (None, 0)
-        best_match, best_score = None, 0
-        for js in job_skills:
-            score = fuzz.token_set_ratio(skill.lower(), js.lower())
-            if score > best_score:
-                best_score, best_match = score, js
-        return (best_match, best_score) if best_score >= threshold else (None, best_score)
+        scores = self.fuzzy_matrix([skill], job_skills)[0]
+        best_idx = int(np.argmax(scores))
+        best_score = float(scores[best_idx])
+        return (job_skills[best_idx], best_score) if best_score >= threshold else (None, best_score)
 
     def semantic_match(self, skill: str, job_skills: List[str], threshold: float = 0.7) -> Tuple[str, float]:
-        if not self.embeddings_model or not job_skills:
-            return (None, 0.0)
-        try:
-            skill_emb = self.embeddings_model.encode(skill, convert_to_numpy=True)
-            job_embs = self.embeddings_model.encode(job_skills, convert_to_numpy=True)
-            sims = np.dot(job_embs, skill_emb) / (np.linalg.norm(job_embs, axis=1) * np.linalg.norm(skill_emb) + 1e-10)
-            best_idx = int(np.argmax(sims))
-            best_score = float(sims[best_idx])
-            return (job_skills[best_idx], best_score) if best_score >= threshold else (None, best_score)
-        except Exception:
+        sims = self.semantic_matrix([skill], job_skills)
+        if sims is None:
             return (None, 0.0)
+        best_idx = int(np.argmax(sims[0]))
+        best_score = float(sims[0, best_idx])
+        return (job_skills[best_idx], best_score) if best_score >= threshold else (None, best_score)
+
+    def match_template(self, extracted_skills: List[str], template_key: str, index=None) -> Dict:
+        """match_all_skills against a job template, reusing its precomputed embeddings"""
+        index = index or get_template_index()
+        entry = index.get(template_key, with_embeddings=self.embeddings_model is not None)
+        if not entry:
+            return self.match_all_skills(extracted_skills, [])
+        return self.match_all_skills(extracted_skills, entry["required_skills"], job_embeddings=entry["required_embeddings"])
+
+    def rank_job_templates(self, extracted_skills: List[str], top_k: int = None, index=None) -> List[Dict]:
+        """
+        Score a resume against every job template in one batched pass
 
-    def match_all_skills(self, extracted_skills: List[str], job_skills: List[str]) -> Dict:
+        All templates' required skills are scored as one block (a single fuzzy cdist and,
+        when embeddings are available, one encode of the resume plus one matrix product);
+        each template's slice of the matrices then gets the same per-skill decisions as
+        match_all_skills, so match_percentage agrees with match_template.
+
+        Args:
+            extracted_skills: Skills from resume
+            top_k: Only return the best k templates
+            index: TemplateIndex to rank against (defaults to the shared one)
+
+        Returns:
+            Templates sorted by match_percentage (share of required skills covered)
+        """
+        index = index or get_template_index()
+        block = index.required_block(with_embeddings=self.embeddings_model is not None)
+        keys, skills, counts, offsets = block["keys"], block["skills"], block["counts"], block["offsets"]
+        if not keys:
+            return []
+
+        titles = block["titles"]
+        fuzzy = semantic = None
+        if extracted_skills:
+            fuzzy = self.fuzzy_matrix(extracted_skills, skills)
+            if block["embeddings"] is not None:
+                semantic = self.semantic_matrix(extracted_skills, skills, block["embeddings"])
+            best_s = semantic.max(axis=0) if semantic is not None else np.zeros(len(skills))
+        else:
+            best_s = np.zeros(len(skills))
+
+        mean_sim = np.add.reduceat(best_s.astype(np.float64), offsets) / counts
+
+        ranked = []
+        for t, key in enumerate(keys):
+            start, end = offsets[t], offsets[t] + counts[t]
+            covered, n_weak = set(), 0
+            if extracted_skills:
+                # per template, the same per-skill decisions match_all_skills makes
+                decision = self._decide(fuzzy[:, start:end], semantic[:, start:end] if semantic is not None else None)
+                covered = decision["covered"]
+                n_weak = int(decision["is_weak"].sum())
+            ranked.append({
+                "template": key,
+                "title": titles[t],
+                "match_percentage": self._coverage(len(covered), int(counts[t])),
+                "matched": len(covered),
+                "weak": n_weak,
+                "total_required": int(counts[t]),
+                "mean_similarity": round(float(mean_sim[t]), 4),
+                "missing_skills": [skills[start + j] for j in range(int(counts[t])) if j not in covered],
+            })
+        ranked.sort(key=lambda r: (r["match_percentage"], r["mean_similarity"]), reverse=True)
+        return ranked[:top_k] if top_k else ranked
+
+    @staticmethod
+    def _coverage(n_covered: int, n_required: int) -> float:
+        """match_percentage: share of required skills covered by a strong (fuzzy or semantic) match"""
+        return round(n_covered / n_required * 100, 2) if n_required else 0
+
+    @staticmethod
+    def _decide(fuzzy: np.ndarray, semantic) -> Dict:
+        """
+        Per resume skill (row): best fuzzy / semantic job skill (column) and whether it is a
+        strong fuzzy, semantic or weak match, plus the set of columns strongly matched
+        """
+        rows = np.arange(fuzzy.shape[0])
+        f_idx = fuzzy.argmax(axis=1)
+        f_best = fuzzy[rows, f_idx]
+        if semantic is None:
+            s_idx = np.zeros(fuzzy.shape[0], dtype=int)
+            s_best = np.zeros(fuzzy.shape[0], dtype=np.float32)
+        else:
+            s_idx = semantic.argmax(axis=1)
+            s_best = semantic[rows, s_idx]
+
+        # same decision order as before: strong fuzzy, then semantic, then weak
+        is_fuzzy = f_best >= 80
+        is_semantic = ~is_fuzzy & (s_best >= 0.65)
+        is_weak = ~is_fuzzy & ~is_semantic & ((f_best >= 60) | (s_best >= 0.5))
+        covered = {int(j) for j in f_idx[is_fuzzy]} | {int(j) for j in s_idx[is_semantic]}
+        return {
+            "f_idx": f_idx, "f_best": f_best, "s_idx": s_idx, "s_best": s_best,
+            "is_fuzzy": is_fuzzy, "is_semantic": is_semantic, "is_weak": is_weak, "covered": covered,
+        }
+
+    def match_all_skills(self, extracted_skills: List[str], job_skills: List[str], job_embeddings: np.ndarray = None) -> Dict:
         matched = []
         weak_matches = []
         missing = job_skills.copy()
 
-        for s in extracted_skills:
-            f_match, f_score = self.fuzzy_match(s, job_skills, threshold=75)
-            sem_match, sem_score = self.semantic_match(s, job_skills, threshold=0.65)
+        if extracted_skills and job_skills:
+            fuzzy = self.fuzzy_matrix(extracted_skills, job_skills)
+            semantic = self.semantic_matrix(extracted_skills, job_skills, job_embeddings)
+            d = self._decide(fuzzy, semantic)
+            has_f_match = d["f_best"] >= 75
 
-            if f_match and f_score >= 80:
-                matched.append({"skill": s, "matched_to": f_match, "score": f_score, "method": "fuzzy"})
-                if f_match in missing: missing.remove(f_match)
-            elif sem_match and sem_score >= 0.65:
-                matched.append({"skill": s, "matched_to": sem_match, "score": sem_score, "method": "semantic"})
-                if sem_match in missing: missing.remove(sem_match)
-            elif f_score >= 60 or sem_score >= 0.5:
-                weak_matches.append({"skill": s, "potential_match": f_match or sem_match, "fuzzy_score": f_score, "semantic_score": sem_score})
+            for i in np.flatnonzero(d["is_fuzzy"] | d["is_semantic"] | d["is_weak"]):
+                s = extracted_skills[i]
+                f_score, sem_score = float(d["f_best"][i]), float(d["s_best"][i])
+                if d["is_fuzzy"][i]:
+                    matched.append({"skill": s, "matched_to": job_skills[d["f_idx"][i]], "score": f_score, "method": "fuzzy"})
+                elif d["is_semantic"][i]:
+                    matched.append({"skill": s, "matched_to": job_skills[d["s_idx"][i]], "score": sem_score, "method": "semantic"})
+                else:
+                    potential = job_skills[d["f_idx"][i]] if has_f_match[i] else None
+                    weak_matches.append({"skill": s, "potential_match": potential, "fuzzy_score": f_score, "semantic_score": sem_score})
+            missing = [js for j, js in enumerate(job_skills) if j not in d["covered"]]
 
-        match_percentage = round((len(matched) / len(job_skills) * 100), 2) if job_skills else 0
+        # share of required skills covered (several resume skills can match the same one)
+        match_percentage = self._coverage(len(job_skills) - len(missing), len(job_skills))
         return {"matched": matched, "weak_matches": weak_matches, "missing": missing, "match_percentage": match_percentage}
-# ...existing code...
\ No newline at end of file
+# ...existing code...
@@ -1,15 +1,17 @@
 from typing import List, Dict
-try:
-    from rapidfuzz import fuzz
-    _HAS_RAPIDFUZZ = True
-except Exception:
-    _HAS_RAPIDFUZZ = False
-    from difflib import SequenceMatcher
+
+from config.settings import NLP_CONFIG
+from backend.cache_store import LRUCache
+from backend.fuzzy_scoring import extract_best
+from backend.skill_taxonomy import get_taxonomy
 
 class SkillNormalizer:
     """Normalizes and standardizes skill names with graceful fallback if rapidfuzz missing"""
     
-    def __init__(self):
+    def __init__(self, taxonomy=None):
+        # the compiled skill taxonomy drives normalization; the built-in dictionary
+        # below is only used when no taxonomy file is available
+        self.taxonomy = taxonomy if taxonomy is not None else get_taxonomy()
         self.skill_dictionary = {
             "python": ["py", "python 3", "python3", "anaconda"],
             "javascript": ["js", "node.js", "nodejs", "react", "vue"],
@@ -39,52 +41,106 @@ class SkillNormalizer:
             "jira": ["agile", "scrum", "kanban"],
             "jenkins": ["ci/cd", "continuous integration"],
         }
+        self.skill_categories = {
+            "programming_languages": ["python", "javascript", "java", "sql", "cpp", "csharp"],
+            "web_frameworks": ["react", "angular", "html", "css", "vue"],
+            "cloud_platforms": ["aws", "gcp", "azure"],
+            "devops": ["docker", "kubernetes", "jenkins", "git"],
+            "databases": ["mongodb", "redis", "elasticsearch", "sql"],
+            "ml_ai": ["machine learning", "tensorflow", "pytorch", "scikit-learn"],
+            "testing": ["pytest", "junit"],
+        }
+        self._compile()
     
-    def _fuzzy_score(self, a: str, b: str) -> float:
-        if _HAS_RAPIDFUZZ:
-            return fuzz.ratio(a, b)
+    def _compile(self):
+        """
+        Compile the taxonomy (or skill_dictionary) into lookup structures:
+        alias -> canonical hash map (canonical names win over aliases, then dictionary order),
+        a flattened lowercase alias array for the fuzzy fallback, and a skill -> category index.
+
+        The fuzzy array lists each skill's aliases followed by its name, skill by skill in
+        dictionary order, so taking its first entry that scores >= 85 gives the same answer
+        as walking the dictionary and returning on the first close alias.
+        """
+        self._flat_aliases: List[str] = []
+        self._flat_canonical: List[str] = []
+        if self.taxonomy is not None and len(self.taxonomy):
+            self._alias_map: Dict[str, str] = self.taxonomy.alias_map()
+            self._category_index: Dict[str, str] = self.taxonomy.category_map()
+            for i, standard_skill in enumerate(self.taxonomy.names()):
+                if not self.taxonomy.normalizes(i):
+                    continue
+                for alias in self.taxonomy.aliases(i) + [standard_skill]:
+                    self._flat_aliases.append(alias)
+                    self._flat_canonical.append(standard_skill)
         else:
-            return int(SequenceMatcher(None, a, b).ratio() * 100)
+            self._alias_map = {}
+            for standard_skill in self.skill_dictionary:
+                self._alias_map[standard_skill.lower()] = standard_skill
+            for standard_skill, aliases in self.skill_dictionary.items():
+                for alias in aliases:
+                    self._alias_map.setdefault(alias.lower(), standard_skill)
+                for alias in aliases + [standard_skill]:
+                    self._flat_aliases.append(alias.lower())
+                    self._flat_canonical.append(standard_skill)
+
+            self._category_index = {}
+            for category, skills_list in self.skill_categories.items():
+                for s in skills_list:
+                    self._category_index.setdefault(s, category)
+
+
+        self._memo = LRUCache(NLP_CONFIG.get("normalizer_memo_size", 10_000))
+    
+    def _normalize_many(self, skills: List[str]) -> List[str]:
+        """
+        Normalize a batch: memo, then O(1) exact lookups, then one bulk fuzzy pass for the rest.
+
+        The fuzzy pass keeps the first dictionary entry scoring >= 85, not the best-scoring
+        one. Exact aliases are resolved before any fuzzy match, so an exact alias of a later
+        skill wins over a merely close alias of an earlier one.
+        """
+        out: List[str] = [None] * len(skills)
+        pending: Dict[str, List[int]] = {}
+        for i, skill in enumerate(skills):
+            cached = self._memo.get(skill)
+            if cached is not None:
+                out[i] = cached
+                continue
+            stripped = skill.strip()
+            exact = self._alias_map.get(stripped.lower())
+            if exact is not None:
+                out[i] = exact
+                self._memo.put(skill, exact)
+            else:
+                pending.setdefault(skill, []).append(i)
+
+        if pending:
+            queries = list(pending)
+            best = extract_best([q.strip() for q in queries], self._flat_aliases, scorer="ratio", score_cutoff=85, first=True)
+            for query, hit in zip(queries, best):
+                result = self._flat_canonical[hit[0]] if hit else query.strip()
+                self._memo.put(query, result)
+                for i in pending[query]:
+                    out[i] = result
+        return out
+    
+    @property
+    def alias_map(self) -> Dict[str, str]:
+        """Lowercase name or alias -> canonical skill"""
+        return self._alias_map
     
     def normalize_skill(self, skill: str) -> str:
-        skill_lower = skill.lower().strip()
-        if skill_lower in self.skill_dictionary:
-            return skill_lower
-        # check aliases
-        for standard_skill, aliases in self.skill_dictionary.items():
-            # exact alias match
-            for alias in aliases:
-                if skill_lower == alias:
-                    return standard_skill
-            # fuzzy match using available method
-            for alias in aliases + [standard_skill]:
-                score = self._fuzzy_score(skill_lower, alias)
-                if score >= 85:
-                    return standard_skill
-        return skill.strip()
+        return self._normalize_many([skill])[0]
     
     def normalize_skills_list(self, skills: List[str]) -> List[str]:
         normalized = []
         seen = set()
-        for skill in skills:
-            normalized_skill = self.normalize_skill(skill)
+        for normalized_skill in self._normalize_many(list(skills)):
             if normalized_skill not in seen:
                 normalized.append(normalized_skill)
                 seen.add(normalized_skill)
         return normalized
     
     def get_skill_category(self, skill: str) -> str:
-        categories = {
-            "programming_languages": ["python", "javascript", "java", "sql", "cpp", "csharp"],
-            "web_frameworks": ["react", "angular", "html", "css", "vue"],
-            "cloud_platforms": ["aws", "gcp", "azure"],
-            "devops": ["docker", "kubernetes", "jenkins", "git"],
-            "databases": ["mongodb", "redis", "elasticsearch", "sql"],
-            "ml_ai": ["machine learning", "tensorflow", "pytorch", "scikit-learn"],
-            "testing": ["pytest", "junit"],
-        }
-        normalized = self.normalize_skill(skill)
-        for category, skills_list in categories.items():
-            if normalized in skills_list:
-                return category
-        return "other"
\ No newline at end of file
+        return self._category_index.get(self.normalize_skill(skill), "other")
\ No newline at end of file
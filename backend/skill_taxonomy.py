@@ -0,0 +1,317 @@
+"""
+Skill taxonomy: canonical skills with aliases, categories, importance weights and prerequisites.
+
+The source of truth is a JSON file (SKILL_TAXONOMY_PATH):
+
+    {"skills": [{"name": "kubernetes", "aliases": ["k8s"], "category": "devops",
+                 "importance": 8, "prerequisites": ["docker"]}, ...]}
+
+A skill marked "normalize": false only carries importance / prerequisite data for the gap
+analysis; it is left out of alias_map(), so the normalizer and the extractor never map a
+resume skill onto it.
+
+It is compiled into one flat binary file next to it (".bin") made of a UTF-8 string table
+and integer / float arrays. Loading is a single mmap with zero-copy numpy views, so it takes
+milliseconds even for tens of thousands of skills, and every worker process maps the same
+read-only pages. The binary is rebuilt automatically when the JSON's size or mtime changes.
+
+    python -m backend.skill_taxonomy [taxonomy.json]   # compile ahead of deployment
+"""
+import json
+import logging
+import mmap
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config.settings import SKILL_TAXONOMY_PATH
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"SKTAXv1\0"
+_ALIGN = 8
+_NO_NORMALIZE = 1  # skill_flags bit
+
+
+def _compile_bytes(source: Dict, stamp: Dict) -> bytes:
+    """Serialize a parsed taxonomy JSON into the binary layout"""
+    entries = [s for s in source.get("skills", []) if s.get("name")]
+    names = [str(s["name"]).strip().lower() for s in entries]
+    skill_index = {n: i for i, n in enumerate(names)}
+    categories = sorted({s["category"] for s in entries if s.get("category")})
+    category_index = {c: i for i, c in enumerate(categories)}
+
+    strings: List[bytes] = []
+    string_ids: Dict[str, int] = {}
+
+    def sid(text: str) -> int:
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text.encode("utf-8"))
+        return string_ids[text]
+
+    skill_name = np.array([sid(n) for n in names], dtype=np.int32)
+    skill_category = np.array([category_index.get(s.get("category"), -1) for s in entries], dtype=np.int32)
+    skill_importance = np.array(
+        [float(s["importance"]) if s.get("importance") is not None else np.nan for s in entries],
+        dtype=np.float32,
+    )
+    skill_flags = np.array([0 if s.get("normalize", True) else _NO_NORMALIZE for s in entries], dtype=np.uint8)
+
+    alias_ids, alias_offsets = [], [0]
+    prereq_ids, prereq_offsets = [], [0]
+    for s in entries:
+        for alias in s.get("aliases", []) or []:
+            alias_ids.append(sid(str(alias).strip().lower()))
+        alias_offsets.append(len(alias_ids))
+        for p in s.get("prerequisites", []) or []:
+            target = skill_index.get(str(p).strip().lower())
+            if target is None:
+                logger.warning("Taxonomy: unknown prerequisite %r of %r", p, s["name"])
+                continue
+            prereq_ids.append(target)
+        prereq_offsets.append(len(prereq_ids))
+
+    string_offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    string_offsets[1:] = np.cumsum([len(b) for b in strings]) if strings else []
+
+    arrays = {
+        "strings": np.frombuffer(b"".join(strings), dtype=np.uint8),
+        "string_offsets": string_offsets,
+        "skill_name": skill_name,
+        "skill_category": skill_category,
+        "skill_importance": skill_importance,
+        "skill_flags": skill_flags,
+        "alias_offsets": np.array(alias_offsets, dtype=np.int32),
+        "alias_ids": np.array(alias_ids, dtype=np.int32),
+        "prereq_offsets": np.array(prereq_offsets, dtype=np.int32),
+        "prereq_ids": np.array(prereq_ids, dtype=np.int32),
+    }
+
+    # header offsets are relative to the start of the data area
+    sections, pos = {}, 0
+    for name, arr in arrays.items():
+        sections[name] = [arr.dtype.str, pos, int(arr.size)]
+        pos += -(-arr.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps({
+        "stamp": stamp,
+        "default_importance": source.get("default_importance", 5),
+        "categories": categories,
+        "sections": sections,
+    }).encode("utf-8")
+    header += b" " * (-(len(_MAGIC) + 8 + len(header)) % _ALIGN)
+
+    parts = [_MAGIC, np.uint64(len(header)).tobytes(), header]
+    for arr in arrays.values():
+        raw = arr.tobytes()
+        parts.append(raw + b"\0" * (-len(raw) % _ALIGN))
+    return b"".join(parts)
+
+
+def _weight(value: float):
+    """Importance as stored in the JSON: None if absent, int when integral"""
+    if np.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+
+class SkillTaxonomy:
+    """Read-only view over a compiled taxonomy buffer (an mmap or in-memory bytes)"""
+
+    def __init__(self, buffer, source_path: str = None):
+        if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("Not a compiled skill taxonomy")
+        self.source_path = source_path
+        self._buffer = buffer
+        header_len = int(np.frombuffer(buffer, dtype=np.uint64, count=1, offset=len(_MAGIC))[0])
+        data_start = len(_MAGIC) + 8 + header_len
+        header = json.loads(bytes(buffer[len(_MAGIC) + 8:data_start]).decode("utf-8"))
+        self.stamp = header["stamp"]
+        self.default_importance = header.get("default_importance", 5)
+        self.category_names: List[str] = header["categories"]
+        self._a = {
+            name: np.frombuffer(buffer, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+            for name, (dtype, offset, count) in header["sections"].items()
+        }
+        self._lock = threading.Lock()
+        self._strings: Optional[List[str]] = None
+        self._lookup: Optional[Dict[str, int]] = None
+        self._alias_map: Optional[Dict[str, str]] = None
+
+    def __len__(self) -> int:
+        return int(self._a["skill_name"].size)
+
+    def _string(self, string_id: int) -> str:
+        if self._strings is not None:
+            return self._strings[string_id]
+        offs = self._a["string_offsets"]
+        return self._a["strings"][offs[string_id]:offs[string_id + 1]].tobytes().decode("utf-8")
+
+    def _all_strings(self) -> List[str]:
+        """Decode the whole string table once (needed for alias maps / fuzzy arrays)"""
+        if self._strings is None:
+            blob = self._a["strings"].tobytes()
+            offs = self._a["string_offsets"].tolist()
+            self._strings = [blob[offs[i]:offs[i + 1]].decode("utf-8") for i in range(len(offs) - 1)]
+        return self._strings
+
+    def name(self, i: int) -> str:
+        return self._string(int(self._a["skill_name"][i]))
+
+    def names(self) -> List[str]:
+        strings = self._all_strings()
+        return [strings[s] for s in self._a["skill_name"].tolist()]
+
+    def aliases(self, i: int) -> List[str]:
+        offs = self._a["alias_offsets"]
+        return [self._string(int(s)) for s in self._a["alias_ids"][offs[i]:offs[i + 1]]]
+
+    def category(self, i: int) -> Optional[str]:
+        c = int(self._a["skill_category"][i])
+        return self.category_names[c] if c >= 0 else None
+
+    def importance(self, i: int) -> Optional[float]:
+        return _weight(float(self._a["skill_importance"][i]))
+
+    def normalizes(self, i: int) -> bool:
+        """False for skills kept out of normalization ("normalize": false)"""
+        flags = self._a.get("skill_flags")
+        return flags is None or not int(flags[i]) & _NO_NORMALIZE
+
+    def prerequisites(self, i: int) -> List[str]:
+        offs = self._a["prereq_offsets"]
+        return [self.name(int(j)) for j in self._a["prereq_ids"][offs[i]:offs[i + 1]]]
+
+    def _get_lookup(self) -> Dict[str, int]:
+        """Lowercase name or alias -> skill index (names win over aliases, then file order)"""
+        if self._lookup is None:
+            with self._lock:
+                if self._lookup is None:
+                    strings = self._all_strings()
+                    lookup = {strings[s]: i for i, s in enumerate(self._a["skill_name"].tolist())}
+                    offs = self._a["alias_offsets"].tolist()
+                    alias_ids = self._a["alias_ids"].tolist()
+                    for i in range(len(self)):
+                        for s in alias_ids[offs[i]:offs[i + 1]]:
+                            lookup.setdefault(strings[s], i)
+                    self._lookup = lookup
+        return self._lookup
+
+    def alias_map(self) -> Dict[str, str]:
+        """
+        Lowercase name or alias -> canonical name for the skills that take part in
+        normalization (built once, shared by all callers)
+        """
+        if self._alias_map is None:
+            names = self.names()
+            keep = [i for i in range(len(self)) if self.normalizes(i)]
+            alias_map = {names[i]: names[i] for i in keep}
+            for i in keep:
+                for alias in self.aliases(i):
+                    alias_map.setdefault(alias, names[i])
+            self._alias_map = alias_map
+        return self._alias_map
+
+    def find(self, text: str) -> Optional[int]:
+        """Skill index for an exact (case-insensitive) name or alias, else None"""
+        return self._get_lookup().get(" ".join(str(text).split()).lower())
+
+    def importance_map(self) -> Dict[str, float]:
+        """Canonical name -> importance for skills that declare one"""
+        names = self.names()
+        values = self._a["skill_importance"]
+        return {names[i]: _weight(v) for i, v in enumerate(values.tolist()) if not np.isnan(v)}
+
+    def category_map(self) -> Dict[str, str]:
+        """Canonical name -> category for skills that declare one"""
+        names = self.names()
+        return {names[i]: self.category_names[c] for i, c in enumerate(self._a["skill_category"].tolist()) if c >= 0}
+
+    def dependencies(self, skill: str) -> List[str]:
+        i = self.find(skill)
+        return self.prerequisites(i) if i is not None else []
+
+
+def _stamp_for(json_path: Path) -> Dict:
+    st = json_path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def compile_taxonomy(json_path: str = SKILL_TAXONOMY_PATH, out_path: str = None) -> Path:
+    """Compile the JSON taxonomy to its binary form; returns the written path"""
+    json_path = Path(json_path)
+    out_path = Path(out_path) if out_path else json_path.with_suffix(".bin")
+    data = _compile_bytes(json.loads(json_path.read_text(encoding="utf-8")), _stamp_for(json_path))
+    tmp = out_path.with_suffix(out_path.suffix + f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, out_path)
+    return out_path
+
+
+def _map(bin_path: Path, json_path: Path) -> SkillTaxonomy:
+    with open(bin_path, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return SkillTaxonomy(mm, str(json_path))
+
+
+def load_taxonomy(json_path: str = SKILL_TAXONOMY_PATH) -> Optional[SkillTaxonomy]:
+    """
+    Map the compiled taxonomy, (re)compiling it first if it is missing or stale.
+    Returns None when no taxonomy JSON exists.
+    """
+    json_path = Path(json_path)
+    bin_path = json_path.with_suffix(".bin")
+    if not json_path.exists():
+        if not bin_path.exists():
+            return None
+        stamp = None  # shipped pre-compiled without its source
+    else:
+        stamp = _stamp_for(json_path)
+
+    if bin_path.exists():
+        try:
+            taxonomy = _map(bin_path, json_path)
+            if stamp is None or taxonomy.stamp == stamp:
+                return taxonomy
+        except Exception:
+            logger.warning("Compiled taxonomy %s unreadable; rebuilding", bin_path)
+
+    try:
+        return _map(compile_taxonomy(json_path, bin_path), json_path)
+    except OSError:
+        # read-only deployment: keep the compiled form in memory instead
+        logger.warning("Cannot write %s; compiling taxonomy in memory", bin_path)
+        data = _compile_bytes(json.loads(json_path.read_text(encoding="utf-8")), stamp)
+        return SkillTaxonomy(memoryview(data), str(json_path))
+
+
+_taxonomy = None
+_taxonomy_loaded = False
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> Optional[SkillTaxonomy]:
+    """Process-wide taxonomy from SKILL_TAXONOMY_PATH, or None if there is none"""
+    global _taxonomy, _taxonomy_loaded
+    if not _taxonomy_loaded:
+        with _taxonomy_lock:
+            if not _taxonomy_loaded:
+                try:
+                    _taxonomy = load_taxonomy()
+                except Exception:
+                    logger.exception("Failed to load skill taxonomy")
+                    _taxonomy = None
+                _taxonomy_loaded = True
+    return _taxonomy
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    src = sys.argv[1] if len(sys.argv) > 1 else SKILL_TAXONOMY_PATH
+    out = compile_taxonomy(src)
+    tax = load_taxonomy(src)
+    print(f"Compiled {len(tax)} skills into {out} ({out.stat().st_size} bytes)")
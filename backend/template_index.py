@@ -0,0 +1,163 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import JOB_TEMPLATES_PATH, NLP_CONFIG
+from backend.model_registry import get_embeddings_model
+from backend.embedding_cache import encode_normalized
+from backend.skill_normalizer import SkillNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateIndex:
+    """
+    Parsed view of config/job_templates.json, reloaded only when the file's mtime changes.
+
+    Each entry holds the template's required / nice-to-have skills, their normalized
+    forms and (lazily, in one encode for all templates) L2-normalized embedding matrices,
+    so matching against a template only has to encode the resume side.
+    """
+
+    def __init__(self, path: str = JOB_TEMPLATES_PATH, embeddings_model_name: str = None):
+        self.path = Path(path)
+        self._embeddings_model_name = embeddings_model_name or NLP_CONFIG["embeddings_model"]
+        self._lock = threading.RLock()
+        self._mtime = None
+        self._templates: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._embeddings_ready = False
+        self._block: Dict[str, Any] = {}
+
+    def _maybe_reload(self):
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self._mtime is not None:
+                logger.warning(f"Templates file not found: {self.path}")
+            with self._lock:
+                self._mtime, self._templates, self._entries = None, {}, {}
+                self._block = {}
+                self._embeddings_ready = False
+            return
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            try:
+                templates = json.loads(self.path.read_text())
+            except Exception:
+                logger.exception(f"Error loading job templates from {self.path}")
+                return
+
+            normalizer = SkillNormalizer()
+            entries = {}
+            for key, tpl in templates.items():
+                required = list(tpl.get("required_skills", []) or tpl.get("required", []) or [])
+                nice = list(tpl.get("nice_to_have", []) or [])
+                entries[key] = {
+                    "key": key,
+                    "title": tpl.get("title", key),
+                    "required_skills": required,
+                    "nice_to_have": nice,
+                    "required_normalized": [normalizer.normalize_skill(s) for s in required],
+                    "nice_to_have_normalized": [normalizer.normalize_skill(s) for s in nice],
+                    "required_embeddings": None,
+                    "nice_to_have_embeddings": None,
+                }
+            self._templates, self._entries = templates, entries
+            self._block = self._build_block(entries)
+            self._embeddings_ready = False
+            self._mtime = mtime
+            logger.info("Loaded %d job templates from %s", len(entries), self.path)
+
+    def _ensure_embeddings(self) -> bool:
+        """Embed every template's skills in one batch; False when no embeddings model is available"""
+        if self._embeddings_ready:
+            return True
+        model = get_embeddings_model(self._embeddings_model_name)
+        if model is None:
+            return False
+        with self._lock:
+            if self._embeddings_ready:
+                return True
+            fields = (("required_skills", "required_embeddings"), ("nice_to_have", "nice_to_have_embeddings"))
+            texts = [s for e in self._entries.values() for f, _ in fields for s in e[f]]
+            try:
+                matrix = encode_normalized(model, texts, self._embeddings_model_name) if texts else None
+            except Exception:
+                logger.exception("Failed to embed job template skills")
+                return False
+            pos = 0
+            for e in self._entries.values():
+                for f, emb_field in fields:
+                    n = len(e[f])
+                    e[emb_field] = matrix[pos:pos + n] if n else None
+                    pos += n
+            required = [self._entries[k]["required_embeddings"] for k in self._block["keys"]]
+            self._block["embeddings"] = np.concatenate(required) if required else None
+            self._embeddings_ready = True
+        return True
+
+    @staticmethod
+    def _build_block(entries: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Concatenate the required skills of every non-empty template, with start offsets"""
+        keys = [k for k, e in entries.items() if e["required_skills"]]
+        skills = [s for k in keys for s in entries[k]["required_skills"]]
+        counts = np.array([len(entries[k]["required_skills"]) for k in keys], dtype=np.intp)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp) if keys else counts
+        titles = [entries[k]["title"] for k in keys]
+        return {"keys": keys, "titles": titles, "skills": skills, "counts": counts, "offsets": offsets, "embeddings": None}
+
+    def keys(self) -> List[str]:
+        self._maybe_reload()
+        return list(self._entries.keys())
+
+    def get_template(self, key: str) -> Dict[str, Any]:
+        """Raw template dict as written in the JSON file"""
+        self._maybe_reload()
+        return self._templates.get(key, {})
+
+    def get(self, key: str, with_embeddings: bool = False) -> Optional[Dict[str, Any]]:
+        """Compiled entry for a template, optionally with embedding matrices filled in"""
+        self._maybe_reload()
+        entry = self._entries.get(key)
+        if entry is not None and with_embeddings:
+            self._ensure_embeddings()
+        return entry
+
+    def required_block(self, with_embeddings: bool = False) -> Dict[str, Any]:
+        """
+        Required skills of all templates as one block
+
+        Returns:
+            Dict with keys (template order), titles, skills (concatenated), counts, offsets
+            (start of each template in skills) and embeddings (stacked rows, or None)
+        """
+        self._maybe_reload()
+        if with_embeddings:
+            self._ensure_embeddings()
+        return self._block
+
+    def required_skills(self, key: str) -> List[str]:
+        entry = self.get(key)
+        return list(entry["required_skills"]) if entry else []
+
+
+_index: Optional[TemplateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_template_index() -> TemplateIndex:
+    """Process-wide index over JOB_TEMPLATES_PATH"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TemplateIndex()
+        return _index
@@ -0,0 +1,132 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import YOUTUBE_CONFIG
+from backend.cache_store import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+def search_key(query: str, **params) -> str:
+    """Cache key: whitespace-collapsed, lowercased query plus sorted search parameters"""
+    return json.dumps([" ".join(str(query).split()).lower(), sorted(params.items())])
+
+
+class YouTubeSearchCache(TieredCache):
+    """
+    Search results cache: in-memory LRU in front of a SQLite store.
+
+    Entries are fresh for fresh_ttl seconds and then stale for another stale_ttl:
+    stale entries are still returned immediately while one background refresh is
+    started (stale-while-revalidate), so popular queries never wait on the API.
+    Concurrent misses for the same key share one API call. Every API call costs
+    units_per_search quota units; every hit is counted as units saved.
+    """
+
+    label = "YouTube cache"
+
+    def __init__(self, cache_dir: str = None, fresh_ttl: float = None, stale_ttl: float = None,
+                 max_memory_items: int = None, max_disk_bytes: int = None, persist: bool = True):
+        self.fresh_ttl = YOUTUBE_CONFIG["cache_fresh_ttl"] if fresh_ttl is None else fresh_ttl
+        self.stale_ttl = YOUTUBE_CONFIG["cache_stale_ttl"] if stale_ttl is None else stale_ttl
+        self.units_per_search = YOUTUBE_CONFIG["units_per_search"]
+        super().__init__(
+            path=Path(cache_dir or YOUTUBE_CONFIG["cache_dir"]) / "youtube_search.sqlite3" if persist else None,
+            max_memory_items=max_memory_items or YOUTUBE_CONFIG["cache_max_memory_items"],
+            max_disk_bytes=max_disk_bytes or YOUTUBE_CONFIG["cache_max_disk_mb"] * 1024 * 1024,
+            ttl=self.fresh_ttl + self.stale_ttl,
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.counters = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "api_calls": 0, "api_errors": 0}
+
+    def _fetch_shared(self, key: str, fetch: Callable[[], List[Dict]], executor: Executor = None) -> Future:
+        """One in-flight API call per key; run on executor (background) or inline"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            future = self._in_flight[key] = Future()
+
+        def run():
+            try:
+                with self._lock:
+                    self.counters["api_calls"] += 1
+                videos = fetch()
+                self.put(key, videos)
+                future.set_result(videos)
+            except BaseException as e:
+                with self._lock:
+                    self.counters["api_errors"] += 1
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._in_flight.pop(key, None)
+
+        if executor is not None:
+            executor.submit(run)
+        else:
+            run()
+        return future
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], List[Dict]], executor: Executor = None, timeout: float = None) -> List[Dict]:
+        """
+        Cached videos for key, calling fetch() on a miss
+
+        Args:
+            key: search_key(...) of the query
+            fetch: Performs the API call; it should raise on failure (errors are not cached)
+            executor: Runs stale refreshes in the background (refreshes are skipped without one)
+            timeout: Longest to wait for another caller's in-flight fetch of the same key
+        """
+        entry = self.get_entry(key)
+        if entry is not None:
+            if time.time() - entry["created"] <= self.fresh_ttl:
+                with self._lock:
+                    self.counters["fresh_hits"] += 1
+            else:
+                with self._lock:
+                    self.counters["stale_hits"] += 1
+                    refreshing = key in self._in_flight
+                if executor is not None and not refreshing:
+                    with self._lock:
+                        self.counters["refreshes"] += 1
+                    self._fetch_shared(key, fetch, executor)
+            return entry["value"]
+
+        with self._lock:
+            self.counters["misses"] += 1
+        return self._fetch_shared(key, fetch).result(timeout=timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        hits = counters["fresh_hits"] + counters["stale_hits"]
+        lookups = hits + counters["misses"]
+        counters.update({
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "units_spent": counters["api_calls"] * self.units_per_search,
+            "units_saved": hits * self.units_per_search,
+            **self.tier_stats(),
+        })
+        return counters
+
+
+_cache: Optional[YouTubeSearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_youtube_cache() -> Optional[YouTubeSearchCache]:
+    """Process-wide search cache, or None when disabled in YOUTUBE_CONFIG"""
+    global _cache
+    if not YOUTUBE_CONFIG["cache_enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = YouTubeSearchCache()
+        return _cache
@@ -1,43 +1,179 @@
 import os
+import threading
+import time
 import requests
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from config.settings import YOUTUBE_CONFIG
+from backend.youtube_cache import get_youtube_cache, search_key
 
 logger = logging.getLogger(__name__)
 YOUTUBE_KEY = os.getenv("YOUTUBE_API_KEY")
+SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+
+_session = None
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session, sized for the concurrent enrichment pool"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=YOUTUBE_CONFIG["max_workers"])
+            _session.mount("https://", adapter)
+        return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=YOUTUBE_CONFIG["max_workers"], thread_name_prefix="youtube")
+        return _executor
+
 
+def _fetch(query: str, max_results: int, timeout: float = None, duration: Optional[str] = "medium") -> List[Dict]:
+    """One search API call (100 quota units); raises on failure. duration=None: no length filter"""
+    params = {
+        "part": "snippet",
+        "q": query,
+        "type": "video",
+        "maxResults": max_results,
+        "key": YOUTUBE_KEY,
+    }
+    if duration:
+        params["videoDuration"] = duration
+    r = _get_session().get(SEARCH_URL, params=params, timeout=timeout or YOUTUBE_CONFIG["timeout"])
+    r.raise_for_status()
+    items = r.json().get("items", [])
+    results = []
+    for it in items:
+        vid_id = it.get("id", {}).get("videoId")
+        if not vid_id:
+            continue
+        results.append({
+            "title": it.get("snippet", {}).get("title"),
+            "channel": it.get("snippet", {}).get("channelTitle"),
+            "url": f"https://www.youtube.com/watch?v={vid_id}",
+            "thumbnail": it.get("snippet", {}).get("thumbnails", {}).get("default", {}).get("url"),
+        })
+    return results
 
-def search_youtube(query: str, max_results: int = 3) -> List[Dict]:
+
+def plan_video_query(skill: str, level: str) -> str:
+    """Search string used for a learning-plan week (shared with cache warming)"""
+    return f"{skill} tutorial for {level}"
+
+
+def fetch_videos(query: str, max_results: int = 3, timeout: float = None,
+                 duration: Optional[str] = "medium") -> List[Dict]:
+    """
+    Cached search like search_youtube, but raises on a missing key or a failed API call.
+    duration is the API's videoDuration filter ("short", "medium", "long"); None searches
+    videos of any length.
+    """
+    if not YOUTUBE_KEY:
+        raise RuntimeError("Missing YOUTUBE_API_KEY in environment")
+    cache = get_youtube_cache()
+    if cache is None:
+        return _fetch(query, max_results, timeout, duration)
+    key = search_key(query, max_results=max_results, duration=duration)
+    return cache.get_or_fetch(key, lambda: _fetch(query, max_results, timeout, duration),
+                              executor=_get_executor(), timeout=timeout)
+
+
+def search_youtube(query: str, max_results: int = 3, timeout: float = None) -> List[Dict]:
     """Return list of videos: {title, channel, url, thumbnail}"""
     if not YOUTUBE_KEY:
         logger.warning("YOUTUBE_API_KEY not set; returning empty results")
         return []
 
     try:
-        url = "https://www.googleapis.com/youtube/v3/search"
-        params = {
-            "part": "snippet",
-            "q": query,
-            "type": "video",
-            "maxResults": max_results,
-            "key": YOUTUBE_KEY,
-            "videoDuration": "medium",
-        }
-        r = requests.get(url, params=params, timeout=15)
-        r.raise_for_status()
-        items = r.json().get("items", [])
-        results = []
-        for it in items:
-            vid_id = it.get("id", {}).get("videoId")
-            if not vid_id:
-                continue
-            results.append({
-                "title": it.get("snippet", {}).get("title"),
-                "channel": it.get("snippet", {}).get("channelTitle"),
-                "url": f"https://www.youtube.com/watch?v={vid_id}",
-                "thumbnail": it.get("snippet", {}).get("thumbnails", {}).get("default", {}).get("url"),
-            })
-        return results
+        return fetch_videos(query, max_results, timeout)
     except Exception:
         logger.exception("YouTube search failed for query: %s", query)
-        return []
\ No newline at end of file
+        return []
+
+
+def warm_cache(queries: Iterable[str], max_results: int = 2) -> int:
+    """
+    Fetch queries that are not cached yet (e.g. popular skills, ahead of traffic)
+
+    Returns:
+        Number of API calls made
+    """
+    cache = get_youtube_cache()
+    if cache is None or not YOUTUBE_KEY:
+        return 0
+    before = cache.stats()["api_calls"]
+    executor = _get_executor()
+    futures = [executor.submit(search_youtube, q, max_results) for q in dict.fromkeys(queries)]
+    wait(futures)
+    return cache.stats()["api_calls"] - before
+
+
+def search_youtube_many(queries: Iterable[str], max_results: int = 3, deadline: float = None) -> Dict[str, List[Dict]]:
+    """
+    Run several searches concurrently, each distinct query once
+
+    Args:
+        queries: Search strings (duplicates are sent once)
+        max_results: Videos per query
+        deadline: Overall seconds to wait (default YOUTUBE_CONFIG["deadline"]); queries
+            still running then come back empty
+
+    Returns:
+        query -> videos, for every distinct query
+    """
+    unique = list(dict.fromkeys(q for q in queries if q))
+    if not unique:
+        return {}
+    if not YOUTUBE_KEY:
+        logger.warning("YOUTUBE_API_KEY not set; returning empty results")
+        return {q: [] for q in unique}
+
+    deadline = YOUTUBE_CONFIG["deadline"] if deadline is None else deadline
+    # no single request may outlive the overall deadline
+    timeout = min(YOUTUBE_CONFIG["timeout"], deadline)
+    start = time.perf_counter()
+    executor = _get_executor()
+    futures = {q: executor.submit(search_youtube, q, max_results, timeout) for q in unique}
+    wait(futures.values(), timeout=deadline)
+
+    results, late = {}, []
+    for q, future in futures.items():
+        if future.done():
+            results[q] = future.result()
+        else:
+            late.append(q)
+            results[q] = []
+    if late:
+        logger.warning("YouTube enrichment deadline (%.1fs) hit; %d of %d queries unanswered", deadline, len(late), len(unique))
+    logger.info("YouTube enrichment: %d queries in %.2fs", len(unique), time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    # python -m backend.youtube_search [--limit N]: warm the cache for every taxonomy skill and level
+    import argparse
+
+    from backend.skill_taxonomy import get_taxonomy
+
+    ap = argparse.ArgumentParser(description="Pre-fetch learning-plan video searches into the cache")
+    ap.add_argument("--levels", nargs="+", default=["Beginner", "Intermediate", "Advanced"])
+    ap.add_argument("--limit", type=int, default=None, help="Max searches (each costs 100 quota units)")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    taxonomy = get_taxonomy()
+    skills = taxonomy.names() if taxonomy is not None else []
+    queries = [plan_video_query(s, level) for s in skills for level in args.levels][:args.limit]
+    calls = warm_cache(queries)
+    print(f"{len(queries)} queries, {calls} API calls; cache: {get_youtube_cache().stats()}")
@@ -0,0 +1,61 @@
+"""
+Build a synthetic CandidateIndex and time job -> candidate queries.
+
+    python benchmarks/bench_candidate_index.py --resumes 100000
+
+Resumes draw skills from the job templates plus a long tail of synthetic skills, so
+posting lists have a realistic mix of very common and rare entries. Dense re-ranking
+is included when sentence-transformers is installed.
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.candidate_index import CandidateIndex
+from backend.template_index import get_template_index
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--resumes", type=int, default=100_000)
+    ap.add_argument("--skills-per-resume", type=int, default=25)
+    ap.add_argument("--batch", type=int, default=5_000)
+    args = ap.parse_args()
+
+    templates = get_template_index()
+    common = sorted({s for k in templates.keys() for s in templates.required_skills(k)})
+    vocab = common + [f"skill_{i}" for i in range(5_000)]
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = CandidateIndex(index_dir=tmp)
+        start = time.perf_counter()
+        for offset in range(0, args.resumes, args.batch):
+            batch = []
+            for i in range(offset, min(offset + args.batch, args.resumes)):
+                skills = rng.sample(common, 6) + rng.sample(vocab, args.skills_per_resume - 6)
+                batch.append((f"resume-{i}", skills, None))
+            index.add_resumes(batch)
+        build = time.perf_counter() - start
+        print(f"indexed {len(index)} resumes in {build:.1f}s ({len(index) / build:.0f}/s)")
+
+        start = time.perf_counter()
+        index = CandidateIndex(index_dir=tmp)
+        print(f"reloaded in {time.perf_counter() - start:.2f}s")
+
+        for key in templates.keys():
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                results = index.search_template(key, top_k=20)
+                timings.append(time.perf_counter() - start)
+            print(f"{key:<20} best {min(timings) * 1000:7.1f} ms  top score {results[0]['score'] if results else '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Throughput of SkillExtractor.extract_skills_batch as spaCy worker processes are added.
+
+    python benchmarks/bench_extract_batch.py --docs 5000 --processes 1 2 4
+
+Resumes are synthetic (a few paragraphs mixing skills and filler prose), so the numbers
+measure pipeline cost rather than any particular corpus. The first row is the previous
+one-document-at-a-time extract_skills loop with the full pipeline enabled.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.skill_extractor import SkillExtractor
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "SQL", "Docker", "Kubernetes", "AWS", "Git", "Linux",
+    "React", "Node.js", "Pandas", "NumPy", "TensorFlow", "PyTorch", "Terraform", "GraphQL",
+    "REST APIs", "machine learning", "data pipelines", "CI/CD", "Agile", "Spark", "Airflow",
+]
+FILLER = [
+    "Led a team of engineers delivering {a} services for enterprise customers.",
+    "Designed and maintained {a} and {b} tooling used across the organisation.",
+    "Improved reliability of the {a} platform and mentored junior developers.",
+    "Collaborated with product managers to ship features built on {a}.",
+    "Migrated legacy systems to {a}, reducing infrastructure cost by 30 percent.",
+]
+
+
+def _corpus(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        lines = [rng.choice(FILLER).format(a=rng.choice(SKILLS), b=rng.choice(SKILLS)) for _ in range(rng.randint(15, 40))]
+        lines.append("Skills: " + ", ".join(rng.sample(SKILLS, 10)))
+        docs.append("\n".join(lines))
+    return docs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=5_000)
+    ap.add_argument("--batch-size", type=int, default=64)
+    ap.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--mode", default="spacy", choices=SkillExtractor.MODES)
+    args = ap.parse_args()
+
+    extractor = SkillExtractor(mode=args.mode)
+    if extractor.nlp is None and args.mode != "dictionary":
+        print("spaCy model not available; timings below use the regex fallback")
+    docs = _corpus(args.docs)
+    print(f"{args.docs} synthetic resumes, mode={args.mode}")
+
+    sample = docs[: max(1, min(len(docs), 500))]
+    start = time.perf_counter()
+    for text in sample:
+        if extractor.nlp is not None:
+            extractor._candidates_from_doc(extractor.nlp(text))
+        else:
+            extractor.extract_skills(text)
+    elapsed = time.perf_counter() - start
+    print(f"{'sequential, full pipeline':<28} {len(sample) / elapsed:8.1f} docs/s  ({len(sample)} docs)")
+
+    for n_process in args.processes:
+        start = time.perf_counter()
+        count = sum(1 for _ in extractor.extract_skills_batch(docs, batch_size=args.batch_size, n_process=n_process))
+        elapsed = time.perf_counter() - start
+        print(f"{f'pipe, n_process={n_process}':<28} {count / elapsed:8.1f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
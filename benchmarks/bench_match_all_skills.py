@@ -0,0 +1,67 @@
+"""
+Latency of SkillMatcher.match_all_skills as the number of skills grows.
+
+Compares the batched engine (one encode per side + one matrix product) with the
+previous per-skill loop, where every resume skill re-encoded the whole job list. The
+legacy column calls model.encode directly; the batched column goes through the
+embedding cache like the app does (best of 3, so it is warm after the first run).
+
+    python benchmarks/bench_match_all_skills.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from rapidfuzz import fuzz
+
+from backend.skill_matcher import SkillMatcher
+
+BASE_SKILLS = [
+    "Python", "Java", "JavaScript", "SQL", "Docker", "Kubernetes", "AWS", "Git", "Linux",
+    "React", "Node.js", "Pandas", "NumPy", "TensorFlow", "PyTorch", "Terraform", "GraphQL",
+    "REST APIs", "System Design", "Unit Testing", "CI/CD", "Agile", "Statistics", "Spark",
+]
+
+
+def _skills(n: int, tag: str):
+    return [f"{BASE_SKILLS[i % len(BASE_SKILLS)]} {tag}{i // len(BASE_SKILLS)}" for i in range(n)]
+
+
+def _legacy_match_all(matcher: SkillMatcher, extracted, job_skills):
+    """The pre-batching loop, calling the model directly (no embedding cache, no dispatcher)"""
+    model = matcher.embeddings_model
+    for s in extracted:
+        max(fuzz.token_set_ratio(s.lower(), js.lower()) for js in job_skills)
+        if model is not None:
+            skill_emb = model.encode(s, convert_to_numpy=True)
+            job_embs = model.encode(job_skills, convert_to_numpy=True)
+            np.dot(job_embs, skill_emb) / (np.linalg.norm(job_embs, axis=1) * np.linalg.norm(skill_emb) + 1e-10)
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    matcher = SkillMatcher()
+    if matcher.embeddings_model is None:
+        print("sentence-transformers unavailable: timing the fuzzy part only")
+
+    print(f"{'resume':>7} {'job':>5} {'batched ms':>11} {'per-skill ms':>13}")
+    for n_resume, n_job in [(10, 12), (25, 12), (50, 25), (100, 25), (200, 50), (400, 50)]:
+        extracted, job_skills = _skills(n_resume, "r"), _skills(n_job, "j")
+        batched = _time(lambda: matcher.match_all_skills(extracted, job_skills))
+        legacy = _time(lambda: _legacy_match_all(matcher, extracted, job_skills), repeat=1)
+        print(f"{n_resume:>7} {n_job:>5} {batched * 1000:>11.1f} {legacy * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compile a synthetic skill taxonomy and time loading it.
+
+    python benchmarks/bench_taxonomy_load.py --skills 50000
+
+Each synthetic skill gets a few aliases, a category, an importance weight and up to two
+prerequisites on earlier skills, so the string table and arrays are sized like a real
+taxonomy. Times the compile, a cold load (mmap + header), the first alias_map() build
+and a SkillNormalizer built on top of it.
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.skill_normalizer import SkillNormalizer
+from backend.skill_taxonomy import compile_taxonomy, load_taxonomy
+
+
+def synthetic_taxonomy(n_skills: int, rng: random.Random) -> dict:
+    categories = [f"category_{i}" for i in range(40)]
+    skills = []
+    for i in range(n_skills):
+        name = f"skill {i}"
+        skill = {
+            "name": name,
+            "aliases": [f"{name} alias {k}" for k in range(rng.randint(0, 4))],
+            "category": rng.choice(categories),
+            "importance": rng.randint(1, 10),
+        }
+        if i:
+            skill["prerequisites"] = [f"skill {j}" for j in rng.sample(range(i), min(i, rng.randint(0, 2)))]
+        skills.append(skill)
+    return {"version": 1, "default_importance": 5, "skills": skills}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--skills", type=int, default=50_000)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "taxonomy.json"
+        json_path.write_text(json.dumps(synthetic_taxonomy(args.skills, random.Random(7))), encoding="utf-8")
+
+        start = time.perf_counter()
+        bin_path = compile_taxonomy(json_path)
+        print(f"compiled {args.skills} skills in {time.perf_counter() - start:.2f}s "
+              f"({bin_path.stat().st_size / 1e6:.1f} MB)")
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            taxonomy = load_taxonomy(json_path)
+            timings.append(time.perf_counter() - start)
+        print(f"load (mmap)        best {min(timings) * 1000:7.2f} ms")
+
+        start = time.perf_counter()
+        alias_map = taxonomy.alias_map()
+        print(f"alias_map()             {(time.perf_counter() - start) * 1000:7.1f} ms  ({len(alias_map)} entries)")
+
+        start = time.perf_counter()
+        SkillNormalizer(taxonomy=load_taxonomy(json_path))
+        print(f"SkillNormalizer()       {(time.perf_counter() - start) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
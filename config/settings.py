@@ -18,6 +18,15 @@ LLM_CONFIG = {
     "huggingface_api_key": os.getenv("HUGGINGFACE_API_KEY"),
     "huggingface_model": os.getenv("HUGGINGFACE_MODEL", "gpt2"),
     "model_name": os.getenv("LLM_MODEL", "gpt-4-turbo"),
+    # text-generation-webui's OpenAI-compatible API (/v1/models, /v1/completions)
+    "webui_url": os.getenv("WEBUI_URL", "http://localhost:5000").rstrip("/"),
+    # "whole": one prompt per plan; "fragments": assemble plans from cached per-(skill, level)
+    # week blocks (up to plan_weeks LLM calls for a cold plan, cheaper once fragments are stored)
+    "plan_mode": os.getenv("LLM_PLAN_MODE", "whole"),
+    "plan_weeks": 12,
+    "fragment_weeks": 3,  # weeks generated per skill fragment
+    "fragment_workers": 4,  # concurrent LLM calls for uncovered skills
+    "fragment_failure_ttl": 600,  # seconds a failed fragment is not retried (0 = always retry)
 }
 
 # NLP Configuration
@@ -25,6 +34,38 @@ NLP_CONFIG = {
     "spacy_model": "en_core_web_sm",
     "embeddings_model": "all-MiniLM-L6-v2",
     "similarity_threshold": 0.7,
+    "fuzzy_workers": -1,  # rapidfuzz cdist threads, -1 = all cores
+    "normalizer_memo_size": 10_000,  # LRU memo of raw skill string -> canonical skill
+    "extraction_mode": os.getenv("EXTRACTION_MODE", "spacy"),  # spacy, dictionary, hybrid
+    "spacy_batch_size": 64,  # docs per nlp.pipe batch in extract_skills_batch
+    "spacy_n_process": 1,  # nlp.pipe worker processes for bulk runs
+    "spacy_disable": ["lemmatizer", "textcat", "textcat_multilabel"],  # not needed for ents / noun chunks
+    # resume sections the spaCy pass runs on (None = whole text); the dictionary pass always sees everything
+    "nlp_sections": ["summary", "skills", "experience", "projects", "certifications"],
+}
+
+# Embedding cache: in-memory LRU in front of a memory-mapped store on local disk
+EMBEDDING_CACHE_CONFIG = {
+    "enabled": True,
+    "persist": True,
+    "cache_dir": os.getenv("EMBEDDING_CACHE_DIR", "data/cache/embeddings"),
+    "max_memory_items": 50_000,
+    # models whose tokenizer lowercases input: cache keys fold case only for these
+    "uncased_models": ["all-MiniLM-L6-v2", "all-MiniLM-L12-v2", "paraphrase-MiniLM-L6-v2"],
+}
+
+# Micro-batching of concurrent encode calls (cache misses) into one model.encode
+EMBEDDING_DISPATCH_CONFIG = {
+    "enabled": True,
+    "max_batch_size": 128,  # texts per flushed batch
+    "max_wait_ms": 5,  # longest a request waits for others to join its batch
+}
+
+# Candidate search index (job -> resumes)
+CANDIDATE_INDEX_CONFIG = {
+    "index_dir": os.getenv("CANDIDATE_INDEX_DIR", "data/candidate_index"),
+    "semantic_weight": 0.5,  # share of the ranking score from dense similarity
+    "max_candidates": 5000,  # cap on posting-list candidates passed to the dense re-rank
 }
 
 # Clustering Configuration
@@ -40,6 +81,65 @@ FILE_CONFIG = {
     "allowed_formats": [".pdf", ".docx", ".doc"],
 }
 
+# Resume Parsing Configuration
+PARSER_CONFIG = {
+    # PDF engines in the order they are tried: "pymupdf" (fast), "pdfplumber" (layout-aware)
+    "pdf_engines": [e.strip() for e in os.getenv("PDF_ENGINES", "pymupdf,pdfplumber").split(",") if e.strip()],
+    "parallel_min_pages": 24,  # PDFs at least this long are split across a process pool
+    "parallel_workers": min(4, os.cpu_count() or 1),
+    "pages_per_task": 8,  # minimum pages per pool task
+    # never "fork": the pool is started from threaded hosts (Streamlit, uvicorn)
+    "pool_start_method": os.getenv("PARSER_POOL_START_METHOD", "spawn"),
+}
+
+# Content-addressed cache of parsed resumes and their extracted skills
+PARSE_CACHE_CONFIG = {
+    "enabled": True,
+    "persist": True,
+    "cache_dir": os.getenv("PARSE_CACHE_DIR", "data/cache/parse"),
+    "max_memory_items": 256,
+    "max_disk_mb": 200,
+}
+
+# HTTP analysis service (service.py)
+SERVICE_CONFIG = {
+    "workers": int(os.getenv("SERVICE_WORKERS", os.cpu_count() or 1)),  # threads running CPU-bound analysis
+    "max_queue": int(os.getenv("SERVICE_MAX_QUEUE", 32)),  # waiting requests beyond the workers before 503
+    "warm_models": True,  # load models and template embeddings at startup
+}
+
+# YouTube enrichment of learning plans
+YOUTUBE_CONFIG = {
+    "timeout": 15,  # seconds per search request
+    "max_workers": 8,  # concurrent searches (and pooled HTTP connections)
+    "deadline": 10,  # overall seconds for enriching one plan
+    "units_per_search": 100,  # Data API quota cost of search.list
+    "cache_enabled": True,
+    "cache_dir": os.getenv("YOUTUBE_CACHE_DIR", "data/cache/youtube"),
+    "cache_fresh_ttl": 7 * 24 * 3600,  # served without any API call
+    "cache_stale_ttl": 30 * 24 * 3600,  # after that: served at once and refreshed in the background
+    "cache_max_memory_items": 2000,
+    "cache_max_disk_mb": 50,
+}
+
+# Cache of parsed LLM learning plans (keyed by provider, model and canonical prompt)
+LLM_CACHE_CONFIG = {
+    "enabled": True,
+    "persist": True,
+    "cache_dir": os.getenv("LLM_CACHE_DIR", "data/cache/llm"),
+    "ttl": 30 * 24 * 3600,  # seconds
+    "max_memory_items": 128,
+    "max_disk_mb": 50,
+}
+
+# Offline learning-resource catalog
+RESOURCE_CATALOG_CONFIG = {
+    "db_path": os.getenv("RESOURCE_CATALOG_DB", "data/cache/resources.sqlite3"),
+    "seed_path": "data/learning_resources.json",  # curated resources, re-imported when it changes
+    "results_per_week": 3,
+    "youtube_refresh": True,  # live (cached) YouTube search for week videos; False = catalog only
+}
+
 # Database Configuration (optional)
 DATABASE_CONFIG = {
     "use_supabase": os.getenv("USE_SUPABASE", False),
@@ -1,6 +1,4 @@
 import streamlit as st
-import json
-from pathlib import Path
 import traceback
 import logging
 from typing import List, Dict, Any
@@ -9,23 +7,12 @@ logger = logging.getLogger(__name__)
 
 from backend.skill_matcher import SkillMatcher
 from backend.gap_analyzer import GapAnalyzer
-
-TEMPLATES_PATH = Path("config/job_templates.json")
+from backend.template_index import get_template_index
 
 
 def _load_job_skills(template_key: str) -> List[str]:
-    """Load required skills for a job template from config"""
-    if not TEMPLATES_PATH.exists():
-        logger.warning(f"Templates file not found: {TEMPLATES_PATH}")
-        return []
-    try:
-        templates = json.loads(TEMPLATES_PATH.read_text())
-        tpl = templates.get(template_key, {})
-        required = tpl.get("required_skills", []) or tpl.get("required", [])
-        return required if required else []
-    except Exception as e:
-        logger.exception(f"Error loading job skills for {template_key}")
-        return []
+    """Required skills for a job template (served from the mtime-checked template index)"""
+    return get_template_index().required_skills(template_key)
 
 
 def _run_analysis_and_store(extracted_skills: List[str], selected_job: str) -> Dict[str, Any]:
@@ -38,8 +25,8 @@ def _run_analysis_and_store(extracted_skills: List[str], selected_job: str) -> D
         st.warning(f"No job skills found for template: {selected_job}")
         return {}
     
-    # Match skills
-    match_result = matcher.match_all_skills(extracted_skills, job_skills)
+    # Match skills (template skill embeddings are precomputed; only the resume side is encoded)
+    match_result = matcher.match_template(extracted_skills, selected_job)
     
     # Analyze gaps
     gap = analyzer.analyze_gaps(
@@ -53,6 +40,7 @@ def _run_analysis_and_store(extracted_skills: List[str], selected_job: str) -> D
         "matched": match_result.get("matched", []),
         "missing": match_result.get("missing", []),
         "weak": match_result.get("weak_matches", []),
+        "ranked_missing": gap.get("missing_skills", []),
         "summary": gap.get("summary", {})
     }
     return st.session_state.skill_gap
@@ -135,8 +123,8 @@ def render():
         st.subheader("Missing skills (ranked)")
         missing = skill_gap.get("missing", [])
         if missing:
-            analyzer = GapAnalyzer()
-            ranked = analyzer._rank_missing_skills(missing)
+            # ranking was computed during analysis; older session entries lack it
+            ranked = skill_gap.get("ranked_missing") or GapAnalyzer()._rank_missing_skills(missing)
             for r in ranked:
                 st.write(f"- {r['skill']} — Priority: {r['priority']} — Importance: {r['importance']}")
         else:
@@ -2,6 +2,9 @@ import streamlit as st
 import json
 import logging
 from backend.llm_handler import LLMHandler
+from backend.llm_cache import get_llm_cache
+from backend.plan_fragments import get_fragment_store
+from config.settings import LLM_CONFIG
 
 # Enable debug logging to see terminal output in Streamlit
 logging.basicConfig(level=logging.INFO)
@@ -53,13 +56,33 @@ def render():
                 
                 st.info(f"Generating plan for: {job_title}, Skills: {', '.join(missing_skills)}")
                 
-                # Call LLM to generate plan
-                learning_plan = llm.generate_learning_plan_with_videos(
+                # Stream the plan: weeks are listed as soon as the LLM closes them
+                weeks_box = st.empty()
+                streamed = []
+                learning_plan, result = None, {}
+                for event in llm.stream_learning_plan(
                     missing_skills=missing_skills,
                     job_title=job_title,
                     current_level=current_level,
                     weekly_hours=int(commitment.split()[0])
-                )
+                ):
+                    if event["event"] == "week":
+                        streamed.append(event["week"])
+                        weeks_box.markdown("\n".join(
+                            f"- **Week {w.get('week', i + 1)}:** {w.get('focus_skill', 'N/A')} — "
+                            f"{', '.join(str(t) for t in w.get('topics', [])[:2])}"
+                            for i, w in enumerate(streamed)
+                        ))
+                    else:
+                        learning_plan, result = event["plan"], event
+                weeks_box.empty()
+
+                timings = result.get("timings", {})
+                if timings.get("first_week") is not None:
+                    st.caption(
+                        f"First week after {timings['first_week']:.1f}s, full plan after {timings['total']:.1f}s "
+                        f"({result.get('source')})"
+                    )
                 
                 # DEBUG: Show raw response
                 st.write("**DEBUG - Raw LLM Response:**")
@@ -74,6 +97,16 @@ def render():
                 
                 st.session_state.learning_plan = learning_plan
                 st.success("✅ Learning plan generated!")
+
+                fragments = LLM_CONFIG["plan_mode"] == "fragments"
+                plan_cache = get_fragment_store() if fragments else get_llm_cache()
+                if plan_cache is not None:
+                    cache_stats = plan_cache.stats()
+                    st.caption(
+                        f"{'Fragment store' if fragments else 'Plan cache'}: "
+                        f"{cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                        f"(hit ratio {cache_stats['hit_ratio']:.0%}), {cache_stats['saved_seconds']:.1f}s of generation saved"
+                    )
                 
             except Exception as e:
                 st.error(f"Error generating plan: {str(e)}")
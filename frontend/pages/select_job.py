@@ -1,11 +1,11 @@
 import streamlit as st
-import json
-from pathlib import Path
+from backend.template_index import get_template_index
+from backend.skill_matcher import SkillMatcher
 
 def _load_templates():
-    p = Path("config/job_templates.json")
-    if p.exists():
-        return list(json.loads(p.read_text()).keys())
+    keys = get_template_index().keys()
+    if keys:
+        return keys
     return ["software_engineer", "data_scientist", "product_manager", "devops_engineer"]
 
 def render():
@@ -14,4 +14,16 @@ def render():
     choice = st.selectbox("Job template", options=templates)
     if st.button("Select"):
         st.session_state.job_selected = choice
-        st.success(f"Selected: {choice}")
\ No newline at end of file
+        st.success(f"Selected: {choice}")
+
+    # Rank every template against the uploaded resume in one pass
+    extracted_skills = st.session_state.get("extracted_skills", [])
+    if extracted_skills:
+        st.markdown("---")
+        st.subheader("Best-fit roles")
+        if st.button("Rank all roles"):
+            with st.spinner("Scoring your skills against every role..."):
+                st.session_state.role_ranking = SkillMatcher().rank_job_templates(extracted_skills)
+        for r in st.session_state.get("role_ranking") or []:
+            st.write(f"- **{r['title']}** — {r['match_percentage']}% of required skills "
+                     f"({r['matched']}/{r['total_required']}, weak: {r['weak']})")
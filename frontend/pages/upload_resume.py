@@ -1,40 +1,25 @@
 import streamlit as st
-from pathlib import Path
-import tempfile
 import json
 
 # backend imports
-from backend.resume_parser import ResumeParser
-from backend.skill_extractor import SkillExtractor
-from backend.skill_normalizer import SkillNormalizer
+from backend.resume_pipeline import ResumePipeline
 
 def render():
     st.header("Upload Resume")
     uploaded = st.file_uploader("Upload PDF or DOCX resume", type=["pdf", "docx", "doc"])
-    parser = ResumeParser()
-    extractor = SkillExtractor()
-    normalizer = SkillNormalizer()
 
     if uploaded:
-        # Save to temporary file because parser expects a path
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded.name).suffix) as tmp:
-            tmp.write(uploaded.getbuffer())
-            tmp_path = tmp.name
-
         try:
-            parsed = parser.parse_resume(tmp_path)
-            raw_text = parsed.get("raw_text", "")
+            # parse -> extract -> normalize straight from the upload buffer, cached by content hash
+            result = ResumePipeline().process_bytes(uploaded.getvalue(), file_name=uploaded.name)
+            parsed = result["parsed"]
+            if result["error"]:
+                st.error(f"Could not read {uploaded.name}: {result['error']}")
+                return
             st.success(f"Parsed resume: {uploaded.name}")
             st.session_state.resume_data = parsed
 
-            # Extract skills
-            try:
-                extracted = extractor.extract_skills(raw_text)
-            except Exception:
-                extracted = []
-
-            # Normalize skills
-            normalized = normalizer.normalize_skills_list(extracted)
+            normalized = result["skills"]
             st.session_state.extracted_skills = normalized
 
             st.subheader("Extracted skills")
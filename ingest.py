@@ -0,0 +1,197 @@
+"""
+Bulk resume ingestion without the UI.
+
+    python ingest.py resumes/ --output results.jsonl --workers 8 --template data_scientist
+    python ingest.py manifest.txt --output results.jsonl     # one path per line
+
+Each resume goes through ResumeParser -> SkillExtractor -> SkillNormalizer (and
+SkillMatcher.match_template with --template) in a process pool whose workers load
+their models once. Results are appended to the output JSONL as they finish; the file
+doubles as the checkpoint, so re-running the same command after a crash or Ctrl-C
+skips every resume already written. With --retry-errors the failed records are removed
+from the file before their resumes are re-run, so each id appears once. Per-stage
+throughput is printed at the end.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Set
+
+from config.settings import FILE_CONFIG, PARSER_CONFIG
+from backend.resume_pipeline import ResumePipeline, StageStats
+
+logger = logging.getLogger("ingest")
+
+_pipeline = None
+_options: Dict = {}
+
+
+def _init_worker(extraction_mode: str, use_cache: bool, template_key: str, include_text: bool):
+    """Pool initializer: build the pipeline (and load models) once per worker process"""
+    global _pipeline, _options
+    if multiprocessing.current_process().daemon:
+        # pool workers are daemonic and cannot start the parser's page-extraction pool
+        PARSER_CONFIG["parallel_workers"] = 1
+    _pipeline = ResumePipeline(extraction_mode=extraction_mode, use_cache=use_cache)
+    _options = {"template_key": template_key, "include_text": include_text}
+
+
+def _process(path: str) -> Dict:
+    start = time.perf_counter()
+    try:
+        result = _pipeline.process_file(path, template_key=_options["template_key"])
+    except Exception as e:
+        return {"id": path, "error": f"{type(e).__name__}: {e}", "seconds": round(time.perf_counter() - start, 4)}
+    if result["error"]:
+        return {"id": path, "sha256": result["sha256"], "error": result["error"],
+                "seconds": round(time.perf_counter() - start, 4)}
+
+    parsed = result["parsed"]
+    record = {
+        "id": path,
+        "file_name": parsed["file_name"],
+        "file_format": parsed["file_format"],
+        "sha256": result["sha256"],
+        "skills": result["skills"],
+        "extracted": result["extracted"],
+        "sections": parsed.get("sections", []),
+        "cached": result["cached"],
+        "timings": {stage: round(s, 4) for stage, s in result["timings"].items()},
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+    if "match" in result:
+        record["match"] = result["match"]
+    if _options["include_text"]:
+        record["raw_text"] = parsed["raw_text"]
+    return record
+
+
+def _discover(inputs: List[str]) -> Iterator[str]:
+    """Resume paths from directories (recursive) and manifest files (one path per line)"""
+    formats = set(FILE_CONFIG["allowed_formats"])
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            for p in sorted(path.rglob("*")):
+                if p.is_file() and p.suffix.lower() in formats:
+                    yield str(p.resolve())
+        elif path.suffix.lower() in formats:
+            yield str(path.resolve())
+        else:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    p = Path(line)
+                    yield str((p if p.is_absolute() else path.parent / p).resolve())
+
+
+def _load_checkpoint(output: Path, retry_errors: bool) -> Set[str]:
+    """
+    Ids already in the output. A line cut off by a crash is truncated away; with
+    retry_errors the error records are dropped from the file (their ids are re-run).
+    """
+    done: Set[str] = set()
+    if not output.exists():
+        return done
+    kept: List[bytes] = []
+    good_bytes = retried = 0
+    with open(output, "rb") as fh:
+        for raw in fh:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                break
+            good_bytes += len(raw)
+            if retry_errors and "error" in record:
+                retried += 1
+                continue
+            kept.append(raw)
+            done.add(record["id"])
+    if retried:
+        logger.info("Removing %d error records from %s to retry them", retried, output)
+        tmp = output.with_name(output.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.writelines(kept)
+        os.replace(tmp, output)
+    elif good_bytes < output.stat().st_size:
+        logger.warning("Dropping a partial record at the end of %s", output)
+        with open(output, "r+b") as fh:
+            fh.truncate(good_bytes)
+    return done
+
+
+def _report(stats: StageStats, written: int, errors: int, skipped: int, wall: float):
+    print(f"\nprocessed {written} resumes ({errors} errors, {skipped} already done) in {wall:.1f}s"
+          f" -> {written / wall if wall else 0:.1f} docs/s overall")
+    print(f"{'stage':<10} {'docs':>8} {'cpu s':>10} {'docs/s/worker':>14}")
+    for stage, row in stats.summary().items():
+        print(f"{stage:<10} {row['docs']:>8} {row['seconds']:>10.1f} {row['docs_per_sec']:>14.1f}")
+
+
+def main(argv: List[str] = None) -> int:
+    ap = argparse.ArgumentParser(description="Parse and extract skills from many resumes")
+    ap.add_argument("inputs", nargs="+", help="Resume files, directories or manifest files")
+    ap.add_argument("--output", "-o", required=True, help="JSONL results file (also the resume checkpoint)")
+    ap.add_argument("--template", help="Also match every resume against this job template key")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--mode", choices=("spacy", "dictionary", "hybrid"), help="Extraction mode (default from settings)")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the parse cache")
+    ap.add_argument("--include-text", action="store_true", help="Store raw_text in each record")
+    ap.add_argument("--retry-errors", action="store_true", help="Re-run resumes that failed last time")
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    done = _load_checkpoint(output, args.retry_errors)
+    paths = list(dict.fromkeys(_discover(args.inputs)))
+    todo = [p for p in paths if p not in done]
+    skipped = len(paths) - len(todo)
+    logger.info("%d resumes found, %d already in %s, %d to process", len(paths), skipped, output, len(todo))
+
+    stats = StageStats()
+    written = errors = 0
+    initargs = (args.mode, not args.no_cache, args.template, args.include_text)
+    start = time.perf_counter()
+    with open(output, "a", encoding="utf-8") as out:
+        if args.workers <= 1:
+            _init_worker(*initargs)
+            results = map(_process, todo)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=initargs)
+            results = pool.imap_unordered(_process, todo)
+        try:
+            for record in results:
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                written += 1
+                if "error" in record:
+                    errors += 1
+                    logger.warning("%s: %s", record["id"], record["error"])
+                stats.add(record.get("timings"))
+                if written % 100 == 0:
+                    elapsed = time.perf_counter() - start
+                    logger.info("%d/%d done (%.1f docs/s)", written, len(todo), written / elapsed)
+        except KeyboardInterrupt:
+            logger.warning("Interrupted; re-run the same command to resume")
+            if pool:
+                pool.terminate()
+            return 130
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+    _report(stats, written, errors, skipped, time.perf_counter() - start)
+    return 1 if errors and errors == written else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
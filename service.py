@@ -0,0 +1,252 @@
+"""
+Headless HTTP analysis service over the backend pipeline.
+
+    uvicorn service:app --host 0.0.0.0 --port 8000
+
+    POST /analyze    multipart "file" (PDF/DOCX) [+ "template"] -> skills, match and gap analysis
+                     (422 when no text can be read from the file)
+    GET  /templates  job templates
+    GET  /health     liveness / readiness
+    GET  /stats      request counters, latency, stage throughput, model and cache stats
+
+Models are loaded once at startup and stay warm. Parsing, extraction, matching and gap
+analysis are CPU-bound, so they run on a bounded thread pool (SERVICE_CONFIG["workers"])
+and never on the event loop; requests beyond workers + max_queue get 503 with
+Retry-After instead of piling up. Scale out with more processes behind the load balancer.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+import numpy as np
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
+
+from config.settings import APP_CONFIG, FILE_CONFIG, NLP_CONFIG, SERVICE_CONFIG
+from backend.model_registry import get_embeddings_model, get_registry, get_spacy_model
+from backend.embedding_cache import get_embedding_cache
+from backend.embedding_dispatcher import dispatcher_stats
+from backend.gap_analyzer import GapAnalyzer
+from backend.llm_cache import get_llm_cache
+from backend.parse_cache import get_parse_cache
+from backend.plan_fragments import get_fragment_store
+from backend.resource_catalog import get_resource_catalog
+from backend.resume_parser import detect_format
+from backend.resume_pipeline import ResumePipeline, StageStats
+from backend.template_index import get_template_index
+from backend.youtube_cache import get_youtube_cache
+
+logger = logging.getLogger("service")
+
+# multipart framing on top of the file itself
+_MULTIPART_SLACK = 64 * 1024
+
+_executor = ThreadPoolExecutor(max_workers=SERVICE_CONFIG["workers"], thread_name_prefix="analyze")
+_local = threading.local()
+_stats_lock = threading.Lock()
+_counters = {"requests": 0, "errors": 0, "rejected": 0, "in_flight": 0}
+_latencies = deque(maxlen=2000)
+_stage_stats = StageStats()
+_started_at = time.time()
+
+
+def _pipeline() -> ResumePipeline:
+    """One pipeline per worker thread (models themselves are shared via the registry)"""
+    if getattr(_local, "pipeline", None) is None:
+        _local.pipeline = ResumePipeline()
+        _local.analyzer = GapAnalyzer()
+    return _local.pipeline
+
+
+def _warm_up():
+    get_spacy_model(NLP_CONFIG["spacy_model"])
+    if get_embeddings_model(NLP_CONFIG["embeddings_model"]) is not None:
+        get_template_index().required_block(with_embeddings=True)
+    else:
+        get_template_index().required_block()
+    list(_executor.map(lambda _: _pipeline(), range(SERVICE_CONFIG["workers"])))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if SERVICE_CONFIG["warm_models"]:
+        start = time.perf_counter()
+        await asyncio.get_running_loop().run_in_executor(None, _warm_up)
+        logger.info("Models warmed up in %.1fs", time.perf_counter() - start)
+    yield
+    _executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title=APP_CONFIG["app_name"], version=APP_CONFIG["version"], lifespan=lifespan)
+
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Reject oversized or unsized uploads before the multipart body is read"""
+    if request.method == "POST":
+        length = request.headers.get("content-length")
+        if length is None:
+            return JSONResponse({"detail": "Content-Length required"}, status_code=411)
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return JSONResponse({"detail": "Malformed Content-Length"}, status_code=400)
+        if length > FILE_CONFIG["max_file_size"] + _MULTIPART_SLACK:
+            return JSONResponse({"detail": "File too large"}, status_code=413)
+    return await call_next(request)
+
+
+def _to_builtin(value):
+    """numpy scalars / arrays -> plain Python for JSON"""
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+class _UnreadableResume(Exception):
+    """The upload looks like a PDF/DOCX but no resume text could be read from it"""
+
+
+def _analyze(data: bytes, file_name: str, template: Optional[str], top_k: int) -> Dict[str, Any]:
+    pipeline = _pipeline()
+    result = pipeline.process_bytes(data, file_name=file_name)
+    if result["error"]:
+        raise _UnreadableResume(result["error"])
+    if not result["parsed"]["raw_text"].strip():
+        raise _UnreadableResume("No text found (scanned or empty document?)")
+    skills = result["skills"]
+    timings = dict(result["timings"])
+
+    start = time.perf_counter()
+    ranking = None
+    if not template:
+        ranking = pipeline.matcher.rank_job_templates(skills, top_k=top_k)
+        template = ranking[0]["template"] if ranking else None
+    match = pipeline.matcher.match_template(skills, template) if template else None
+    timings["match"] = time.perf_counter() - start
+
+    gap = None
+    if match is not None:
+        start = time.perf_counter()
+        gap = _local.analyzer.analyze_gaps(match["matched"], match["missing"], match["weak_matches"])
+        timings["gap"] = time.perf_counter() - start
+
+    parsed = result["parsed"]
+    return _to_builtin({
+        "file_name": parsed["file_name"],
+        "file_format": parsed["file_format"],
+        "sha256": result["sha256"],
+        "cached": result["cached"],
+        "sections": [s["name"] for s in parsed.get("sections", [])],
+        "skills": skills,
+        "template": template,
+        "ranking": ranking,
+        "match": match,
+        "gap": gap,
+        "timings": {k: round(v, 4) for k, v in timings.items()},
+    })
+
+
+@app.post("/analyze")
+async def analyze(file: UploadFile = File(...), template: Optional[str] = Form(None), top_k: int = Form(3, ge=1)):
+    """Parse -> extract -> normalize -> match -> gap analysis for one resume"""
+    data = await file.read(FILE_CONFIG["max_file_size"] + 1)
+    if len(data) > FILE_CONFIG["max_file_size"]:
+        raise HTTPException(status_code=413, detail="File too large")
+    if detect_format(data) not in FILE_CONFIG["allowed_formats"]:
+        raise HTTPException(status_code=415, detail="Unsupported file type (expected PDF or DOCX)")
+    if template and get_template_index().get(template) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown template: {template}")
+
+    with _stats_lock:
+        if _counters["in_flight"] >= SERVICE_CONFIG["workers"] + SERVICE_CONFIG["max_queue"]:
+            _counters["rejected"] += 1
+            raise HTTPException(status_code=503, detail="Server busy", headers={"Retry-After": "1"})
+        _counters["in_flight"] += 1
+        _counters["requests"] += 1
+
+    start = time.perf_counter()
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_executor, _analyze, data, file.filename, template, top_k)
+    except _UnreadableResume as e:
+        raise HTTPException(status_code=422, detail=f"Could not read resume: {e}")
+    except Exception as e:
+        with _stats_lock:
+            _counters["errors"] += 1
+        logger.exception("Analysis failed for %s", file.filename)
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {e}")
+    finally:
+        with _stats_lock:
+            _counters["in_flight"] -= 1
+
+    with _stats_lock:
+        _latencies.append(time.perf_counter() - start)
+        _stage_stats.add(result["timings"])
+    return result
+
+
+@app.get("/templates")
+def templates():
+    index = get_template_index()
+    return [
+        {"key": key, "title": entry["title"], "required_skills": entry["required_skills"], "nice_to_have": entry["nice_to_have"]}
+        for key in index.keys()
+        for entry in [index.get(key)]
+    ]
+
+
+@app.get("/health")
+def health():
+    return {
+        "status": "ok",
+        "version": APP_CONFIG["version"],
+        "uptime_seconds": round(time.time() - _started_at, 1),
+        "spacy": get_spacy_model(NLP_CONFIG["spacy_model"]) is not None,
+        "embeddings": get_embeddings_model(NLP_CONFIG["embeddings_model"]) is not None,
+        "templates": len(get_template_index().keys()),
+    }
+
+
+@app.get("/stats")
+def stats():
+    with _stats_lock:
+        latencies = sorted(_latencies)
+        counters = dict(_counters)
+        stages = _stage_stats.summary()
+
+    def pct(q: float):
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 1) if latencies else None
+
+    parse_cache = get_parse_cache()
+    youtube_cache = get_youtube_cache()
+    catalog = get_resource_catalog()
+    llm_cache = get_llm_cache()
+    fragment_store = get_fragment_store()
+    return {
+        "requests": counters,
+        "workers": SERVICE_CONFIG["workers"],
+        "max_queue": SERVICE_CONFIG["max_queue"],
+        "latency_ms": {"p50": pct(0.5), "p95": pct(0.95), "p99": pct(0.99), "samples": len(latencies)},
+        "stages": stages,
+        "models": get_registry().stats(),
+        "embedding_cache": get_embedding_cache().stats(),
+        "embedding_dispatch": dispatcher_stats(),
+        "parse_cache": parse_cache.stats() if parse_cache else None,
+        "youtube_cache": youtube_cache.stats() if youtube_cache else None,
+        "resource_catalog": catalog.stats() if catalog else None,
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+        "plan_fragments": fragment_store.stats() if fragment_store else None,
+    }
@@ -0,0 +1,79 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+import backend.candidate_index as candidate_index
+from backend.candidate_index import CandidateIndex
+
+DIM = 8
+
+
+def _fake_encode(model, texts, model_name=None):
+    rows = []
+    for text in texts:
+        seed = int(hashlib.sha1(text.encode("utf-8")).hexdigest()[:8], 16)
+        rows.append(np.random.default_rng(seed).standard_normal(DIM))
+    emb = np.asarray(rows, dtype=np.float32)
+    return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(monkeypatch):
+    monkeypatch.setattr(candidate_index, "get_embeddings_model", lambda name=None: object())
+    monkeypatch.setattr(candidate_index, "encode_normalized", _fake_encode)
+
+
+def _build(tmp_path):
+    index = CandidateIndex(index_dir=str(tmp_path))
+    index.add_resumes([
+        ("a", ["Python", "SQL"], {"name": "A"}),
+        ("b", ["Python", "Docker"], None),
+    ])
+    index.add_resumes([("c", ["Java", "SQL"], None)])
+    return index
+
+
+def test_reload_keeps_records_and_vectors(tmp_path):
+    index = _build(tmp_path)
+    reloaded = CandidateIndex(index_dir=str(tmp_path))
+    assert len(reloaded) == 3
+    assert reloaded._vectors is not None
+    assert np.allclose(np.asarray(reloaded._vectors), np.asarray(index._vectors))
+    assert reloaded.search(["Python", "SQL"], top_k=3) == index.search(["Python", "SQL"], top_k=3)
+
+
+def test_torn_vector_write_is_trimmed_on_load(tmp_path):
+    _build(tmp_path)
+    vectors = tmp_path / "embeddings.f32"
+    # crash mid-append: one whole surplus row and half of another
+    with open(vectors, "ab") as fh:
+        fh.write(np.ones(DIM + DIM // 2, dtype=np.float32).tobytes())
+
+    reloaded = CandidateIndex(index_dir=str(tmp_path))
+    assert len(reloaded) == 3
+    assert reloaded._vectors is not None
+    assert vectors.stat().st_size == 3 * DIM * 4
+
+
+def test_torn_record_write_is_trimmed_on_load(tmp_path):
+    _build(tmp_path)
+    records = tmp_path / "resumes.jsonl"
+    vectors = tmp_path / "embeddings.f32"
+    # records ahead of vectors (older write order) and a half-written final line
+    with open(records, "a", encoding="utf-8") as fh:
+        fh.write('{"id": "d", "skills": ["Go"], "metadata": {}}\n{"id": "e", "ski')
+
+    reloaded = CandidateIndex(index_dir=str(tmp_path))
+    assert len(reloaded) == 3
+    assert reloaded._vectors is not None
+    assert records.read_bytes().endswith(b"\n")
+    assert len(records.read_text(encoding="utf-8").splitlines()) == 3
+    assert vectors.stat().st_size == 3 * DIM * 4
+
+    # the index keeps growing in step after the repair
+    reloaded.add_resume("d", ["Go"])
+    again = CandidateIndex(index_dir=str(tmp_path))
+    assert len(again) == 4
+    assert again._vectors is not None
+    assert [r["resume_id"] for r in again.search(["Go"])] == ["d"]
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+import backend.resume_pipeline as resume_pipeline
+from backend.parse_cache import ParseCache
+from backend.resume_pipeline import ResumePipeline
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ParseCache(version="test", persist=False, max_memory_items=16)
+    monkeypatch.setattr(resume_pipeline, "get_parse_cache", lambda: cache)
+    return cache
+
+
+def _resume_docx() -> bytes:
+    docx = pytest.importorskip("docx")
+    doc = docx.Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("Skills")
+    doc.add_paragraph("Python, SQL, Docker and machine learning with scikit-learn")
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def test_entries_are_keyed_by_extraction_mode(cache):
+    data = _resume_docx()
+    spacy_pipeline = ResumePipeline(extraction_mode="spacy")
+    dictionary_pipeline = ResumePipeline(extraction_mode="dictionary")
+
+    first = spacy_pipeline.process_bytes(data, file_name="resume.docx")
+    other = dictionary_pipeline.process_bytes(data, file_name="resume.docx")
+    assert first["error"] is None
+    assert not first["cached"]
+    assert not other["cached"]  # a spaCy entry is never served to the dictionary pipeline
+
+    digest = first["sha256"]
+    assert cache._key(digest, "spacy") != cache._key(digest, "dictionary")
+    assert cache.get(digest, "spacy")["extracted"] == first["extracted"]
+    assert cache.get(digest, "dictionary")["extracted"] == other["extracted"]
+
+    assert spacy_pipeline.process_bytes(data, file_name="resume.docx")["cached"]
+    assert dictionary_pipeline.process_bytes(data, file_name="resume.docx")["cached"]
+
+
+def test_failed_parses_are_not_cached(cache):
+    result = ResumePipeline(extraction_mode="dictionary").process_bytes(b"%PDF-1.4\n%%EOF\n", file_name="empty.pdf")
+    assert result["error"]
+    assert cache.get(result["sha256"], "dictionary") is None
@@ -0,0 +1,92 @@
+import json
+import re
+
+import pytest
+
+import backend.plan_fragments as plan_fragments
+from backend.llm_cache import provider_model
+from backend.llm_handler import LLMHandler
+from backend.plan_fragments import FragmentStore, fragment_key
+from config.settings import LLM_CONFIG
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    store = FragmentStore(cache_dir=str(tmp_path), persist=False)
+    monkeypatch.setattr(plan_fragments, "_store", store)
+    monkeypatch.setitem(plan_fragments.LLM_CACHE_CONFIG, "enabled", True)
+    return store
+
+
+def _handler(fail=False):
+    handler = LLMHandler(provider="none")
+    handler.available, handler.provider = True, "openai"
+    handler.prompts = []
+
+    def call(prompt):
+        handler.prompts.append(prompt)
+        if fail:
+            raise RuntimeError("provider down")
+        n_weeks = int(re.search(r"Create a (\d+)-week", prompt).group(1))
+        skill = re.search(r"for the skill: (.+)\.\n", prompt).group(1)
+        weeks = [{"topics": [f"{skill} part {i + 1}"], "resources": [], "practice_project": "p", "milestone": "m"}
+                 for i in range(n_weeks)]
+        return json.dumps({"weeks": weeks, "prerequisites": []})
+
+    handler._call_provider = call
+    return handler
+
+
+def _plan(handler, skills):
+    return handler._compose_plan(skills, "Developer", "beginner", 5)
+
+
+@pytest.mark.parametrize("skills", [["python"], ["python", "docker"]])
+def test_few_skills_fill_the_whole_plan(store, skills):
+    plan = _plan(_handler(), skills)
+    assert len(plan["weeks"]) == LLM_CONFIG["plan_weeks"]
+    assert [w["week"] for w in plan["weeks"]] == list(range(1, LLM_CONFIG["plan_weeks"] + 1))
+    assert {w["focus_skill"] for w in plan["weeks"]} == set(skills)
+    # every week comes from the generated blocks, not from fallback padding
+    assert all("part" in w["topics"][0] for w in plan["weeks"])
+
+
+def test_short_stored_fragment_is_regenerated_longer(store):
+    handler = _handler()
+    _plan(handler, ["python", "docker", "sql", "git"])  # 3-week blocks get stored
+    assert len(handler.prompts) == 4
+
+    plan = _plan(handler, ["python"])
+    assert len(handler.prompts) == 5
+    assert len(plan["weeks"]) == LLM_CONFIG["plan_weeks"]
+    key = fragment_key("openai", provider_model("openai"), "python", "beginner")
+    assert len(store.get(key)["weeks"]) == LLM_CONFIG["plan_weeks"]
+
+
+def test_short_stored_fragment_is_padded_when_regeneration_fails(store):
+    _plan(_handler(), ["python", "docker", "sql", "git"])
+    plan = _plan(_handler(fail=True), ["python"])
+    assert len(plan["weeks"]) == LLM_CONFIG["plan_weeks"]
+    assert [w["topics"][0] for w in plan["weeks"][:3]] == [f"python part {i}" for i in (1, 2, 3)]
+
+
+def test_stream_reports_whole_plan_after_every_fragment_failed(store, monkeypatch):
+    monkeypatch.setitem(LLM_CONFIG, "plan_mode", "fragments")
+    handler = _handler()
+    whole = {"weeks": [{"topics": ["whole plan"], "resources": [], "practice_project": "p", "milestone": "m"}]}
+
+    def call(prompt):
+        handler.prompts.append(prompt)
+        if "learning block" in prompt:
+            raise RuntimeError("fragment failed")
+        return json.dumps(whole)
+
+    handler._call_provider = call
+    monkeypatch.setattr(handler, "_plan_cache", lambda *args: (None, None))
+    monkeypatch.setattr(handler, "_enrich_plan", lambda plan, level, hours: None)
+    monkeypatch.setattr(handler, "_fill_resources", lambda weeks, level: None)
+
+    events = list(handler.stream_learning_plan(["python"], "Developer", "beginner"))
+    assert events[-1]["source"] == "whole"
+    assert events[-1]["plan"]["weeks"][0]["topics"] == ["whole plan"]
+    assert [e["week"]["topics"] for e in events[:-1]] == [["whole plan"]]
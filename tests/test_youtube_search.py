@@ -0,0 +1,51 @@
+import pytest
+
+import loki
+from backend import youtube_search
+from backend.youtube_cache import YouTubeSearchCache
+
+
+class _Response:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"items": [{"id": {"videoId": "abc"}, "snippet": {"title": "T", "channelTitle": "C"}}]}
+
+
+class _Session:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        return _Response()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(youtube_search, "_get_session", lambda: session)
+    monkeypatch.setattr(youtube_search, "YOUTUBE_KEY", "key")
+    monkeypatch.setattr(loki, "YOUTUBE_KEY", "key")
+    cache = YouTubeSearchCache(persist=False)
+    monkeypatch.setattr(youtube_search, "get_youtube_cache", lambda: cache)
+    return session
+
+
+def test_backend_searches_filter_medium_length(session):
+    youtube_search.fetch_videos("python tutorial")
+    assert session.calls[-1]["videoDuration"] == "medium"
+
+
+def test_loki_searches_without_duration_filter(session):
+    videos = loki.search_youtube("python tutorial")
+    assert videos == [{"title": "T", "channel": "C", "url": "https://www.youtube.com/watch?v=abc"}]
+    assert "videoDuration" not in session.calls[-1]
+
+
+def test_duration_is_part_of_the_cache_key(session):
+    youtube_search.fetch_videos("python tutorial")
+    loki.search_youtube("python tutorial")
+    youtube_search.fetch_videos("python tutorial")
+    assert len(session.calls) == 2